@@ -11,6 +11,15 @@ import logging
 from typing import List, Callable, Dict, Optional, Any
 import functools
 
+try: # orjson parses WS frames (str or bytes) several times faster than stdlib json; optional
+    import orjson
+    _ws_json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _ws_json_loads = json.loads
+# websockets>=14 (new asyncio client) can hand back raw frame bytes; orjson parses them without a UTF-8 decode to str
+_WS_RECV_KWARGS = {'decode': False} if orjson is not None and int(getattr(websockets, '__version__', '0').split('.')[0]) >= 14 else {}
+
 
 class BinanceAPI:
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, testnet: bool = False):
@@ -245,7 +254,7 @@ class BinanceAPI:
         self.logger.info("Listen key refresher loop stopped.")
 
 
-    def start_user_stream(self, callback: Callable) -> bool:
+    def start_user_stream(self, callback: Callable, on_open: Optional[Callable[[], None]] = None) -> bool:
         if self.user_data_control_flag.get('keep_running'): self.logger.warning("User stream already running."); return False
 
         try: loop = asyncio.get_running_loop()
@@ -264,10 +273,13 @@ class BinanceAPI:
                     async with websockets.connect(ws_url, ping_interval=60, ping_timeout=30) as ws:
                         self.user_data_ws_client = ws
                         self.logger.info("User WS connected.")
+                        if on_open: # Notify listeners (called from this WS thread) that the stream is live
+                            try: on_open()
+                            except Exception as e_open: self.logger.error(f"Error in User WS on_open callback: {e_open}", exc_info=True)
                         while self.user_data_control_flag.get('keep_running'):
                             try:
-                                message = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                                data = json.loads(message); callback(data)
+                                message = await asyncio.wait_for(ws.recv(**_WS_RECV_KWARGS), timeout=1.0)
+                                data = _ws_json_loads(message); callback(data)
                             except asyncio.TimeoutError: continue
                             except websockets.exceptions.ConnectionClosed: self.logger.warning("User WS ConnectionClosed."); break
                             except Exception as e_recv: self.logger.error(f"Error in User WS recv: {e_recv}", exc_info=True); await asyncio.sleep(1)
@@ -315,8 +327,8 @@ class BinanceAPI:
                         self.logger.info(f"Market WebSocket connected for stream ID {stream_id}.")
                         while control['keep_running']:
                             try:
-                                message = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                                data = json.loads(message); callback(data)
+                                message = await asyncio.wait_for(ws.recv(**_WS_RECV_KWARGS), timeout=1.0)
+                                data = _ws_json_loads(message); callback(data)
                             except asyncio.TimeoutError: continue
                             except websockets.exceptions.ConnectionClosed: self.logger.warning(f"Market WS ConnectionClosed for ID {stream_id}."); break
                             except Exception as e_inner: self.logger.error(f"Error in Market WS handler ({stream_id}) inner loop: {e_inner}", exc_info=True); await asyncio.sleep(1)
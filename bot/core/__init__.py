@@ -1,6 +1,7 @@
 # Makes 'core' a package
 from .config_loader import load_api_keys, load_log_level
 from .logger_setup import setup_logger
+from .event_loop import install_fast_event_loop_policy
 from .data_fetcher import MarketDataProvider
 from .order_executor import OrderManager
 from .backtester import BacktestEngine
@@ -260,13 +260,13 @@ class BacktestEngine:
         if not self.historical_data.empty: # Initial equity point already added
              pass # self.equity_curve[0] is initial point
 
-        for kline_row_tuple in self.historical_data.itertuples():
-            self._current_kline_idx = self.historical_data.index.get_loc(kline_row_tuple.Index) # Store current index
+        open_times_ms = (self.historical_data.index.asi8 // 1_000_000).tolist() # UTC ns buffer of the DatetimeIndex, no per-row Timestamp math
+        kline_interval_ms = self._KLINE_INTERVAL_MILLISECONDS.get(self.timeframe, 0)
+        for self._current_kline_idx, kline_row_tuple in enumerate(self.historical_data.itertuples()): # Positional index == get_loc on the unique index
             current_kline_timestamp = kline_row_tuple.Index
 
             kline_dict = kline_row_tuple._asdict()
-            kline_open_time_ms = int(current_kline_timestamp.timestamp() * 1000)
-            kline_interval_ms = self._KLINE_INTERVAL_MILLISECONDS.get(self.timeframe, 0)
+            kline_open_time_ms = open_times_ms[self._current_kline_idx]
             kline_close_time_ms = kline_open_time_ms + kline_interval_ms - 1
 
             kline_data_for_strategy_k_field = {
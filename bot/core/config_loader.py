@@ -1,9 +1,14 @@
 import os
 import logging
 import json
-from dotenv import load_dotenv, set_key, find_dotenv
+from dotenv import load_dotenv, set_key, find_dotenv, dotenv_values
 from typing import Tuple, Optional, Dict, Any
 
+try:
+    import orjson # Optional: C-implemented JSON (de)serializer, much faster on nested config dicts
+except ImportError:
+    orjson = None # type: ignore
+
 class ConfigManager:
     def __init__(self,
                  config_file_path: str = 'bot_config.json',
@@ -30,22 +35,42 @@ class ConfigManager:
                 # Proceeding without a writable .env file might cause issues for saving API keys.
 
         self.config_file_path = config_file_path
+        self._env_cache: Dict[str, str] = {} # Parsed .env values, served from memory until the file changes
+        self._env_mtime: Optional[Tuple[int, int]] = None # (st_mtime_ns, st_size) of .env at last parse
+        self._app_config_cache: Optional[Dict[str, Any]] = None # Last app config loaded from / saved to JSON
         self.logger.info(f"ConfigManager initialized. JSON config: '{self.config_file_path}', ENV config: '{self.env_file_path}'")
         self._load_env() # Initial load of .env variables
 
-    def _load_env(self):
-        """Loads environment variables from the .env file."""
-        # load_dotenv will not override existing system environment variables by default.
-        # If override is needed (e.g. .env should always take precedence), set override=True.
+    def _load_env(self, force: bool = False):
+        """Loads environment variables from the .env file. Reparses only if the file changed since the last load."""
+        # .env values take precedence over existing system environment variables (same as load_dotenv(override=True)).
         if self.env_file_path and os.path.exists(self.env_file_path):
-            load_dotenv(dotenv_path=self.env_file_path, override=True)
+            try:
+                st = os.stat(self.env_file_path)
+                file_sig = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                file_sig = None
+            if not force and file_sig is not None and file_sig == self._env_mtime:
+                return # Cache still valid, values already in os.environ
+            self._env_cache = {k: v for k, v in dotenv_values(self.env_file_path).items() if v is not None}
+            os.environ.update(self._env_cache)
+            self._env_mtime = file_sig
             self.logger.debug(f"Environment variables loaded from: {self.env_file_path}")
         else:
             self.logger.debug(f".env file not found at {self.env_file_path}. Using system environment variables or defaults.")
 
 
     def load_api_keys(self, use_testnet: bool = False) -> Tuple[Optional[str], Optional[str]]:
-        self._load_env() # Ensure latest .env values are loaded
+        self._load_env() # Ensure latest .env values are loaded (no-op if .env unchanged)
+        return self._resolve_api_keys(use_testnet)
+
+    def load_api_keys_all(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Returns {'testnet': (key, secret), 'mainnet': (key, secret)} with a single .env freshness check."""
+        self._load_env()
+        return {'testnet': self._resolve_api_keys(use_testnet=True),
+                'mainnet': self._resolve_api_keys(use_testnet=False)}
+
+    def _resolve_api_keys(self, use_testnet: bool) -> Tuple[Optional[str], Optional[str]]:
         key_name_prefix = "BINANCE_TESTNET" if use_testnet else "BINANCE_MAINNET"
         api_key = os.getenv(f"{key_name_prefix}_API_KEY")
         api_secret = os.getenv(f"{key_name_prefix}_API_SECRET")
@@ -68,7 +93,14 @@ class ConfigManager:
             success = set_key(self.env_file_path, key_name, key_value, quote_mode="always")
             if success:
                 self.logger.info(f"Saved {key_name} to {self.env_file_path}")
-                self._load_env() # Reload env vars after change
+                # Update the cache in place instead of reparsing the whole file
+                self._env_cache[key_name] = key_value
+                os.environ[key_name] = key_value
+                try:
+                    st = os.stat(self.env_file_path)
+                    self._env_mtime = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    self._env_mtime = None
             else:
                 self.logger.error(f"Failed to save {key_name} to {self.env_file_path} using set_key.")
             return success
@@ -81,24 +113,42 @@ class ConfigManager:
         level_str = os.getenv('LOG_LEVEL', 'INFO').upper()
         return getattr(logging, level_str, logging.INFO)
 
-    def save_app_config(self, config_data: Dict[str, Any]):
+    def save_app_config(self, config_data: Dict[str, Any]) -> bool:
+        """Writes the app config atomically (temp file + os.replace). Returns False if nothing was written."""
+        tmp_path = self.config_file_path + '.tmp'
         try:
-            with open(self.config_file_path, 'w') as f:
-                json.dump(config_data, f, indent=4)
+            # Serialize before opening the file: an encode error must not leave a truncated config behind
+            if orjson is not None: # OPT_NON_STR_KEYS: stringify int/float keys like json.dump does; NumPy scalars/arrays may end up in strategy params
+                payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(config_data, indent=2, sort_keys=True).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.config_file_path) # Readers see either the old or the new file, never a partial one
+            self._app_config_cache = config_data
             self.logger.info(f"Application config saved to {self.config_file_path}")
-        except IOError as e:
+            return True
+        except (OSError, TypeError, ValueError) as e: # TypeError: unserializable value (orjson.JSONEncodeError subclasses it)
             self.logger.error(f"Error saving app config to {self.config_file_path}: {e}", exc_info=True)
+            try: os.remove(tmp_path)
+            except OSError: pass
+            return False
 
-    def load_app_config(self) -> Optional[Dict[str, Any]]:
+    def load_app_config(self, use_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """Loads the JSON app config. With use_cache=True, returns the last loaded/saved config without touching disk."""
+        if use_cache and self._app_config_cache is not None:
+            return self._app_config_cache
         if not os.path.exists(self.config_file_path):
             self.logger.info(f"App config file {self.config_file_path} not found. Returning None.")
             return None # Or return a default config structure: {'general_settings': {}, 'strategies': {}}
         try:
-            with open(self.config_file_path, 'r') as f:
-                config_data = json.load(f)
+            with open(self.config_file_path, 'rb') as f:
+                raw_bytes = f.read()
+                config_data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
+                self._app_config_cache = config_data
                 self.logger.info(f"Application config loaded from {self.config_file_path}")
                 return config_data
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, json.JSONDecodeError) as e: # orjson.JSONDecodeError subclasses json.JSONDecodeError
             self.logger.error(f"Error loading app config from {self.config_file_path}: {e}", exc_info=True)
             return None
 
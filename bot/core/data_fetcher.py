@@ -1,9 +1,12 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta, timezone
 import time
 from typing import List, Dict, Optional, Callable, Tuple, Any
 from collections import defaultdict
 import logging
+import sys
+import asyncio
 
 try:
     from bot.connectors.binance_connector import BinanceAPI
@@ -34,6 +37,10 @@ class MarketDataProvider:
 
         # List to hold all registered general user data callbacks
         self.user_data_callbacks: List[Callable] = []
+        # Invoked (from the user stream thread) each time the user data WebSocket (re)connects
+        self.on_user_stream_open: Optional[Callable[[], None]] = None
+        # Loop that coroutine callbacks (async def handlers) are scheduled on; WS threads cannot await them
+        self.async_callback_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
     def _parse_date_to_milliseconds(self, date_str: Optional[str]) -> Optional[int]:
@@ -127,10 +134,33 @@ class MarketDataProvider:
         return df.head(limit)
 
 
+    async def get_historical_klines_arrays(self, symbol: str, interval: str, limit: int = 500) -> Optional[Dict[str, np.ndarray]]:
+        """Latest `limit` klines as float64 column arrays (ts in epoch seconds, open/high/low/close/volume). Chart path; skips pandas."""
+        if interval not in self._KLINE_INTERVAL_MILLISECONDS:
+            self.logger.error(f"Unsupported kline interval: {interval}")
+            raise ValueError(f"Unsupported kline interval: {interval}")
+        batch_limit = min(limit, self._MAX_KLINE_LIMIT_PER_REQUEST)
+        rows = await self.binance_connector.get_klines(symbol=symbol, interval=interval, limit=batch_limit)
+        if not rows: return None
+
+        values = np.asarray([row[:6] for row in rows], dtype=np.float64) # One C-level parse of the numeric strings
+        columns = {name: np.ascontiguousarray(values[:, i]) for i, name in enumerate(('ts', 'open', 'high', 'low', 'close', 'volume'))}
+        columns['ts'] /= 1000.0 # ms -> epoch seconds, the unit pyqtgraph's DateAxisItem expects
+        return columns
+
+    def _run_callback(self, callback: Callable, data: Any):
+        """Calls a stream callback from the WS thread; coroutine results are handed to async_callback_loop."""
+        result = callback(data)
+        if asyncio.iscoroutine(result):
+            if self.async_callback_loop and not self.async_callback_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(result, self.async_callback_loop)
+            else:
+                result.close(); self.logger.warning(f"Dropped async callback {getattr(callback, '__name__', callback)}: no async_callback_loop set.")
+
     def dispatch_data_update(self, event_type: str, data: Any):
         self.logger.debug(f"Dispatching data for event: {event_type}, {len(self.stream_callbacks.get(event_type, []))} callbacks registered.")
         for callback in self.stream_callbacks.get(event_type, []):
-            try: callback(data)
+            try: self._run_callback(callback, data)
             except Exception as e: self.logger.error(f"Error in market data callback for event {event_type}: {e}", exc_info=True)
 
     def _handle_market_message(self, stream_name: str, data: dict):
@@ -138,6 +168,7 @@ class MarketDataProvider:
 
         parsed_data = data.get('data', data)
         actual_stream_name = data.get('stream', stream_name)
+        if 's' in parsed_data: parsed_data['s'] = sys.intern(parsed_data['s']) # Symbols hash/compare by identity downstream
 
         parts = actual_stream_name.split('@')
         symbol_lower = parts[0].lower()
@@ -171,7 +202,9 @@ class MarketDataProvider:
         self.dispatch_data_update(f"{symbol}_trade", trade_event_data)
 
     def _process_mark_price_data(self, symbol: str, mark_price_event_data: dict):
-        self.logger.info(f"MARK_PRICE [{symbol}]: {mark_price_event_data.get('p')}")
+        try: mark_price_event_data['p'] = float(mark_price_event_data['p']) # Parsed once here for every subscriber of this tick
+        except (KeyError, ValueError, TypeError): self.logger.warning(f"Malformed mark price data for {symbol}: {mark_price_event_data}"); return
+        self.logger.info(f"MARK_PRICE [{symbol}]: {mark_price_event_data['p']}")
         self.dispatch_data_update(f"{symbol}_mark_price", mark_price_event_data)
 
     def _create_stream_handler_wrapper(self, stream_name_key: str) -> Callable:
@@ -185,7 +218,7 @@ class MarketDataProvider:
 
         stream_id = self.binance_connector.start_market_stream([stream_name], callback=self._create_stream_handler_wrapper(stream_name))
         if stream_id:
-            self.active_streams[stream_id] = {'name': stream_name, 'type': event_type_suffix}
+            self.active_streams[stream_id] = {'name': stream_name, 'type': event_type_suffix, 'event_types': [event_type]}
             if callback: self.stream_callbacks[event_type].append(callback)
             self.logger.info(f"Subscribed to {event_type_suffix} stream: {stream_name} (ID: {stream_id}). Callback {'set' if callback else 'not set'}.")
             return stream_id
@@ -204,47 +237,104 @@ class MarketDataProvider:
     def subscribe_to_mark_price_stream(self, symbol: str, callback: Optional[Callable] = None, update_speed: str = "1s") -> Optional[str]:
         return self._subscribe_generic_market_stream(symbol, f"markPrice@{update_speed}", "mark_price", callback)
 
+    def subscribe_to_mark_prices_bulk(self, symbols: List[str], callback: Optional[Callable] = None, update_speed: str = "1s") -> Optional[str]:
+        """
+        Subscribes to mark price updates for several symbols over ONE combined-stream WebSocket
+        (/stream?streams=a@markPrice@1s/b@markPrice@1s/...). _handle_market_message demultiplexes
+        each message by its 'stream' field and dispatches to the per-symbol '<symbol>_mark_price' callbacks.
+        """
+        symbols_lower = list(dict.fromkeys(s.lower() for s in symbols if s)) # De-duplicate, keep order
+        if not symbols_lower:
+            return None
+        stream_names = [f"{sym}@markPrice@{update_speed}" for sym in symbols_lower]
+        combined_key = '/'.join(stream_names)
+
+        stream_id = self.binance_connector.start_market_stream(stream_names, callback=self._create_stream_handler_wrapper(combined_key))
+        if stream_id:
+            self.active_streams[stream_id] = {'name': combined_key, 'type': 'mark_price', 'symbols': symbols_lower,
+                                              'event_types': [f"{sym}_mark_price" for sym in symbols_lower]}
+            if callback:
+                for sym in symbols_lower: self.stream_callbacks[f"{sym}_mark_price"].append(callback)
+            self.logger.info(f"Subscribed to combined mark_price stream for {len(symbols_lower)} symbols (ID: {stream_id}). Callback {'set' if callback else 'not set'}.")
+            return stream_id
+        self.logger.error(f"Failed to subscribe to combined mark_price stream for {symbols_lower}")
+        return None
+
     def _handle_user_data_message(self, data: dict):
         """
         Internal callback for BinanceConnector's user data stream.
         This method dispatches the raw user data message to all registered generic user data callbacks.
         """
         event_type = data.get('e')
+        self._intern_user_data_symbols(data)
         self.logger.debug(f"User Data Received by MDP - Event: {event_type}, Data: {str(data)[:300]}")
 
         for cb in self.user_data_callbacks:
             try:
-                cb(data) # Pass the raw data dictionary
+                self._run_callback(cb, data) # Pass the raw data dictionary
             except Exception as e:
                 self.logger.error(f"Error in a generic user data callback for event {event_type}: {e}", exc_info=True)
 
-    def subscribe_to_user_data(self, user_data_event_callback: Callable) -> bool:
+    @staticmethod
+    def _intern_user_data_symbols(data: dict):
+        """Interns symbol strings in order/account updates so downstream dict/set lookups hit the identity fast path."""
+        order_data = data.get('o')
+        if isinstance(order_data, dict) and 's' in order_data: order_data['s'] = sys.intern(order_data['s'])
+        account_data = data.get('a')
+        if isinstance(account_data, dict):
+            for pos in account_data.get('P', ()):
+                if 's' in pos: pos['s'] = sys.intern(pos['s'])
+
+    def _handle_user_stream_open(self):
+        """Internal on-open callback for BinanceConnector's user data stream."""
+        self.logger.debug("User data stream connected.")
+        if self.on_user_stream_open:
+            self.on_user_stream_open()
+
+    def subscribe_to_user_data(self, user_data_event_callback: Callable, *more_callbacks: Callable) -> bool:
         """
-        Subscribes to the user data stream and registers a callback for all user data events.
-        Multiple callbacks can be registered by calling this method multiple times.
+        Registers one or more callbacks for all user data events and starts the user data stream once if needed.
+        The single stream multicasts each event to every registered callback.
         Args:
             user_data_event_callback: The function to call with each raw user data event.
+            *more_callbacks: Further callbacks registered in the same call (no extra stream start attempts).
         """
-        if user_data_event_callback and user_data_event_callback not in self.user_data_callbacks:
-            self.user_data_callbacks.append(user_data_event_callback)
-            self.logger.info(f"Registered user data callback: {user_data_event_callback.__name__}")
+        newly_registered = []
+        for cb in (user_data_event_callback, *more_callbacks):
+            if cb and cb not in self.user_data_callbacks:
+                self.user_data_callbacks.append(cb); newly_registered.append(cb)
+                self.logger.info(f"Registered user data callback: {cb.__name__}")
 
         if not self.binance_connector.user_data_control_flag.get('keep_running', False):
             self.logger.info("User data stream not running. Attempting to start via BinanceConnector.")
             # The _handle_user_data_message method of this class will be passed to the connector
-            success = self.binance_connector.start_user_stream(self._handle_user_data_message)
+            success = self.binance_connector.start_user_stream(self._handle_user_data_message, on_open=self._handle_user_stream_open)
             if success:
                 self.logger.info("Successfully started user data stream via BinanceConnector.")
             else:
                 self.logger.error("Failed to start user data stream via BinanceConnector.")
-                if user_data_event_callback in self.user_data_callbacks: # Clean up if start failed
-                    self.user_data_callbacks.remove(user_data_event_callback)
+                for cb in newly_registered: self.user_data_callbacks.remove(cb) # Clean up if start failed
                 return False
             return success
         else:
-            self.logger.info("User data stream already running. New callback registered if provided.")
+            self.logger.info("User data stream already running. New callbacks registered if provided.")
             return True
 
+    def remove_stream_callback(self, event_type: str, callback: Callable):
+        """Detaches one callback from an event type (e.g. 'btcusdt_mark_price'); the stream itself keeps running."""
+        callbacks = self.stream_callbacks.get(event_type)
+        if callbacks and callback in callbacks: callbacks.remove(callback)
+
+    def unsubscribe_from_stream_by_id(self, stream_id: str) -> bool:
+        """Stops one market stream. Callers detach their own callbacks, since other streams may share the event types."""
+        stream_info = self.active_streams.pop(stream_id, None)
+        if not stream_info:
+            self.logger.warning(f"Unsubscribe requested for unknown stream ID {stream_id}.")
+            return False
+        self.binance_connector.stop_market_stream(stream_id)
+        self.logger.info(f"Unsubscribed from stream {stream_info['name']} (ID: {stream_id}).")
+        return True
+
     def unsubscribe_all_streams(self):
         self.logger.info("Unsubscribing all market data streams...")
         for stream_id in list(self.active_streams.keys()):
@@ -0,0 +1,15 @@
+import asyncio
+import sys
+
+def install_fast_event_loop_policy() -> bool:
+    """
+    Installs winloop (Windows) or uvloop (elsewhere) as the asyncio event loop policy for the WS/REST-heavy scripts.
+    Call before asyncio.run(). Returns False and keeps the stdlib loop if the package isn't installed.
+    """
+    try:
+        if sys.platform == 'win32': import winloop as _fast_loop
+        else: import uvloop as _fast_loop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(_fast_loop.EventLoopPolicy())
+    return True
@@ -1,6 +1,7 @@
 import logging
 import time
 import uuid
+import sys
 from typing import Dict, Optional, Callable, Any, List # Added List
 import asyncio
 
@@ -30,6 +31,7 @@ class OrderManager:
         self.open_positions_pnl_cache: Dict[str, Dict[str, Any]] = {} # Not actively used if fetching fresh, but can be for future opt.
         self.last_mark_prices: Dict[str, float] = {} # symbol: mark_price
         self.pnl_update_callback: Optional[Callable[[], asyncio.Task]] = None
+        self.positions_by_symbol: Dict[str, Dict[str, Any]] = {} # Raw non-zero positions keyed by symbol, refreshed by get_position_data_for_ui
 
 
     async def get_available_trading_balance(self, asset: str = 'USDT') -> Optional[float]:
@@ -53,6 +55,26 @@ class OrderManager:
             self.logger.error(f"Error fetching account balance (async): {e}", exc_info=True)
         return None
 
+    async def get_account_balance_map(self) -> Dict[str, float]:
+        """Returns wallet balances keyed by asset, e.g. {'USDT': 1000.0}, for O(1) lookups by callers."""
+        self.logger.debug("Fetching account balance map (async).")
+        balance_map: Dict[str, float] = {}
+        try:
+            balances = await self.binance_connector.get_account_balance()
+            if not balances:
+                self.logger.warning("Failed to fetch account balance (async).")
+                return balance_map
+            for balance_asset_info in balances:
+                asset = balance_asset_info.get('asset')
+                if not asset: continue
+                try:
+                    balance_map[asset] = float(balance_asset_info.get('balance', 0.0))
+                except (ValueError, TypeError):
+                    self.logger.error(f"Could not parse balance for {asset} from: {balance_asset_info.get('balance')}")
+        except Exception as e:
+            self.logger.error(f"Error fetching account balance map (async): {e}", exc_info=True)
+        return balance_map
+
     def _generate_client_order_id(self, strategy_id: str = "default") -> str:
         prefix = strategy_id.replace("_", "")[:10]
         timestamp_ms = int(time.time() * 1000)
@@ -239,16 +261,20 @@ class OrderManager:
             if positions is None: return []
 
             formatted_positions = []
+            positions_by_symbol: Dict[str, Dict[str, Any]] = {}
             for pos in positions:
                 # Filter out positions with zero amount if desired
                 if float(pos.get('positionAmt', 0)) != 0:
+                    symbol = sys.intern(pos.get('symbol', '')) # Interned: shared with the WS-side symbol strings
+                    positions_by_symbol.setdefault(symbol, pos) # First non-zero position per symbol
                     formatted_positions.append({
-                        "Symbol": pos.get('symbol'), "Side": pos.get('positionSide'), "Quantity": pos.get('positionAmt'),
+                        "Symbol": symbol, "Side": pos.get('positionSide'), "Quantity": pos.get('positionAmt'),
                         "Entry Price": pos.get('entryPrice'), "Mark Price": pos.get('markPrice'),
                         "Unrealized P&L": pos.get('unRealizedProfit'),
                         "Liq. Price": pos.get('liquidationPrice', 'N/A'),
                         "Margin": pos.get('isolatedMargin', pos.get('initialMargin', 'N/A')) # Check for isolated vs cross
                     })
+            self.positions_by_symbol = positions_by_symbol
             return formatted_positions
         except Exception as e:
             self.logger.error(f"Error fetching position data for UI: {e}", exc_info=True)
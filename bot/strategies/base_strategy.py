@@ -26,6 +26,7 @@ class BaseStrategy(ABC):
         if 'strategy_type_name' not in params_to_store:
             params_to_store['strategy_type_name'] = self.__class__.strategy_type_name
         self.params = params_to_store
+        self.type_name: str = params_to_store['strategy_type_name'] # Resolved once; used when persisting the config
 
         self.order_manager = order_manager
         self.market_data_provider = market_data_provider
@@ -42,20 +42,23 @@ class StrategyEngine:
         self.live_trading_mode: bool = False
         self.async_loop: Optional[asyncio.AbstractEventLoop] = None
         self.trend_adapter_instance: Optional[TrendAdaptationStrategy] = None # For TrendAdaptationStrategy
+        self._available_strategy_types: Optional[Dict[str, Type[BaseStrategy]]] = None # Lazily built by get_available_strategy_types
         self.logger.info("StrategyEngine initialized.")
 
     def get_available_strategy_types(self) -> Dict[str, Type[BaseStrategy]]:
+        if self._available_strategy_types is not None: return self._available_strategy_types # Registry is static; build once
         # Ensure TrendAdaptationStrategy is imported for this method
         from .trend_adaptation_strategy import TrendAdaptationStrategy as TAS_Actual
         # This is a bit of a hack for potential circular deps or just to ensure it's the right type
         # For other strategies, they are already imported at the top.
-        return {
+        self._available_strategy_types = {
             "PivotPointStrategy": PivotPointStrategy,
             "AdvancedDCAStrategy": AdvancedDCAStrategy,
             "LiquidityPointsStrategy": LiquidityPointsStrategy,
             "TrendAdaptationStrategy": TAS_Actual, # Use actual class here
             "IndicatorHeuristicStrategy": IndicatorHeuristicStrategy
         }
+        return self._available_strategy_types
 
     def load_strategy(self,
                       strategy_class: Type[BaseStrategy],
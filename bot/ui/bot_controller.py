@@ -1,10 +1,11 @@
 import asyncio
 import logging
 from PySide6.QtCore import QObject, Slot
-from typing import Dict, Optional, Any, List, Type, Tuple
-import pandas as pd
+from typing import Dict, Optional, Any, List, Type, Tuple, Callable
+import numpy as np
 import os
 import time # For timestamping position updates for chart
+import threading
 
 try:
     from bot.ui.qt_signals import signals
@@ -28,6 +29,11 @@ except ImportError as e:
             return _emitter
     signals = MockSignals() # type: ignore
 
+# Project root and config file paths, resolved once at import
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+_ENV_PATH = os.path.join(_PROJECT_ROOT, '.env')
+_JSON_CONFIG_PATH = os.path.join(_PROJECT_ROOT, 'bot_config.json')
+
 
 class BotController(QObject):
     def __init__(self):
@@ -35,12 +41,7 @@ class BotController(QObject):
         self.logger = logging.getLogger('algo_trader_bot.BotController')
         self.signals = signals
 
-        # Determine project root and paths for config files
-        project_root_guess = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-        env_file_path = os.path.join(project_root_guess, '.env')
-        json_config_path = os.path.join(project_root_guess, 'bot_config.json')
-
-        self.config_manager = ConfigManager(config_file_path=json_config_path, env_file_path=env_file_path)
+        self.config_manager = ConfigManager(config_file_path=_JSON_CONFIG_PATH, env_file_path=_ENV_PATH)
 
         self.binance_connector: Optional[BinanceAPI] = None
         self.market_data_provider: Optional[MarketDataProvider] = None
@@ -50,18 +51,46 @@ class BotController(QObject):
 
         self.bot_status: str = "Uninitialized"
         self.is_running: bool = False
-        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None # Captured in async_setup; only for thread-safe handoffs from WS threads
         self.current_chart_kline_subscription_id: Optional[str] = None # For live chart updates
-        self.subscribed_mark_price_for_pnl = set() # Keep track of symbols subscribed for P&L mark price
+        self._chart_kline_event_type: str = "" # MDP event type the chart kline callback is registered under
+        self.current_chart_symbol_tf: Optional[Tuple[str, str]] = None # e.g. ('BTCUSDT', '1h'); set via set_chart_symbol_tf
+        self._chart_symbol: str = "BTCUSDT" # Symbol shown on the chart, cached for the position-update path
+        self._last_positions_hash: Optional[int] = None # Hash of the last positions_updated payload
+        self.subscribed_mark_price_for_pnl: Dict[str, str] = {} # Symbol -> MDP stream ID carrying its P&L mark price
+        self._user_stream_ready = asyncio.Event() # Set when the user data WebSocket reports it is connected
+        self.user_stream_ready_timeout_s: float = 5.0
+
+        # Coalescing of high-frequency UI emissions (one emit per window carrying the latest snapshot)
+        self.ui_emit_coalesce_interval_s: float = 0.05
+        self._pnl_flush_scheduled: bool = False
+        self._pending_chart_position: Optional[Dict[str, Any]] = None
+        self._chart_position_flush_scheduled: bool = False
+        self._pending_klines: Dict[Tuple[str, str], Dict[str, Any]] = {} # Unclosed ticks; written from WS threads, flushed on the loop
+        self._pending_closed_klines: Dict[Tuple[str, str], Dict[str, Any]] = {} # Closed klines are never overwritten by the next candle's ticks
+        self._pending_klines_lock = threading.Lock()
+        self._kline_flush_scheduled: bool = False
+        self._trade_marker_queue: asyncio.Queue = asyncio.Queue(maxsize=1000) # Fill markers for the chart, drop-oldest when full
+        self.trade_marker_batch_size: int = 32
+        self._trade_marker_task: Optional[asyncio.Task] = None
+        self.refresh_debounce_s: float = 0.2 # Window for coalescing user-data driven REST refreshes
+        self._pending_refreshes: Dict[str, Callable[[], Any]] = {} # Refresh kind -> coroutine fn, run together after the debounce window
+        self._refresh_all_task: Optional[asyncio.Task] = None
+
+        # Debounced persistent-config writes (UI edits coalesce; the write runs in the default executor)
+        self.save_debounce_s: float = 1.0
+        self._save_pending: bool = False
+        self._save_flush_handle: Optional[asyncio.TimerHandle] = None
 
         log_level_val = self.config_manager.load_log_level_from_env() # Initial log level from .env
         self.current_log_level_str: str = logging.getLevelName(log_level_val)
         self.logger.info(f"BotController instance created. .env path: {self.config_manager.env_file_path}, JSON config path: {self.config_manager.config_file_path}")
-        self.load_persistent_config() # Load general settings and strategies early
+        self.load_general_settings() # Strategies are loaded in async_setup once the StrategyEngine exists
 
     async def async_setup(self, use_testnet: bool = True): # API keys now loaded internally via ConfigManager
         self.logger.info(f"BotController: Starting async setup (Testnet: {use_testnet})...")
         self.signals.status_updated.emit("Initializing...")
+        self._event_loop = asyncio.get_running_loop()
         try:
             api_key, api_secret = self.config_manager.load_api_keys(use_testnet=use_testnet)
             if not api_key or not api_secret:
@@ -76,6 +105,9 @@ class BotController(QObject):
             self.signals.api_connection_updated.emit("API Connected")
 
             self.market_data_provider = MarketDataProvider(self.binance_connector)
+            self.market_data_provider.on_user_stream_open = self._on_user_stream_open
+            self.market_data_provider.async_callback_loop = self._event_loop # Async handlers below run on this loop
+            if not self._trade_marker_task: self._trade_marker_task = asyncio.create_task(self._drain_trade_markers())
             self.order_manager = OrderManager(self.binance_connector, self.market_data_provider, risk_manager=None)
             if self.order_manager: # Set P&L update callback
                 self.order_manager.pnl_update_callback = self.trigger_pnl_emission
@@ -89,16 +121,16 @@ class BotController(QObject):
             self.strategy_engine.live_trading_mode = True # Default to live for BotController
 
             self._connect_internal_signals()
-            # Reload strategies from config AFTER all components are initialized
-            self.load_persistent_config() # This will load and potentially log strategies
+            # Load strategies from config AFTER all components are initialized
+            self.load_strategies_from_config()
 
             self.logger.info("BotController: Core components initialized.")
             self.signals.status_updated.emit("Initialized / Idle")
             self.signals.log_message_appended.emit("Bot backend initialized successfully.")
 
-            if self.market_data_provider.subscribe_to_user_data(self.handle_user_data_from_mdp):
+            if self.market_data_provider.subscribe_to_user_data(*self._user_data_handlers()):
                  self.logger.info("User Data Stream subscription initiated by BotController setup.")
-                 await asyncio.sleep(2) # Give some time for user stream to potentially connect/stabilize
+                 await self._wait_for_user_stream_ready() # Proceed as soon as the user stream is connected
                  await self.update_dashboard_balance()
                  await self.request_positions_update(emit_for_chart=True) # Initial position update for chart and P&L
                  await self._subscribe_to_initial_mark_prices_for_pnl() # Subscribe to mark prices for P&L
@@ -110,11 +142,7 @@ class BotController(QObject):
             # If self.handle_btc_mark_price_update also handles P&L, this is fine.
             # Otherwise, ensure a separate call to subscribe to BTCUSDT for P&L if needed.
             if self.market_data_provider and "BTCUSDT" not in self.subscribed_mark_price_for_pnl:
-                 await self.market_data_provider.subscribe_to_mark_price_stream(
-                     "BTCUSDT",
-                     self.handle_mark_price_for_pnl_passthrough # Use generic handler for P&L
-                 )
-                 self.subscribed_mark_price_for_pnl.add("BTCUSDT") # Track it
+                 self._subscribe_mark_prices_for_pnl(["BTCUSDT"]) # Uses generic handler for P&L
                  self.logger.info("Ensured BTCUSDT mark price subscription for dashboard/P&L.")
 
         except Exception as e:
@@ -126,8 +154,36 @@ class BotController(QObject):
             self.signals.error_dialog_requested.emit("Bot Initialization Failed",
                                                      f"Could not complete backend setup. Please check API keys and connectivity. Details: {e}")
 
+    def _on_user_stream_open(self):
+        # Called from the user stream's WebSocket thread; hand off to the asyncio loop thread-safely.
+        if self._event_loop and not self._event_loop.is_closed():
+            self._event_loop.call_soon_threadsafe(self._user_stream_ready.set)
+
+    def _user_data_handlers(self) -> List[Any]:
+        """All user data consumers, multicast by MarketDataProvider's single user data stream."""
+        handlers = [self.handle_user_data_from_mdp]
+        if self.order_manager: handlers.append(self.order_manager.handle_order_update)
+        if self.strategy_engine: handlers.append(self.strategy_engine.handle_user_data_for_strategies)
+        return handlers
+
+    async def _wait_for_user_stream_ready(self) -> bool:
+        """Waits until the user data stream is connected, bounded by user_stream_ready_timeout_s."""
+        try:
+            await asyncio.wait_for(self._user_stream_ready.wait(), timeout=self.user_stream_ready_timeout_s)
+            return True
+        except asyncio.TimeoutError:
+            self.logger.warning(f"User data stream not confirmed connected after {self.user_stream_ready_timeout_s}s. Continuing.")
+            return False
+
     def load_persistent_config(self):
-        self.logger.info("BotController: Loading persistent configuration...")
+        """Loads general settings and, if the StrategyEngine exists, strategies from the JSON config."""
+        self.load_general_settings()
+        if self.strategy_engine:
+            self.load_strategies_from_config()
+
+    def load_general_settings(self):
+        """Reads only 'general_settings' from the JSON config. Safe to call before async_setup."""
+        self.logger.info("BotController: Loading general settings from persistent configuration...")
         app_config = self.config_manager.load_app_config()
         if app_config:
             general_settings = app_config.get('general_settings', {})
@@ -135,71 +191,125 @@ class BotController(QObject):
             # Note: Actual logger level update needs call to setup_logger or logger.setLevel
             self.logger.info(f"Loaded general settings. Log level from config: {self.current_log_level_str}")
             # Apply other general settings if any
-
-            if self.strategy_engine: # Ensure strategy engine is initialized
-                loaded_strategies_config = app_config.get('strategies', {})
-                if not loaded_strategies_config:
-                     self.logger.info("No strategies found in configuration file.")
-                else:
-                    self.logger.info(f"Found {len(loaded_strategies_config)} strategies in configuration.")
-
-                for strategy_id, config_item in loaded_strategies_config.items():
-                    strategy_type_name = config_item.get('type_name')
-                    params = config_item.get('params')
-                    strategy_class = self.strategy_engine.get_available_strategy_types().get(strategy_type_name) # type: ignore
-                    if strategy_class and params:
-                        self.logger.debug(f"Loading strategy {strategy_id} (type: {strategy_type_name}) from config with params: {params}")
-                        self.strategy_engine.load_strategy(strategy_class, strategy_id, params)
-                    else:
-                        self.logger.warning(f"Could not load strategy {strategy_id} from config: Type '{strategy_type_name}' not found or params missing.")
-            else:
-                self.logger.warning("StrategyEngine not available for loading persistent strategy configs.")
-            self.signals.log_message_appended.emit("Loaded configuration from file.")
         else:
             self.signals.log_message_appended.emit("No configuration file found or error loading. Using defaults.")
 
+    def load_strategies_from_config(self):
+        """Loads strategy instances from the JSON config. Requires the StrategyEngine (call after async_setup init)."""
+        if not self.strategy_engine:
+            self.logger.warning("StrategyEngine not available for loading persistent strategy configs.")
+            return
+        app_config = self.config_manager.load_app_config(use_cache=True) # Reuse the dict parsed by load_general_settings
+        if not app_config:
+            return
+
+        loaded_strategies_config = app_config.get('strategies', {})
+        if not loaded_strategies_config:
+             self.logger.info("No strategies found in configuration file.")
+        else:
+            self.logger.info(f"Found {len(loaded_strategies_config)} strategies in configuration.")
+
+        available_types = self.strategy_engine.get_available_strategy_types() # Resolve the type registry once per load
+        for strategy_id, config_item in loaded_strategies_config.items():
+            strategy_type_name = config_item.get('type_name')
+            params = config_item.get('params')
+            strategy_class = available_types.get(strategy_type_name) # type: ignore
+            if strategy_class and params:
+                self.logger.debug("Loading strategy %s (type: %s) from config with params: %s", strategy_id, strategy_type_name, params)
+                self.strategy_engine.load_strategy(strategy_class, strategy_id, params)
+            else:
+                self.logger.warning(f"Could not load strategy {strategy_id} from config: Type '{strategy_type_name}' not found or params missing.")
+        self.signals.log_message_appended.emit("Loaded configuration from file.")
+
+
+    def _build_app_config(self) -> Dict[str, Any]:
+        """Snapshots the current settings and strategies into the persisted JSON layout."""
+        general_settings = {'log_level': self.current_log_level_str} # Add other general settings here
+
+        strategies_config = { # params are copied so an executor write never sees a dict mutated mid-dump
+            strategy_id: {'type_name': strategy.type_name, 'params': dict(strategy.params)}
+            for strategy_id, strategy in self.strategy_engine.strategies.items()
+        }
+        return {'general_settings': general_settings, 'strategies': strategies_config}
 
     def save_persistent_config(self):
+        """Writes the config synchronously. UI edits should go through schedule_persistent_config_save."""
         self.logger.info("BotController: Saving persistent configuration...")
         if not self.config_manager or not self.strategy_engine:
             self.logger.error("ConfigManager or StrategyEngine not available. Cannot save config.")
             return
+        if self._save_flush_handle: self._save_flush_handle.cancel(); self._save_flush_handle = None
+        self._save_pending = False
+        self._report_save_result(bool(self.config_manager.save_app_config(self._build_app_config())))
 
-        general_settings = {'log_level': self.current_log_level_str} # Add other general settings here
-
-        strategies_config = {}
-        for strategy_id, strategy_instance in self.strategy_engine.strategies.items():
-            strategies_config[strategy_id] = {
-                'type_name': strategy_instance.params.get('strategy_type_name', strategy_instance.__class__.__name__), # Ensure type_name is in params
-                'params': strategy_instance.params
-            }
+    async def save_persistent_config_async(self) -> bool:
+        """Immediate save for UI buttons: snapshot on the loop thread, disk write awaited in an executor."""
+        if not self.config_manager or not self.strategy_engine:
+            self.logger.error("ConfigManager or StrategyEngine not available. Cannot save config.")
+            return False
+        if self._save_flush_handle: self._save_flush_handle.cancel(); self._save_flush_handle = None
+        self._save_pending = False
+        app_config_to_save = self._build_app_config()
+        saved = await asyncio.get_running_loop().run_in_executor(None, self.config_manager.save_app_config, app_config_to_save)
+        self._report_save_result(bool(saved))
+        return bool(saved)
+
+    def schedule_persistent_config_save(self):
+        """Debounced save: bursts of edits within save_debounce_s coalesce into one write done in an executor."""
+        self._save_pending = True
+        if not self._event_loop or self._event_loop.is_closed(): self.save_persistent_config(); return # No loop yet: write now
+        if self._save_flush_handle: self._save_flush_handle.cancel()
+        self._save_flush_handle = self._event_loop.call_later(self.save_debounce_s, self._maybe_flush_save)
+
+    def _maybe_flush_save(self):
+        self._save_flush_handle = None
+        if not self._save_pending: return
+        if not self.config_manager or not self.strategy_engine:
+            self.logger.error("ConfigManager or StrategyEngine not available. Cannot save config.")
+            return
+        self._save_pending = False
+        app_config_to_save = self._build_app_config() # Snapshot on the loop thread; only the disk write is offloaded
+        future = self._event_loop.run_in_executor(None, self.config_manager.save_app_config, app_config_to_save)
+        future.add_done_callback(self._on_background_save_done)
+
+    def _on_background_save_done(self, future: asyncio.Future):
+        if future.cancelled(): return
+        if future.exception():
+            self.logger.error(f"Background config save failed: {future.exception()}")
+            self._report_save_result(False)
+            return
+        self._report_save_result(bool(future.result())) # save_app_config returns False when nothing was written
 
-        app_config_to_save = {'general_settings': general_settings, 'strategies': strategies_config}
-        self.config_manager.save_app_config(app_config_to_save)
-        self.signals.log_message_appended.emit("Current configuration saved.")
+    def _report_save_result(self, saved: bool):
+        if saved:
+            self.logger.info("BotController: Persistent configuration saved.")
+            self.signals.log_message_appended.emit("Current configuration saved.")
+        else:
+            self.logger.error("BotController: Persistent configuration was NOT saved.")
+            self.signals.log_message_appended.emit("Error: configuration could not be saved. See log for details.")
 
 
     # --- Config Methods for UI ---
     def get_general_settings(self) -> dict:
         # This now primarily returns current state; loading happens at init or refresh
-        # Persistent log level is in self.current_log_level_str after load_persistent_config
+        # Persistent log level is in self.current_log_level_str after load_general_settings
         return {'log_level': self.current_log_level_str}
 
     def save_general_settings(self, settings: dict): # Called by UI
         new_log_level = settings.get('log_level')
         if new_log_level and new_log_level != self.current_log_level_str:
             self.current_log_level_str = new_log_level # Update in-memory state
-            # Actual saving to file now happens via save_persistent_config
-            self.save_persistent_config()
-            self.signals.log_message_appended.emit(f"Log level set to {new_log_level} and config saved. Restart required to apply log level globally.")
+            # Actual saving to file now happens via the debounced persistent config writer
+            self.schedule_persistent_config_save()
+            self.signals.log_message_appended.emit(f"Log level set to {new_log_level} and config will be saved. Restart required to apply log level globally.")
         else:
             self.signals.log_message_appended.emit("No changes in general settings or log level.")
 
 
     def get_api_keys_config(self) -> dict: # For UI to display non-sensitive parts
         if not self.config_manager: return {'testnet_key': '', 'mainnet_key': ''}
-        tn_key, _ = self.config_manager.load_api_keys(use_testnet=True)
-        mn_key, _ = self.config_manager.load_api_keys(use_testnet=False)
+        all_keys = self.config_manager.load_api_keys_all() # Single cached .env read for both networks
+        tn_key, mn_key = all_keys['testnet'][0], all_keys['mainnet'][0]
         return {'testnet_key': tn_key or '', 'mainnet_key': mn_key or ''}
 
     def save_api_keys(self, testnet_key: str, testnet_secret: str, mainnet_key: str, mainnet_secret: str): # Called by UI
@@ -239,7 +349,7 @@ class BotController(QObject):
                 success = self.strategy_engine.load_strategy(strategy_class, strategy_id, params_from_ui)
                 if success:
                     self.signals.log_message_appended.emit(f"Strategy {strategy_id} ({strategy_type_name}) added.")
-                    self.save_persistent_config() # Save after successful addition
+                    self.schedule_persistent_config_save() # Save after successful addition
                 else:
                     self.signals.log_message_appended.emit(f"Failed to load strategy {strategy_id}.")
                     self.signals.error_dialog_requested.emit("Add Strategy Failed", f"Could not load strategy '{strategy_id}'. Check logs.")
@@ -261,7 +371,7 @@ class BotController(QObject):
             success = self.strategy_engine.update_strategy_parameters(strategy_id, params_from_ui)
             if success:
                 self.signals.log_message_appended.emit(f"Params for {strategy_id} updated. Restart strategy if it was active for changes to take full effect.")
-                self.save_persistent_config() # Save after successful update
+                self.schedule_persistent_config_save() # Save after successful update
             else:
                 self.signals.log_message_appended.emit(f"Failed to update params for {strategy_id}.")
                 self.signals.error_dialog_requested.emit("Update Failed", f"Could not update parameters for '{strategy_id}'.")
@@ -281,7 +391,7 @@ class BotController(QObject):
             success = await self.strategy_engine.remove_strategy(strategy_id)
             if success:
                 self.signals.log_message_appended.emit(f"Strategy {strategy_id} removed.")
-                self.save_persistent_config() # Save after successful removal
+                self.schedule_persistent_config_save() # Save after successful removal
             else:
                 self.signals.log_message_appended.emit(f"Failed to remove strategy {strategy_id}.")
                 self.signals.error_dialog_requested.emit("Remove Failed", f"Could not remove strategy '{strategy_id}'.")
@@ -292,14 +402,14 @@ class BotController(QObject):
             return False
 
     # Keep other methods like get_historical_klines_for_chart, bot controls, shutdown as they are
-    async def get_historical_klines_for_chart(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[pd.DataFrame]:
+    async def get_historical_klines_for_chart(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[Dict[str, np.ndarray]]:
         if not self.market_data_provider:
             self.logger.warning("MarketDataProvider not available for chart data.")
             self.signals.status_bar_message_updated.emit("Chart data provider unavailable.", 5000)
             return None
         try:
-            data = await self.market_data_provider.get_historical_klines(symbol=symbol, interval=timeframe, limit=limit)
-            if data is None or data.empty :
+            data = await self.market_data_provider.get_historical_klines_arrays(symbol=symbol, interval=timeframe, limit=limit)
+            if data is None or not len(data['ts']):
                  self.signals.status_bar_message_updated.emit(f"No historical klines returned for {symbol}/{timeframe}.", 5000)
             return data
         except Exception as e:
@@ -307,11 +417,8 @@ class BotController(QObject):
             self.signals.error_dialog_requested.emit("Chart Data Error", f"Failed to load historical klines for {symbol}/{timeframe}: {e}")
             return None
 
-    @Slot()
-    def start_bot_async_wrapper(self):
-        self.logger.info("UI Action: Start Bot wrapper.")
-        if self.loop and self.loop.is_running(): asyncio.create_task(self.start_bot())
-        else: self.logger.error("No running event loop for start_bot.")
+    # start_bot/stop_bot are connected to UI buttons directly; under QtAsyncio the asyncio loop
+    # is the Qt event loop, so the UI schedules them with asyncio.ensure_future without extra checks.
     async def start_bot(self):
         if self.is_running: self.logger.warning("Bot already running."); self.signals.log_message_appended.emit("Bot is already running."); return
         if not all([self.strategy_engine, self.market_data_provider, self.binance_connector, self.order_manager, self.risk_manager]):
@@ -321,15 +428,14 @@ class BotController(QObject):
              return
         try:
             self.logger.info("BotController: Starting bot operations..."); self.is_running = True; self.signals.status_updated.emit("Starting...")
+            # Handlers are registered once in async_setup; only restart the stream (and re-register) if it went down.
             if self.binance_connector and not self.binance_connector.user_data_control_flag.get('keep_running'):
-                self.logger.info("User data stream seems not active, ensuring subscriptions are processed by MDP...")
+                self.logger.info("User data stream seems not active, restarting it with all user data handlers...")
+                self._user_stream_ready.clear() # A fresh stream will be started; wait for its own on-open
                 # These subscriptions are critical, if they fail, strategies might not work.
                 # MarketDataProvider's subscribe methods already log errors.
-                # Consider if specific error dialogs are needed here or if User Stream Failed from async_setup is enough.
-                self.market_data_provider.subscribe_to_user_data(self.handle_user_data_from_mdp)
-                if self.order_manager : self.market_data_provider.subscribe_to_user_data(self.order_manager.handle_order_update)
-                if self.strategy_engine : self.market_data_provider.subscribe_to_user_data(self.strategy_engine.handle_user_data_for_strategies)
-                await asyncio.sleep(2) # Allow subscriptions to establish
+                if self.market_data_provider.subscribe_to_user_data(*self._user_data_handlers()):
+                    await self._wait_for_user_stream_ready() # Allow subscriptions to establish
 
             if self.strategy_engine:
                 await self.strategy_engine.start_all_strategies() # This method in SE should handle individual strategy start errors.
@@ -341,11 +447,6 @@ class BotController(QObject):
             self.signals.error_dialog_requested.emit("Start Bot Failed", f"An error occurred while starting strategies: {e}")
             self.is_running = False # Ensure state is correct
 
-    @Slot()
-    def stop_bot_async_wrapper(self):
-        self.logger.info("UI Action: Stop Bot wrapper.")
-        if self.loop and self.loop.is_running(): asyncio.create_task(self.stop_bot())
-        else: self.logger.error("No running event loop for stop_bot.")
     async def stop_bot(self):
         if not self.is_running:
             self.logger.info("Bot not running, no need to stop."); return
@@ -364,9 +465,10 @@ class BotController(QObject):
     async def shutdown(self):
         try:
             self.logger.info("BotController initiating full shutdown..."); await self.stop_bot()
-            if self.market_data_provider:
-                await self.market_data_provider.unsubscribe_all_streams()
-            self.save_persistent_config() # Save config on graceful shutdown
+            if self._trade_marker_task: self._trade_marker_task.cancel(); self._trade_marker_task = None
+            if self.market_data_provider: # Sync; joins WS threads, so run it off the loop
+                await asyncio.get_running_loop().run_in_executor(None, self.market_data_provider.unsubscribe_all_streams)
+            self.save_persistent_config() # Synchronous on shutdown; also cancels any pending debounced save
             self.logger.info("BotController shutdown complete.")
         except Exception as e:
             self.logger.error(f"Error during BotController shutdown: {e}", exc_info=True)
@@ -375,6 +477,12 @@ class BotController(QObject):
 
     # Methods for request_open_orders_update, request_trade_history_update, request_positions_update,
     # cancel_order_ui, close_position_ui, get_loaded_strategies_info etc. from previous steps should be here too.
+    async def refresh_all_ui_data(self, trade_history_symbol: str = 'BTCUSDT', trade_history_limit: int = 50):
+        """Refreshes open orders, trade history and positions concurrently (one round-trip of latency instead of three)."""
+        await asyncio.gather(self.request_open_orders_update(), # Each request_* handles and reports its own errors
+                             self.request_trade_history_update(trade_history_symbol, trade_history_limit),
+                             self.request_positions_update(force=True)) # Explicit load/refresh: always repaint
+
     async def request_open_orders_update(self):
         if not self.order_manager:
             self.logger.warning("OrderManager not initialized for open orders update.")
@@ -399,45 +507,46 @@ class BotController(QObject):
             self.logger.error(f"Error requesting trade history: {e}", exc_info=True)
             self.signals.error_dialog_requested.emit("Fetch Trade History Failed", f"Details: {e}")
 
-    async def request_positions_update(self, emit_for_chart=False): # Added emit_for_chart
+    async def request_positions_update(self, emit_for_chart=False, force: bool = False): # force: emit even if unchanged (explicit loads/refreshes)
         if not self.order_manager:
             self.logger.warning("OrderManager not initialized for positions update.")
             self.signals.status_bar_message_updated.emit("Failed to get positions: Order Manager unavailable.", 5000)
             return
         try:
             positions = await self.order_manager.get_position_data_for_ui()
-            self.signals.positions_updated.emit(positions or []) # For the table view in OrdersView
+            positions_hash = hash(tuple(tuple(p.values()) for p in positions or ())) # Every displayed cell, incl. mark price/P&L
+            if force or positions_hash != self._last_positions_hash: # Skip the table repaint when nothing visible changed
+                self._last_positions_hash = positions_hash
+                self.signals.positions_updated.emit(positions or []) # For the table view in OrdersView
+                await self._prune_mark_price_subscriptions_for_pnl() # Positions changed; a symbol may have gone flat
 
             if emit_for_chart and positions:
-                # Determine the symbol currently displayed on the chart
-                # This assumes self.current_chart_symbol_tf is like ('BTCUSDT', '1h') or None
-                chart_symbol = self.current_chart_symbol_tf[0] if self.current_chart_symbol_tf else "BTCUSDT" # Default or error if None
-
-                for pos in positions:
-                    if pos.get('symbol') == chart_symbol:
-                        quantity = float(pos.get('positionAmt', 0))
-                        pos_side = 'FLAT'
-                        if quantity > 0: pos_side = 'LONG'
-                        elif quantity < 0: pos_side = 'SHORT'
-
-                        pos_data_for_chart = {
-                            'symbol': pos.get('symbol'),
-                            'entry_price': float(pos.get('entryPrice', 0)),
-                            'quantity': quantity, # Already float
-                            'side': pos_side,
-                            'timestamp': time.time() # Current time for update
-                        }
-                        self.logger.debug(f"Emitting chart_position_update for {chart_symbol}: {pos_data_for_chart}")
-                        self.signals.chart_position_update.emit(pos_data_for_chart)
-                        break # Assuming only one position per symbol for chart visualization
+                chart_symbol = self._chart_symbol # Kept current by set_chart_symbol_tf
+
+                # O(1) lookup in the symbol-indexed raw positions built by get_position_data_for_ui
+                pos = self.order_manager.positions_by_symbol.get(chart_symbol)
+                if pos: # Assuming only one position per symbol for chart visualization
+                    quantity = float(pos.get('positionAmt', 0))
+                    pos_side = 'FLAT'
+                    if quantity > 0: pos_side = 'LONG'
+                    elif quantity < 0: pos_side = 'SHORT'
+
+                    pos_data_for_chart = {
+                        'symbol': chart_symbol,
+                        'entry_price': float(pos.get('entryPrice', 0)),
+                        'quantity': quantity, # Already float
+                        'side': pos_side,
+                        'timestamp': time.time() # Current time for update
+                    }
+                    self.logger.debug("Emitting chart_position_update for %s: %s", chart_symbol, pos_data_for_chart) # Lazy %-format: no repr unless DEBUG
+                    self._emit_chart_position_update(pos_data_for_chart)
 
         except Exception as e:
             self.logger.error(f"Error requesting positions: {e}", exc_info=True)
             self.signals.error_dialog_requested.emit("Fetch Positions Failed", f"Details: {e}")
             if emit_for_chart: # Clear chart position if fetch fails
-                 chart_symbol = self.current_chart_symbol_tf[0] if self.current_chart_symbol_tf else "BTCUSDT"
-                 self.signals.chart_position_update.emit({
-                     'symbol': chart_symbol, 'side': 'FLAT',
+                 self._emit_chart_position_update({
+                     'symbol': self._chart_symbol, 'side': 'FLAT',
                      'entry_price': 0, 'quantity': 0, 'timestamp': time.time()
                  })
 
@@ -449,9 +558,8 @@ class BotController(QObject):
             return
         try:
             self.logger.info(f"BC: UI cancel order {order_id_str} for {symbol}")
-            order_id_int: Optional[int]=None; client_order_id: Optional[str]=None
-            if order_id_str.isdigit(): order_id_int = int(order_id_str)
-            else: client_order_id = order_id_str
+            try: order_id_int: Optional[int] = int(order_id_str); client_order_id: Optional[str] = None # Single parse; non-numeric => client ID
+            except ValueError: order_id_int = None; client_order_id = order_id_str
             response = await self.order_manager.cancel_existing_order(symbol=symbol, orderId=order_id_int, origClientOrderId=client_order_id)
 
             if response and (response.get('status') == 'CANCELED' or response.get('clientOrderId') == client_order_id): # Some cancel calls return limited info
@@ -463,8 +571,7 @@ class BotController(QObject):
                 self.signals.log_message_appended.emit(msg)
                 self.signals.error_dialog_requested.emit("Cancel Order Failed", f"For order {order_id_str}: {error_detail}")
 
-            if self.loop and self.loop.is_running():
-                asyncio.create_task(self.request_open_orders_update())
+            asyncio.create_task(self.request_open_orders_update())
         except Exception as e:
             self.logger.error(f"Exception canceling order {order_id_str}: {e}", exc_info=True)
             self.signals.error_dialog_requested.emit("Cancel Order Failed", f"Exception for order {order_id_str}: {e}")
@@ -489,15 +596,19 @@ class BotController(QObject):
                 self.signals.error_dialog_requested.emit("Close Position Failed", f"For {symbol} ({position_side_to_close}): {error_detail}")
 
             await asyncio.sleep(1) # Give time for order to potentially process
-            if self.loop and self.loop.is_running():
-                asyncio.create_task(self.request_positions_update())
-                asyncio.create_task(self.request_open_orders_update())
+            asyncio.create_task(self.request_positions_update())
+            asyncio.create_task(self.request_open_orders_update())
         except Exception as e:
             self.logger.error(f"Exception closing position {symbol} ({position_side_to_close}): {e}", exc_info=True)
             self.signals.error_dialog_requested.emit("Close Position Failed", f"Exception for {symbol} ({position_side_to_close}): {e}")
 
 
     # --- Live Kline Data for Chart ---
+    def set_chart_symbol_tf(self, symbol: str, timeframe: str):
+        """Called by the chart view when the user switches symbol/timeframe."""
+        self.current_chart_symbol_tf = (symbol, timeframe)
+        self._chart_symbol = symbol
+
     async def subscribe_to_chart_klines(self, symbol: str, timeframe: str):
         if not self.market_data_provider:
             self.logger.error("MarketDataProvider not available for chart kline subscription.")
@@ -506,24 +617,28 @@ class BotController(QObject):
         # Unsubscribe from previous chart kline stream if any
         if self.current_chart_kline_subscription_id:
             self.logger.info(f"Unsubscribing from previous chart kline stream: {self.current_chart_kline_subscription_id}")
-            await self.market_data_provider.unsubscribe_from_stream_by_id(self.current_chart_kline_subscription_id)
+            self.market_data_provider.remove_stream_callback(self._chart_kline_event_type, self._handle_live_kline_for_ui)
+            await asyncio.get_running_loop().run_in_executor(None, self.market_data_provider.unsubscribe_from_stream_by_id, self.current_chart_kline_subscription_id)
             self.current_chart_kline_subscription_id = None
 
         self.logger.info(f"Subscribing to kline stream for chart: {symbol}@{timeframe}")
         # The callback _handle_live_kline_for_ui needs to be defined
-        new_sub_id = await self.market_data_provider.subscribe_to_kline_stream(
+        new_sub_id = self.market_data_provider.subscribe_to_kline_stream(
             symbol, timeframe, self._handle_live_kline_for_ui
         )
         if new_sub_id:
             self.current_chart_kline_subscription_id = new_sub_id
+            self._chart_kline_event_type = f"{symbol.lower()}_kline_{timeframe}"
             self.logger.info(f"Successfully subscribed to chart kline stream {symbol}@{timeframe}, ID: {new_sub_id}")
         else:
             self.logger.error(f"Failed to subscribe to chart kline stream {symbol}@{timeframe}")
 
-    async def _handle_live_kline_for_ui(self, raw_ws_message: dict):
+    def _handle_live_kline_for_ui(self, raw_ws_message: dict):
         """
-        Handles incoming kline data from WebSocket, formats it, and emits a signal for the UI.
-        raw_ws_message example:
+        Handles incoming kline data from WebSocket (called on the WS thread), formats it and queues it for the UI.
+        Ticks are coalesced per (symbol, interval): at most one live_kline_tick per coalesce window, carrying the latest kline.
+        Closed klines are kept apart and emitted as live_kline_closed so the final candle values always reach the chart.
+        raw_ws_message example (MarketDataProvider may also pass the inner 'k' dict directly):
         {
             "stream": "btcusdt@kline_1m",
             "data": {
@@ -552,36 +667,58 @@ class BotController(QObject):
             }
         }
         """
+        ui_kline_data = None
         try:
-            kline_payload = raw_ws_message.get('data', {}).get('k', {})
+            kline_payload = raw_ws_message.get('data', raw_ws_message)
+            kline_payload = kline_payload.get('k', kline_payload)
             if not kline_payload:
                 self.logger.warning(f"Received kline WS message with empty payload: {raw_ws_message}")
                 return
 
-            ui_kline_data = {
-                "symbol": kline_payload.get('s'),
-                "interval": kline_payload.get('i'),
-                "t": kline_payload.get('t'),      # Kline open time (ms)
-                "o": kline_payload.get('o'),
-                "h": kline_payload.get('h'),
-                "l": kline_payload.get('l'),
-                "c": kline_payload.get('c'),
-                "v": kline_payload.get('v'),      # Base asset volume
-                "T": kline_payload.get('T'),      # Kline close time (ms)
-                "x": kline_payload.get('x', False) # Is this kline closed?
-            }
-
-            # Basic validation
-            if not all([ui_kline_data['symbol'], ui_kline_data['interval'], isinstance(ui_kline_data['t'], (int, float))]):
-                self.logger.warning(f"Received incomplete kline data for UI: {ui_kline_data}")
+            # Binance always sends these fields; a malformed payload surfaces as KeyError/ValueError/TypeError instead of per-field .get() checks
+            try:
+                ui_kline_data = { # Prices/volume parsed to float once here; the chart consumes them as-is
+                    "symbol": kline_payload['s'],
+                    "interval": kline_payload['i'],
+                    "t": int(kline_payload['t']),    # Kline open time (ms)
+                    "o": float(kline_payload['o']),
+                    "h": float(kline_payload['h']),
+                    "l": float(kline_payload['l']),
+                    "c": float(kline_payload['c']),
+                    "v": float(kline_payload['v']),   # Base asset volume
+                    "T": kline_payload['T'],          # Kline close time (ms)
+                    "x": kline_payload['x']           # Is this kline closed?
+                }
+            except (KeyError, ValueError, TypeError):
+                self.logger.warning(f"Received incomplete kline data for UI: {kline_payload}")
                 return
 
-            # self.logger.debug(f"BC Emitting live_kline_updated: S:{ui_kline_data['symbol']} I:{ui_kline_data['interval']} O:{ui_kline_data['o']} C:{ui_kline_data['c']} Closed:{ui_kline_data['x']}")
-            self.signals.live_kline_updated.emit(ui_kline_data)
+            with self._pending_klines_lock:
+                key = (ui_kline_data['symbol'], ui_kline_data['interval'])
+                if ui_kline_data['x']:
+                    self._pending_closed_klines[key] = ui_kline_data
+                    tick = self._pending_klines.get(key)
+                    if tick and tick['t'] <= ui_kline_data['t']: del self._pending_klines[key] # Superseded by the closed kline
+                else: self._pending_klines[key] = ui_kline_data # Latest tick wins
+                if self._kline_flush_scheduled: return
+                self._kline_flush_scheduled = True
+            if self._event_loop and not self._event_loop.is_closed():
+                self._event_loop.call_soon_threadsafe(self._event_loop.call_later, self.ui_emit_coalesce_interval_s, self._flush_pending_klines)
 
         except Exception as e:
             self.logger.error(f"Error processing live kline for UI: {e}. Message: {raw_ws_message}", exc_info=True)
-            self.signals.status_bar_message_updated.emit(f"Error processing live kline for {ui_kline_data.get('s') if ui_kline_data else 'chart'}: {e}", 5000)
+            self.signals.status_bar_message_updated.emit(f"Error processing live kline for {ui_kline_data.get('symbol') if ui_kline_data else 'chart'}: {e}", 5000)
+
+    def _flush_pending_klines(self):
+        """Emits closed klines, then the latest tick per (symbol, interval), collected during the coalesce window."""
+        with self._pending_klines_lock:
+            closed, self._pending_closed_klines = self._pending_closed_klines, {}
+            pending, self._pending_klines = self._pending_klines, {}
+            self._kline_flush_scheduled = False
+        for ui_kline_data in closed.values():
+            self.signals.live_kline_closed.emit(ui_kline_data)
+        for ui_kline_data in pending.values():
+            self.signals.live_kline_tick.emit(ui_kline_data)
 
     # --- Internal Signal Connections & Handlers ---
     def _connect_internal_signals(self):
@@ -599,11 +736,11 @@ class BotController(QObject):
         # self.logger.debug(f"BotController received user_data_event: {event_type}")
 
         if event_type == 'ACCOUNT_UPDATE':
-            await self.update_dashboard_balance()
+            self._schedule_debounced_refresh('balance', self.update_dashboard_balance)
             # ACCOUNT_UPDATE can signify changes in positions due to liquidation, margin calls, etc.
             # So, triggering a P&L update is reasonable here.
-            if self.order_manager and self.loop and self.loop.is_running():
-                asyncio.create_task(self.trigger_pnl_emission())
+            if self.order_manager:
+                self._schedule_debounced_refresh('pnl', self.trigger_pnl_emission)
 
 
         elif event_type == 'ORDER_TRADE_UPDATE':
@@ -625,29 +762,54 @@ class BotController(QObject):
                     'side': order_data.get('S'),              # 'S' is Side (BUY/SELL)
                     'quantity': float(order_data.get('l'))    # 'l' is Last filled quantity
                 }
-                self.logger.debug(f"Emitting chart_new_trade_marker: {trade_info}")
-                self.signals.chart_new_trade_marker.emit(trade_info)
+                self.logger.debug("Queueing chart trade marker: %s", trade_info)
+                self._enqueue_trade_marker(trade_info)
 
             # OrderManager's handle_order_update will call self.trigger_pnl_emission via callback if it's a FILL.
             # For other terminal states, we might also want to update positions for the chart.
+            # Refreshes are debounced: a burst of partial fills costs one REST call per kind.
             if order_status in ['CANCELED', 'EXPIRED', 'REJECTED'] or \
                (execution_type == 'TRADE' and order_status == 'PARTIALLY_FILLED'): # Keep updating for partial fills
-                if self.loop and self.loop.is_running():
-                    asyncio.create_task(self.request_positions_update(emit_for_chart=True))
+                self._schedule_debounced_refresh('positions', lambda: self.request_positions_update(emit_for_chart=True))
 
             # Always refresh open orders list on any order update
-            if self.loop and self.loop.is_running():
-                 asyncio.create_task(self.request_open_orders_update())
+            self._schedule_debounced_refresh('open_orders', self.request_open_orders_update)
+
+    def _enqueue_trade_marker(self, trade_info: Dict[str, Any]):
+        """Bounded producer side: when the queue is full the oldest marker is dropped."""
+        try: self._trade_marker_queue.put_nowait(trade_info)
+        except asyncio.QueueFull:
+            self._trade_marker_queue.get_nowait(); self._trade_marker_queue.put_nowait(trade_info)
+
+    async def _drain_trade_markers(self):
+        """Single consumer: waits for a marker, then emits it together with whatever else is queued (up to trade_marker_batch_size)."""
+        while True:
+            batch = [await self._trade_marker_queue.get()]
+            while len(batch) < self.trade_marker_batch_size and not self._trade_marker_queue.empty():
+                batch.append(self._trade_marker_queue.get_nowait())
+            self.signals.chart_new_trade_markers_batch.emit(batch)
+
+    def _schedule_debounced_refresh(self, kind: str, refresh_coro_fn: Callable[[], Any]):
+        """Queues refresh_coro_fn under `kind`; every kind queued within refresh_debounce_s runs in one gather."""
+        self._pending_refreshes[kind] = refresh_coro_fn # Repeats of a kind in the window are absorbed
+        if self._refresh_all_task is None: self._refresh_all_task = asyncio.create_task(self._debounced_refresh_all())
+
+    async def _debounced_refresh_all(self):
+        await asyncio.sleep(self.refresh_debounce_s)
+        pending, self._pending_refreshes = self._pending_refreshes, {}
+        self._refresh_all_task = None # Before fetching, so events arriving mid-fetch schedule a fresh round
+        results = await asyncio.gather(*(fn() for fn in pending.values()), return_exceptions=True)
+        for kind, result in zip(pending, results):
+            if isinstance(result, Exception): self.logger.error(f"Debounced {kind} refresh failed: {result}", exc_info=result)
 
     async def update_dashboard_balance(self):
         if self.order_manager:
             try:
-                balance_info = await self.order_manager.get_account_balance() # USDT balance
-                if balance_info:
-                    usdt_balance = next((item['balance'] for item in balance_info if item['asset'] == 'USDT'), None)
-                    if usdt_balance is not None:
-                        self.signals.usdt_balance_updated.emit(float(usdt_balance))
-                        # self.logger.debug(f"Emitted USDT balance update: {usdt_balance}")
+                balance_map = await self.order_manager.get_account_balance_map() # {asset: float balance}
+                usdt_balance = balance_map.get('USDT')
+                if usdt_balance is not None:
+                    self.signals.usdt_balance_updated.emit(usdt_balance)
+                    # self.logger.debug(f"Emitted USDT balance update: {usdt_balance}")
             except Exception as e:
                 self.logger.error(f"Error updating dashboard balance: {e}", exc_info=True)
                 self.signals.status_bar_message_updated.emit(f"Failed to update balance: {e}", 5000)
@@ -656,34 +818,23 @@ class BotController(QObject):
         # This handler is specifically for the dashboard's BTCUSDT price ticker.
         # P&L calculations will use handle_mark_price_for_pnl_passthrough.
         payload = mark_price_data.get('data', mark_price_data)
-        if payload and payload.get('s') == 'BTCUSDT':
-            price_str = payload.get('p', "0.0")
-            try:
-                price = float(price_str)
-                self.signals.btc_mark_price_updated.emit(price) # For dashboard ticker
-            except ValueError:
-                self.logger.error(f"Could not parse BTC mark price for dashboard ticker: {price_str}")
+        if payload and payload.get('s') == 'BTCUSDT' and payload.get('p') is not None:
+            self.signals.btc_mark_price_updated.emit(payload['p']) # For dashboard ticker; MDP already parsed 'p' to float
 
     async def handle_mark_price_for_pnl_passthrough(self, raw_ws_message: dict):
         """Generic handler for mark price updates for P&L calculation."""
         payload = raw_ws_message.get('data', raw_ws_message) # Handle nested or direct payload
         symbol = payload.get('s')
-        mark_price_str = payload.get('p')
+        mark_price = payload.get('p') # float, parsed once by MarketDataProvider._process_mark_price_data
 
-        if symbol and mark_price_str and self.order_manager:
-            try:
-                mark_price = float(mark_price_str)
-                self.order_manager.update_mark_price_for_pnl(symbol, mark_price)
-                if self.loop and self.loop.is_running():
-                    asyncio.create_task(self.trigger_pnl_emission())
-
-                # If this is BTCUSDT, also update the specific dashboard ticker signal
-                # This avoids needing two subscriptions if one handler can serve both.
-                if symbol == "BTCUSDT":
-                    self.signals.btc_mark_price_updated.emit(mark_price)
-
-            except ValueError:
-                self.logger.error(f"Could not parse mark price for {symbol} from P&L stream: {mark_price_str}")
+        if symbol and mark_price is not None and self.order_manager:
+            self.order_manager.update_mark_price_for_pnl(symbol, mark_price)
+            asyncio.create_task(self.trigger_pnl_emission())
+
+            # If this is BTCUSDT, also update the specific dashboard ticker signal
+            # This avoids needing two subscriptions if one handler can serve both.
+            if symbol == "BTCUSDT":
+                self.signals.btc_mark_price_updated.emit(mark_price)
         else:
             self.logger.warning(f"Incomplete mark price data for P&L: {payload}")
 
@@ -710,26 +861,67 @@ class BotController(QObject):
         except Exception as e:
             self.logger.error(f"Failed to get positions for P&L mark price subscriptions: {e}")
 
-        # Default to BTCUSDT if no other symbols identified (e.g. for dashboard)
-        if not symbols_to_subscribe:
-            symbols_to_subscribe.add("BTCUSDT")
-
-        for symbol in symbols_to_subscribe:
-            if symbol not in self.subscribed_mark_price_for_pnl:
-                self.logger.info(f"Subscribing to mark price for P&L: {symbol}")
-                await self.market_data_provider.subscribe_to_mark_price_stream(
-                    symbol,
-                    self.handle_mark_price_for_pnl_passthrough
-                )
-                self.subscribed_mark_price_for_pnl.add(symbol)
-            else:
-                self.logger.debug(f"Already subscribed to mark price for P&L for {symbol}.")
+        # BTCUSDT is always needed for the dashboard ticker; include it in the same combined stream
+        symbols_to_subscribe.add("BTCUSDT")
+
+        self._subscribe_mark_prices_for_pnl(symbols_to_subscribe)
+
+    def _subscribe_mark_prices_for_pnl(self, symbols) -> Optional[str]:
+        """Subscribes all not-yet-subscribed symbols to mark price over a single combined WebSocket."""
+        if not self.market_data_provider: return None
+        new_symbols = [s for s in symbols if s and s not in self.subscribed_mark_price_for_pnl]
+        if not new_symbols:
+            self.logger.debug("Already subscribed to mark price for P&L for %s.", symbols)
+            return None
+        self.logger.info(f"Subscribing to mark price for P&L (combined stream): {new_symbols}")
+        stream_id = self.market_data_provider.subscribe_to_mark_prices_bulk(new_symbols, self.handle_mark_price_for_pnl_passthrough)
+        if stream_id:
+            self.subscribed_mark_price_for_pnl.update(dict.fromkeys(new_symbols, stream_id))
+        return stream_id
+
+    async def _prune_mark_price_subscriptions_for_pnl(self):
+        """Drops P&L mark price subscriptions for symbols that no longer have a position or an active strategy.
+        A combined stream is stopped once none of its symbols is still needed."""
+        if not self.market_data_provider or not self.order_manager: return
+        needed = set(self.order_manager.positions_by_symbol) | {"BTCUSDT"} # BTCUSDT feeds the dashboard ticker
+        if self.strategy_engine:
+            needed.update(s.symbol for s in self.strategy_engine.strategies.values() if s.is_active and hasattr(s, 'symbol'))
+        stale = [sym for sym in self.subscribed_mark_price_for_pnl if sym not in needed]
+        if not stale: return
+        for sym in stale:
+            stream_id = self.subscribed_mark_price_for_pnl.pop(sym)
+            self.market_data_provider.remove_stream_callback(f"{sym.lower()}_mark_price", self.handle_mark_price_for_pnl_passthrough)
+            if stream_id not in self.subscribed_mark_price_for_pnl.values(): # No remaining symbol rides on this stream
+                # stop_market_stream joins the WS thread; keep that off the event loop
+                await asyncio.get_running_loop().run_in_executor(None, self.market_data_provider.unsubscribe_from_stream_by_id, stream_id)
+        self.logger.info(f"Removed P&L mark price subscriptions for flat symbols: {stale}")
+
+    def _emit_chart_position_update(self, pos_data: Dict[str, Any]):
+        """Queues a chart position update; bursts within the coalesce window collapse into one emit of the latest data."""
+        self._pending_chart_position = pos_data
+        if self._chart_position_flush_scheduled: return
+        self._chart_position_flush_scheduled = True
+        asyncio.get_running_loop().call_later(self.ui_emit_coalesce_interval_s, self._flush_chart_position_update)
+
+    def _flush_chart_position_update(self):
+        self._chart_position_flush_scheduled = False
+        pos_data, self._pending_chart_position = self._pending_chart_position, None
+        if pos_data is not None:
+            self.signals.chart_position_update.emit(pos_data)
 
     async def trigger_pnl_emission(self):
-        """Fetches P&L data from OrderManager and emits signals."""
+        """Requests a P&L refresh. Requests arriving within the coalesce window are served by a single computation and emit."""
         if not self.order_manager:
             self.logger.warning("OrderManager not available for P&L emission.")
             return
+        if self._pnl_flush_scheduled: return # A flush is already pending and will pick up the latest mark prices
+        self._pnl_flush_scheduled = True
+        asyncio.get_running_loop().call_later(self.ui_emit_coalesce_interval_s, lambda: asyncio.ensure_future(self._flush_pnl_emission()))
+
+    async def _flush_pnl_emission(self):
+        """Fetches P&L data from OrderManager and emits signals."""
+        self._pnl_flush_scheduled = False
+        if not self.order_manager: return
 
         try:
             realized_pnl = self.order_manager.get_session_realized_pnl()
@@ -1,53 +1,170 @@
 import sys
 import logging
-from typing import List, Dict, Any, Optional
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QCheckBox, QSpinBox # Added QCheckBox, QSpinBox
-from PySide6.QtCore import Slot, QDateTime, Qt
+from typing import List, Dict, Any, Optional, Tuple
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QCheckBox, QSpinBox, QGraphicsItem # Added QCheckBox, QSpinBox
+from PySide6.QtCore import Slot, QDateTime, Qt, QTimer
 import pyqtgraph as pg
-import pandas as pd
 import numpy as np
 import asyncio
+import functools
+
+from .indicator_kernels import sma_kernel, ema_kernel, rsi_kernel, wilder_step
+
+
+def _downsample_ohlc(t: np.ndarray, o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray, bucket: int) -> Tuple[np.ndarray, ...]:
+    """Aggregates every `bucket` consecutive candles into one (first open, max high, min low, last close; t at the bucket centre)."""
+    starts = np.arange(0, len(t), bucket); ends = np.minimum(starts + bucket, len(t)) - 1
+    return (t[starts] + t[ends]) / 2.0, o[starts], np.maximum.reduceat(h, starts), np.minimum.reduceat(l, starts), c[ends]
+
+
+@functools.lru_cache(maxsize=32) # Pure string parsing; module-level so the cache doesn't pin ChartView instances
+def _candle_width_seconds(timeframe_str: str) -> float:
+    if 'm' in timeframe_str: return int(timeframe_str.replace('m', '')) * 60 * 0.8
+    elif 'h' in timeframe_str: return int(timeframe_str.replace('h', '')) * 3600 * 0.8
+    elif 'd' in timeframe_str.lower(): return int(timeframe_str.lower().replace('d', '')) * 86400 * 0.8
+    return 3600 * 0.8
+
+
+class _CandleWindow:
+    """Preallocated SoA buffer holding the last `maxlen` candles. Appends are amortized O(1): the window is slid back to the
+    front of the oversized columns once per ~maxlen appends instead of reallocating every column on each new candle."""
+    def __init__(self, maxlen: int, keys: Tuple[str, ...] = ('t', 'o', 'h', 'l', 'c')):
+        self.maxlen = maxlen
+        self.keys = keys
+        self._cols: Dict[str, np.ndarray] = {k: np.empty(2 * maxlen) for k in keys}
+        self._start = self._end = 0
+
+    def reset(self, columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Copies `columns` (all rows, even beyond maxlen; the next append trims) and returns the window views. Keys missing from `columns` start as NaN."""
+        n = len(columns[self.keys[0]])
+        if len(self._cols[self.keys[0]]) < n + self.maxlen: self._cols = {k: np.empty(n + self.maxlen) for k in self.keys}
+        for k, col in self._cols.items(): col[:n] = columns[k] if k in columns else np.nan
+        self._start, self._end = 0, n
+        return self.view()
+
+    def append(self, values: Tuple[float, ...]) -> Dict[str, np.ndarray]:
+        """Appends one row (values ordered as `keys`, trailing keys default to NaN) and returns fresh window views; earlier views must not be reused."""
+        if self._end == len(self._cols[self.keys[0]]): # Full: slide the kept tail to the front
+            keep = min(self._end - self._start, self.maxlen - 1)
+            for col in self._cols.values(): col[:keep] = col[self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        for i, k in enumerate(self.keys): self._cols[k][self._end] = values[i] if i < len(values) else np.nan
+        self._end += 1
+        self._start = max(self._start, self._end - self.maxlen)
+        return self.view()
+
+    def view(self) -> Dict[str, np.ndarray]:
+        return {k: col[self._start:self._end] for k, col in self._cols.items()} # Contiguous views; in-place writes hit the buffer
+
 
 # Custom CandlestickItem (simplified version)
 class CandlestickItem(pg.GraphicsObject):
-    def __init__(self, data: List[Dict[str, Any]]):
+    # Shared by every instance; QPen/QBrush need no QApplication, so they are built once at import
+    _WICK_PEN = pg.mkPen('w', width=1)
+    _UP_PEN, _UP_BRUSH = pg.mkPen('g'), pg.mkBrush('g') # pyqtgraph color strings: mkPen/mkBrush reject the Qt.GlobalColor enum
+    _DOWN_PEN, _DOWN_BRUSH = pg.mkPen('r'), pg.mkBrush('r')
+
+    def __init__(self, data: Dict[str, np.ndarray], width: float = 0.8, pixel_width: Optional[float] = None):
+        """data: SoA candle columns 't' (epoch s), 'o', 'h', 'l', 'c' as float64 arrays; width: candle interval width in seconds;
+        pixel_width: on-screen width of the view, used to merge candles narrower than 2px (None disables downsampling)."""
         super().__init__()
         self.data = data
+        self.width = width
+        self.pixel_width = pixel_width
+        self._bounds = pg.QtCore.QRectF()
+        self._bucket = 1 # Candles merged per drawn historical candle (level of detail)
+        self._last_rect = pg.QtCore.QRectF() # Live candle area, for partial repaints
+        # Qt rasterizes paint() into a device pixmap and blits it until update()/geometry change or a zoom; panning and
+        # repaints triggered by neighbouring items (indicator curves, markers) no longer replay the QPicture op lists
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.generatePicture()
 
     def generatePicture(self):
-        self.picture = pg.QtGui.QPicture()
-        if not self.data: return
-        p = pg.QtGui.QPainter(self.picture)
+        """Full rebuild: every closed candle goes into the cached historical picture, the last one into the live picture."""
+        self._historical_picture = pg.QtGui.QPicture()
+        self._hist_low, self._hist_high = np.inf, -np.inf
+        if self.data and len(self.data['t']) > 1:
+            t, o, h, l, c = (self.data[k][:-1] for k in 'tohlc')
+            self._bucket = bucket = self._lod_bucket(len(t))
+            if bucket > 1: t, o, h, l, c = _downsample_ohlc(t, o, h, l, c, bucket) # LOD: fewer rects in the picture, same envelope
+            self._draw_candles(self._historical_picture, t, o, h, l, c, self.width * max(bucket, 1))
+            self._hist_low, self._hist_high = float(l.min()), float(h.max())
+        self.update_last_candle(full_update=True)
+
+    def _lod_bucket(self, n: int) -> int:
+        """Candles merged per drawn candle so each is >= 2px wide at the current zoom (OHLC form of M4 aggregation)."""
+        vb = self.getViewBox()
+        if vb is not None and vb.width() > 0:
+            x0, x1 = vb.viewRange()[0]
+            candle_px = self.width * vb.width() / max(x1 - x0, 1e-9) # On-screen width of one candle interval
+            return max(1, int(np.ceil(2.0 / candle_px)))
+        return max(1, int(np.ceil(2.0 * n / self.pixel_width))) if self.pixel_width else 1 # Not in a view yet: assume all candles fit
+
+    def refresh_lod(self):
+        """Rebuilds the historical picture only when the zoom changes how many candles are merged per drawn candle."""
+        if self.data and len(self.data['t']) > 1 and self._lod_bucket(len(self.data['t']) - 1) != self._bucket: self.generatePicture()
+
+    def update_last_candle(self, full_update: bool = False):
+        """Redraws only the last (still forming) candle; O(1) per live tick. The historical picture is reused.
+        Exactly one invalidation: a geometry change when the bounds moved, else a repaint of the live candle's own area
+        (full_update repaints the whole item, for when the historical picture was rebuilt)."""
+        QRectF = pg.QtCore.QRectF
+        self._live_picture = pg.QtGui.QPicture()
+        bounds, last_rect = QRectF(), QRectF()
+        if self.data and len(self.data['t']):
+            t, o, h, l, c = (self.data[k][-1:] for k in 'tohlc')
+            self._draw_candles(self._live_picture, t, o, h, l, c)
+            min_t, max_t = float(self.data['t'][0]) - self.width / 2.0, float(t[0]) + self.width / 2.0 # t is sorted ascending
+            min_price, max_price = min(self._hist_low, float(l[0])), max(self._hist_high, float(h[0]))
+            bounds = QRectF(min_t, min_price, max_t - min_t, max_price - min_price) # Cached for boundingRect
+            last_rect = QRectF(float(t[0]) - self.width / 2.0, float(l[0]), self.width, float(h[0] - l[0]))
+
+        if bounds != self._bounds:
+            self.prepareGeometryChange(); self._bounds = bounds; self.informViewBoundsChanged()
+        elif full_update: self.update()
+        else: # Old and new live candle area, padded by a couple of pixels for the cosmetic pens
+            pad_x, pad_y = 2 * (self.pixelWidth() or 0.0), 2 * (self.pixelHeight() or 0.0)
+            self.update(self._last_rect.united(last_rect).adjusted(-pad_x, -pad_y, pad_x, pad_y))
+        self._last_rect = last_rect
+
+    def _draw_candles(self, picture: pg.QtGui.QPicture, t: np.ndarray, o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray, width: Optional[float] = None):
+        body_w = (width or self.width) * 0.8 # 80% of interval for body
+        up_mask = o <= c
+        groups = ((np.flatnonzero(up_mask), self._UP_PEN, self._UP_BRUSH), (np.flatnonzero(~up_mask), self._DOWN_PEN, self._DOWN_BRUSH)) # Partitioned once
+        p = pg.QtGui.QPainter(picture)
         try:
-            for candle in self.data:
-                x, o, h, l, c = candle['t'], candle['o'], candle['h'], candle['l'], candle['c']
-                candle_body_width = candle.get('w', 0.8) * 0.8 # Use 80% of interval for body, rest for spacing
-
-                p.setPen(pg.mkPen('w', width=1))
-                p.drawLine(pg.QtCore.QPointF(x, l), pg.QtCore.QPointF(x, h)) # Wick
-
-                brush_color = Qt.green if o <= c else Qt.red
-                p.setBrush(pg.mkBrush(brush_color))
-                p.setPen(pg.mkPen(brush_color)) # Pen same color as brush for body
-                p.drawRect(pg.QtCore.QRectF(x - candle_body_width / 2.0, o, candle_body_width, c - o))
+            p.setPen(self._WICK_PEN) # All wicks as one path: (t, low) -> (t, high) segments
+            p.drawPath(pg.arrayToQPath(np.repeat(t, 2), np.column_stack((l, h)).ravel(), connect='pairs'))
+            for idx, pen, brush in groups:
+                if not len(idx): continue
+                p.setPen(pen); p.setBrush(brush) # One pen/brush switch per colour group
+                p.drawPath(self._bodies_path(t.take(idx) - body_w / 2.0, o.take(idx), c.take(idx), body_w))
         finally:
             p.end()
 
+    @staticmethod
+    def _bodies_path(left: np.ndarray, o: np.ndarray, c: np.ndarray, body_w: float) -> pg.QtGui.QPainterPath:
+        """One QPainterPath of closed rectangles, built from arrays by arrayToQPath instead of a QRectF per candle."""
+        right = left + body_w
+        xs = np.column_stack((left, right, right, left, left)).ravel()
+        ys = np.column_stack((o, o, c, c, o)).ravel()
+        connect = np.tile(np.array([1, 1, 1, 1, 0], dtype=np.int32), len(left)) # 0 ends each rectangle's subpath
+        return pg.arrayToQPath(xs, ys, connect=connect)
+
     def paint(self, p: pg.QtGui.QPainter, *args):
-        if self.picture.isNull(): return
-        p.drawPicture(0, 0, self.picture)
+        if not self._historical_picture.isNull(): p.drawPicture(0, 0, self._historical_picture)
+        if not self._live_picture.isNull(): p.drawPicture(0, 0, self._live_picture)
 
     def boundingRect(self) -> pg.QtCore.QRectF:
-        if not self.data: return pg.QtCore.QRectF()
-        min_t = min(d['t'] - d.get('w', 0.8) / 2.0 for d in self.data)
-        max_t = max(d['t'] + d.get('w', 0.8) / 2.0 for d in self.data)
-        min_price = min(d['l'] for d in self.data)
-        max_price = max(d['h'] for d in self.data)
-        return pg.QtCore.QRectF(min_t, min_price, (max_t - min_t), (max_price - min_price))
+        return self._bounds # Computed with the picture; pyqtgraph calls this many times per frame
 
 
 class ChartView(QWidget):
+    # Trade marker styles, shared by every marker instead of a new QBrush/QPen per trade
+    _BUY_BRUSH, _SELL_BRUSH = pg.mkBrush('g'), pg.mkBrush('r')
+    _MARKER_PEN = pg.mkPen('w', width=1)
+    _POSITION_PEN = pg.mkPen('y', style=Qt.PenStyle.DashLine, width=2)
+
     def __init__(self, backend_controller: Optional[Any] = None, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.backend_controller = backend_controller
@@ -55,11 +172,23 @@ class ChartView(QWidget):
 
         self._init_ui()
         self._connect_signals()
-        self.candlestick_data_for_plotting: List[Dict[str, Any]] = []
+        self.candlestick_data_for_plotting: Dict[str, np.ndarray] = {} # SoA: 't', 'o', 'h', 'l', 'c' + indicator outputs (views into _candle_window)
+        self._candle_window = _CandleWindow(maxlen=300, keys=('t', 'o', 'h', 'l', 'c', 'sma', 'ema', 'rsi')) # Keep roughly same as historical load
+        self.candle_width_secs: float = _candle_width_seconds('1h')
         self.current_chart_symbol_tf: Optional[Tuple[str, str]] = None # e.g. ('BTCUSDT', '1h')
+        self._indicator_state: Dict[str, list] = {} # 'sma'/'ema'/'rsi' -> [period, recurrence state...] for O(1) live ticks
+        self._indicator_first_t: Dict[str, float] = {} # First timestamp past each indicator's NaN warm-up
+        # Live ticks only update the window/indicator columns; the scene is refreshed at most once per 16 ms (~60 FPS)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._do_redraw)
+        self._candles_dirty = False
+        # Trade markers: growable arrays (amortized O(1) append), pushed to the scatter with one setData per redraw
+        self._trade_x, self._trade_y = np.empty(64), np.empty(64)
+        self._trade_brushes: List[Any] = []; self._trade_data: List[dict] = []
+        self._markers_dirty = False
 
-        self.trade_markers_plot: Optional[pg.ScatterPlotItem] = None
-        self.position_line: Optional[pg.InfiniteLine] = None
         # self.position_fill_item = None # Deferred
         # self.load_initial_chart_data() # Called from gui_launcher after window is shown
 
@@ -105,14 +234,20 @@ class ChartView(QWidget):
         self.price_plot.setLabel('left', "Price (USDT)")
         self.date_axis = pg.DateAxisItem(orientation='bottom')
         self.price_plot.setAxisItems({'bottom': self.date_axis})
+        self.price_plot.getViewBox().sigXRangeChanged.connect(self._on_price_x_range_changed) # Zoom-dependent candle LOD
         self.candlestick_item: Optional[CandlestickItem] = None
 
         # Add ScatterPlotItem for trade markers
         self.trade_markers_plot = pg.ScatterPlotItem(name="Trades", pxMode=False) # pxMode=False for scalable symbols
         self.price_plot.addItem(self.trade_markers_plot)
+        # Entry-price line is created once and moved/relabelled/hidden on position updates instead of being re-created
+        self.position_line = pg.InfiniteLine(angle=0, movable=False, pen=self._POSITION_PEN, label="")
+        self.position_line.setVisible(False)
+        self.price_plot.addItem(self.position_line)
 
-        self.sma_plot_item = self.price_plot.plot(pen='y', name='SMA')
-        self.ema_plot_item = self.price_plot.plot(pen='c', name='EMA')
+        # Only the post warm-up (all-finite) tail is ever plotted, so pyqtgraph's per-setData finite scan is skipped
+        self.sma_plot_item = self.price_plot.plot(pen='y', name='SMA', skipFiniteCheck=True)
+        self.ema_plot_item = self.price_plot.plot(pen='c', name='EMA', skipFiniteCheck=True)
 
         # RSI Plot (below price plot)
         self.plot_widget_layout.nextRow() # Move to the next row in the layout
@@ -121,7 +256,7 @@ class ChartView(QWidget):
         self.rsi_plot_widget.showGrid(x=True, y=True, alpha=0.3)
         self.rsi_plot_widget.setXLink(self.price_plot) # Link X axes
         self.rsi_plot_widget.setLimits(yMin=0, yMax=100)
-        self.rsi_plot_item = self.rsi_plot_widget.plot(pen='m', name='RSI')
+        self.rsi_plot_item = self.rsi_plot_widget.plot(pen='m', name='RSI', skipFiniteCheck=True)
         self.rsi_ob_line = pg.InfiniteLine(pos=70, angle=0, movable=False, pen=pg.mkPen('w', style=Qt.PenStyle.DotLine)) # Corrected Qt.DotLine
         self.rsi_os_line = pg.InfiniteLine(pos=30, angle=0, movable=False, pen=pg.mkPen('w', style=Qt.PenStyle.DotLine)) # Corrected Qt.DotLine
         self.rsi_plot_widget.addItem(self.rsi_ob_line)
@@ -138,156 +273,181 @@ class ChartView(QWidget):
     def _connect_signals(self):
         self.load_chart_button.clicked.connect(self.handle_load_refresh_chart)
         self.timeframe_combo.currentTextChanged.connect(self.handle_load_refresh_chart)
-        # Connect indicator controls to refresh chart
-        self.sma_checkbox.clicked.connect(self.handle_load_refresh_chart)
-        self.sma_period_spinbox.valueChanged.connect(self.handle_load_refresh_chart)
-        self.ema_checkbox.clicked.connect(self.handle_load_refresh_chart)
-        self.ema_period_spinbox.valueChanged.connect(self.handle_load_refresh_chart)
-        self.rsi_checkbox.clicked.connect(self.handle_load_refresh_chart)
-        self.rsi_period_spinbox.valueChanged.connect(self.handle_load_refresh_chart)
-
-    def _get_candle_width_seconds(self, timeframe_str: str) -> float:
-        # ... (implementation from previous step)
-        if 'm' in timeframe_str: return int(timeframe_str.replace('m', '')) * 60 * 0.8
-        elif 'h' in timeframe_str: return int(timeframe_str.replace('h', '')) * 3600 * 0.8
-        elif 'd' in timeframe_str.lower(): return int(timeframe_str.lower().replace('d', '')) * 86400 * 0.8
-        return 3600 * 0.8
-
-    def _prepare_candlestick_data(self, klines_df: pd.DataFrame, timeframe_str: str) -> List[Dict[str, Any]]:
-        # ... (implementation from previous step)
-        chart_data = [];
-        if klines_df is None or klines_df.empty: return chart_data
-        candle_width_secs = self._get_candle_width_seconds(timeframe_str)
-        if not isinstance(klines_df.index, pd.DatetimeIndex):
-            self.logger.warning("Kline DF index not DatetimeIndex."); return []
-        for idx_timestamp, row in klines_df.iterrows():
-            chart_data.append({'t': idx_timestamp.timestamp(), 'o': float(row['open']), 'h': float(row['high']),
-                               'l': float(row['low']), 'c': float(row['close']), 'w': candle_width_secs})
-        return chart_data
+        # Indicator controls replot from the loaded candle arrays; no refetch/resubscribe
+        self.sma_checkbox.clicked.connect(self.handle_indicator_settings_changed)
+        self.sma_period_spinbox.valueChanged.connect(self.handle_indicator_settings_changed)
+        self.ema_checkbox.clicked.connect(self.handle_indicator_settings_changed)
+        self.ema_period_spinbox.valueChanged.connect(self.handle_indicator_settings_changed)
+        self.rsi_checkbox.clicked.connect(self.handle_indicator_settings_changed)
+        self.rsi_period_spinbox.valueChanged.connect(self.handle_indicator_settings_changed)
+
+    def _prepare_candlestick_data(self, klines: Optional[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """Maps the fetched kline columns onto the SoA layout CandlestickItem draws from.
+        Columns are coerced to contiguous float64 (a no-op, no copy, for MarketDataProvider's arrays) so in-place live
+        updates and the njit kernels never see int64 timestamps or strided pandas views."""
+        if not klines or not len(klines['ts']): return {}
+        return {k: np.ascontiguousarray(klines[src], dtype=np.float64) for k, src in zip('tohlc', ('ts', 'open', 'high', 'low', 'close'))}
 
 
     @Slot()
     def handle_load_refresh_chart(self):
         # ... (implementation from previous step)
         if not self.backend_controller or not hasattr(self.backend_controller, 'get_historical_klines_for_chart'):
-            self.logger.warning("Backend controller not available for chart data."); self.update_chart_data(pd.DataFrame(), self.timeframe_combo.currentText()); return
+            self.logger.warning("Backend controller not available for chart data."); self.update_chart_data(None, self.timeframe_combo.currentText()); return
 
         symbol = "BTCUSDT"; timeframe = self.timeframe_combo.currentText()
         self.current_chart_symbol_tf = (symbol, timeframe) # Store current chart focus
+        if hasattr(self.backend_controller, 'set_chart_symbol_tf'): self.backend_controller.set_chart_symbol_tf(symbol, timeframe)
         self.chart_status_label.setText(f"Loading {symbol} {timeframe}...")
         self.logger.info(f"Loading chart: {symbol} {timeframe}...")
 
         async def fetch_and_update():
             try:
-                df = await self.backend_controller.get_historical_klines_for_chart(symbol, timeframe, limit=200)
-                self.update_chart_data(df if df is not None else pd.DataFrame(), timeframe)
+                klines = await self.backend_controller.get_historical_klines_for_chart(symbol, timeframe, limit=200)
+                self.update_chart_data(klines, timeframe)
                 # After historical data is loaded and plotted, subscribe to live updates
                 if hasattr(self.backend_controller, 'subscribe_to_chart_klines'):
                     await self.backend_controller.subscribe_to_chart_klines(symbol, timeframe)
                 self.chart_status_label.setText(f"Displaying {symbol} {timeframe} - Live")
             except Exception as e:
                 self.logger.error(f"Error fetching/updating chart: {e}", exc_info=True)
-                self.update_chart_data(pd.DataFrame(), timeframe)
+                self.update_chart_data(None, timeframe)
                 self.chart_status_label.setText(f"Error loading {symbol} {timeframe}")
 
-        if self.backend_controller.loop and self.backend_controller.loop.is_running(): # type: ignore
-            asyncio.create_task(fetch_and_update())
-        # else: asyncio.run(fetch_and_update()) # Avoid asyncio.run if loop might be managed elsewhere
+        try: loop = asyncio.get_running_loop()
+        except RuntimeError: # Never block the UI thread with a synchronous asyncio.run fallback
+            self.logger.error("No running asyncio loop (QtAsyncio not started); chart load skipped.")
+            self.chart_status_label.setText(f"Cannot load {symbol} {timeframe}: event loop not running"); return
+        loop.create_task(fetch_and_update()) # Qt and asyncio share one loop (QtAsyncio)
 
     def load_initial_chart_data(self): self.handle_load_refresh_chart()
 
-    def _plot_indicators(self, klines_df_for_indicators: pd.DataFrame):
-        self.sma_plot_item.clear(); self.ema_plot_item.clear(); self.rsi_plot_item.clear()
-        if klines_df_for_indicators is None or klines_df_for_indicators.empty:
+    @Slot()
+    def handle_indicator_settings_changed(self):
+        candles = self.candlestick_data_for_plotting
+        self._plot_indicators(candles) # Timestamps/closes stay cached on the widget between loads
+
+    def _plot_indicators(self, candles: Dict[str, np.ndarray]):
+        """Full pass: computes enabled indicators from the window's 't'/'c' views into its 'sma'/'ema'/'rsi' columns and plots them."""
+        self._indicator_state = {} # Re-seeded below from this full pass
+        if not candles or not len(candles['c']):
+            for item in (self.sma_plot_item, self.ema_plot_item, self.rsi_plot_item): item.setData(x=[], y=[]) # Empty, but the items stay in place
             return
-
-        # Ensure 'close' column is float
-        klines_df_for_indicators['close'] = klines_df_for_indicators['close'].astype(float)
-
-        # X-axis data (timestamps in epoch seconds)
-        # Ensure index is DatetimeIndex before converting
-        if not isinstance(klines_df_for_indicators.index, pd.DatetimeIndex):
-            self.logger.warning("Indicator klines_df index is not DatetimeIndex. Cannot plot indicators.")
-            # Attempt to convert if 'timestamp' column exists (e.g. from self.candlestick_data_for_plotting)
-            if 'timestamp' in klines_df_for_indicators.columns:
-                 klines_df_for_indicators['timestamp'] = pd.to_datetime(klines_df_for_indicators['timestamp'])
-                 klines_df_for_indicators = klines_df_for_indicators.set_index('timestamp')
-            else: # If no 'timestamp' column, try to infer from a 't' column (epoch seconds)
-                if 't' in klines_df_for_indicators.columns: # 't' would be epoch seconds from candlestick_data_for_plotting
-                    klines_df_for_indicators.index = pd.to_datetime(klines_df_for_indicators['t'], unit='s')
-                else: # Cannot determine timestamps for indicators
-                    return
-
-        x_timestamps = klines_df_for_indicators.index.astype(np.int64) // 10**9
+        x_timestamps, close = candles['t'], candles['c'] # Contiguous float64 views, as the kernels are compiled for
 
         # SMA
-        if self.sma_checkbox.isChecked() and len(klines_df_for_indicators) >= self.sma_period_spinbox.value():
-            period = self.sma_period_spinbox.value()
-            sma_series = klines_df_for_indicators['close'].rolling(window=period, min_periods=period).mean()
-            self.sma_plot_item.setData(x=x_timestamps, y=sma_series.values)
+        if self.sma_checkbox.isChecked() and len(close) >= self.sma_period_spinbox.value():
+            period = self.sma_period_spinbox.value(); y = candles['sma']; y[:] = sma_kernel(close, period)
+            self._indicator_state['sma'] = [period, float(close[-period:].sum())] # Rolling window sum
+            self._indicator_first_t['sma'] = float(x_timestamps[period - 1]); self._set_indicator_curve('sma', self.sma_plot_item, candles)
+        else: self.sma_plot_item.setData(x=[], y=[])
         # EMA
-        if self.ema_checkbox.isChecked() and len(klines_df_for_indicators) >= self.ema_period_spinbox.value():
-            period = self.ema_period_spinbox.value()
-            ema_series = klines_df_for_indicators['close'].ewm(span=period, adjust=False, min_periods=period).mean()
-            self.ema_plot_item.setData(x=x_timestamps, y=ema_series.values)
+        if self.ema_checkbox.isChecked() and len(close) >= self.ema_period_spinbox.value():
+            period = self.ema_period_spinbox.value(); y = candles['ema']; y[:] = ema_kernel(close, period)
+            self._indicator_state['ema'] = [period, float(y[-2]) if len(y) > 1 else np.nan] # EMA before the last bar
+            self._indicator_first_t['ema'] = float(x_timestamps[period - 1]); self._set_indicator_curve('ema', self.ema_plot_item, candles)
+        else: self.ema_plot_item.setData(x=[], y=[])
         # RSI
-        if self.rsi_checkbox.isChecked() and len(klines_df_for_indicators) >= self.rsi_period_spinbox.value() + 1: # Need one more for diff
-            period = self.rsi_period_spinbox.value()
-            delta = klines_df_for_indicators['close'].diff()
-            gain = (delta.where(delta > 0, 0.0)).ewm(com=max(1, period - 1), adjust=False, min_periods=max(1,period-1)).mean()
-            loss = (-delta.where(delta < 0, 0.0)).ewm(com=max(1, period - 1), adjust=False, min_periods=max(1,period-1)).mean()
-            rs = gain / (loss + 1e-9)
-            rsi_series = 100 - (100 / (1 + rs))
-            self.rsi_plot_item.setData(x=x_timestamps, y=rsi_series.values)
+        if self.rsi_checkbox.isChecked() and len(close) >= self.rsi_period_spinbox.value() + 1: # Need one more for diff
+            period = self.rsi_period_spinbox.value(); y = candles['rsi']; rsi, avg_gain, avg_loss = rsi_kernel(close, period); y[:] = rsi
+            self._indicator_state['rsi'] = [period, avg_gain, avg_loss] # Wilder averages before the last bar
+            self._indicator_first_t['rsi'] = float(x_timestamps[max(0, max(1, period - 1) - 1)]); self._set_indicator_curve('rsi', self.rsi_plot_item, candles)
             # Configurable OB/OS levels for RSI (example, assuming spinboxes exist or using fixed values)
             # self.rsi_ob_line.setValue(getattr(self, 'rsi_ob_level_spinbox', QSpinBox(value=70)).value())
             # self.rsi_os_line.setValue(getattr(self, 'rsi_os_level_spinbox', QSpinBox(value=30)).value())
             self.rsi_ob_line.setValue(70)
             self.rsi_os_line.setValue(30)
-
-
-    @Slot(pd.DataFrame, str)
-    def update_chart_data(self, klines_df: pd.DataFrame, timeframe_str: str):
-        self.logger.debug(f"Updating chart with {len(klines_df)} klines for {timeframe_str}.")
-
-        self.candlestick_data_for_plotting.clear() # Clear existing live data buffer
+        else: self.rsi_plot_item.setData(x=[], y=[])
+
+    def _set_indicator_curve(self, name: str, plot_item: pg.PlotDataItem, candles: Dict[str, np.ndarray]):
+        """Plots the column from its first post warm-up timestamp on (located by binary search, robust to the window sliding)."""
+        t = candles['t']; start = int(np.searchsorted(t, self._indicator_first_t[name]))
+        plot_item.setData(x=t[start:], y=candles[name][start:])
+
+    def _update_indicators_incremental(self, prev_close: float, appended: bool) -> bool:
+        """Advances the cached indicators by the last bar only (SMA window sum, EMA and Wilder recurrences), writing the
+        result into the last slot of the window's indicator columns (an appended row arrives there as NaN). Plotting is left to _do_redraw.
+        Returns False when the cache can't be advanced (settings changed, warm-up) so the caller recomputes."""
+        state = self._indicator_state; candles = self.candlestick_data_for_plotting
+        enabled = {k for k, cb in (('sma', self.sma_checkbox), ('ema', self.ema_checkbox), ('rsi', self.rsi_checkbox)) if cb.isChecked()}
+        if not enabled and not state: return True # Nothing to advance; the last full pass already emptied the curves
+        c = candles['c']; n = len(c)
+        if not state or enabled != state.keys() or any(n <= st[0] + 1 for st in state.values()): return False
+        new_close = float(c[-1])
+
+        if 'sma' in state:
+            period, window_sum = state['sma']; y = candles['sma']
+            window_sum += new_close - (float(c[-1 - period]) if appended else prev_close)
+            y[-1] = window_sum / period
+            state['sma'] = [period, window_sum]
+        if 'ema' in state:
+            period, prev_ema = state['ema']; y = candles['ema']
+            if appended: prev_ema = float(y[-2]) # The closed bar's EMA becomes the seed
+            alpha = 2.0 / (period + 1.0)
+            y[-1] = alpha * new_close + (1.0 - alpha) * prev_ema
+            state['ema'] = [period, prev_ema]
+        if 'rsi' in state:
+            period, avg_gain, avg_loss = state['rsi']; y = candles['rsi']
+            if appended: avg_gain, avg_loss = wilder_step(avg_gain, avg_loss, float(c[-2] - c[-3]), period) # Fold in the closed bar
+            gain, loss = wilder_step(avg_gain, avg_loss, new_close - float(c[-2]), period)
+            y[-1] = 100.0 - 100.0 / (1.0 + gain / (loss + 1e-9))
+            state['rsi'] = [period, avg_gain, avg_loss]
+        return True
+
+
+    @Slot(object, str)
+    def update_chart_data(self, klines: Optional[Dict[str, np.ndarray]], timeframe_str: str):
+        num_klines = len(klines['ts']) if klines else 0
+        self.logger.debug(f"Updating chart with {num_klines} klines for {timeframe_str}.")
+
+        self.candlestick_data_for_plotting = {} # Clear existing live data buffer
+        self._redraw_timer.stop() # Pending live redraw belongs to the previous data
+        self.candle_width_secs = _candle_width_seconds(timeframe_str)
 
         # Clear previous plot items related to data
         if self.candlestick_item:
             self.price_plot.removeItem(self.candlestick_item)
             self.candlestick_item = None
-        if self.trade_markers_plot:
-            self.trade_markers_plot.clear() # Clear trade markers
-        if self.position_line:
-            self.price_plot.removeItem(self.position_line)
-            self.position_line = None
+        self._trade_brushes, self._trade_data = [], []; self._markers_dirty = False
+        self.trade_markers_plot.clear() # Clear trade markers
+        self.position_line.setVisible(False)
         # if self.position_fill_item: # If implementing fill
         #     self.price_plot.removeItem(self.position_fill_item)
         #     self.position_fill_item = None
 
-        if klines_df is None or klines_df.empty:
+        if not num_klines:
             # self.price_plot.clear() # This would also remove indicator lines if not careful
-            self._plot_indicators(pd.DataFrame()) # Clear indicators
+            self._plot_indicators({}) # Clear indicators
             self.chart_status_label.setText(f"No data for {self.current_chart_symbol_tf[0]} {self.current_chart_symbol_tf[1]}")
             return
 
-        self.candlestick_data_for_plotting = self._prepare_candlestick_data(klines_df, timeframe_str)
+        prepared = self._prepare_candlestick_data(klines)
+        self.candlestick_data_for_plotting = self._candle_window.reset(prepared) if prepared else {}
 
         if self.candlestick_data_for_plotting:
-            self.candlestick_item = CandlestickItem(self.candlestick_data_for_plotting)
+            self.candlestick_item = CandlestickItem(self.candlestick_data_for_plotting, self.candle_width_secs, pixel_width=self.price_plot.getViewBox().width())
             self.price_plot.addItem(self.candlestick_item)
         else:
-            self.price_plot.clear() # Should not happen if klines_df was not empty
+            self.price_plot.clear() # Should not happen if klines was not empty
 
-        self._plot_indicators(klines_df) # Plot indicators based on the full historical DataFrame
+        self._plot_indicators(self.candlestick_data_for_plotting) # Plot indicators from the full historical arrays
 
         self.price_plot.autoRange()
         self.rsi_plot_widget.autoRange()
-        self.chart_status_label.setText(f"Displaying {self.current_chart_symbol_tf[0]} {self.current_chart_symbol_tf[1]} - Historical ({len(klines_df)})")
+        self.chart_status_label.setText(f"Displaying {self.current_chart_symbol_tf[0]} {self.current_chart_symbol_tf[1]} - Historical ({num_klines})")
 
 
     @Slot(dict)
-    def handle_live_kline_data(self, kline_data: dict):
+    def handle_live_kline_tick(self, kline_data: dict):
+        """Unclosed kline: updates (or appends) the last candle and advances indicators incrementally."""
+        self._apply_live_kline(kline_data, closed=False)
+
+    @Slot(dict)
+    def handle_live_kline_closed(self, kline_data: dict):
+        """Closed kline: final candle values; indicators get one full pass to re-seed the incremental cache."""
+        self._apply_live_kline(kline_data, closed=True)
+
+    def _apply_live_kline(self, kline_data: dict, closed: bool):
         # kline_data is ui_kline_data from BotController (timestamps in ms)
         # Example: {"symbol": "BTCUSDT", "interval": "1m", "t": 1672515720000, "o": "0.0010", ... "x": false}
 
@@ -305,78 +465,74 @@ class ChartView(QWidget):
         kline_open_time_sec = kline_data['t'] / 1000.0
         # is_closed = kline_data['x'] # We can use this if we want to treat closed/unclosed differently
 
-        new_candle_plot_data = {
-            't': kline_open_time_sec,
-            'o': float(kline_data['o']), 'h': float(kline_data['h']),
-            'l': float(kline_data['l']), 'c': float(kline_data['c']),
-            'w': self._get_candle_width_seconds(kline_data['interval'])
-        }
+        new_candle = (kline_open_time_sec, kline_data['o'], kline_data['h'], kline_data['l'], kline_data['c']) # Already floats (BotController)
+        candles = self.candlestick_data_for_plotting
+        prev_close = float(candles['c'][-1]) if candles else np.nan; appended = False
 
-        if not self.candlestick_data_for_plotting:
-            self.candlestick_data_for_plotting.append(new_candle_plot_data)
+        if not candles:
+            self.candlestick_data_for_plotting = candles = self._candle_window.reset({k: (v,) for k, v in zip('tohlc', new_candle)})
         else:
-            last_plotted_candle_t = self.candlestick_data_for_plotting[-1]['t']
-            if kline_open_time_sec == last_plotted_candle_t: # Update current (last) candle
-                self.candlestick_data_for_plotting[-1] = new_candle_plot_data
-            elif kline_open_time_sec > last_plotted_candle_t: # New candle
-                self.candlestick_data_for_plotting.append(new_candle_plot_data)
-                # Optional: Limit buffer size
-                max_live_candles = 300 # Keep roughly same as historical load
-                if len(self.candlestick_data_for_plotting) > max_live_candles:
-                    self.candlestick_data_for_plotting = self.candlestick_data_for_plotting[-max_live_candles:]
+            last_plotted_candle_t = candles['t'][-1]
+            if kline_open_time_sec == last_plotted_candle_t: # Update current (last) candle in place
+                for k, v in zip('tohlc', new_candle): candles[k][-1] = v
+            elif kline_open_time_sec > last_plotted_candle_t: # New candle: written into the preallocated window (trims to maxlen)
+                self.candlestick_data_for_plotting = candles = self._candle_window.append(new_candle)
+                appended = True
             else: # Old kline, should not happen with live stream under normal circumstances
                 self.logger.warning(f"Received old kline in live update: OpenTime {kline_open_time_sec} vs LastPlotted {last_plotted_candle_t}")
                 return # Don't update chart with out-of-order old data
 
-        if self.candlestick_item:
-            self.candlestick_item.data = self.candlestick_data_for_plotting # Update data in item
-            self.candlestick_item.generatePicture() # Regenerate picture
-            # self.candlestick_item.update() # Trigger repaint via paint method
-            self.candlestick_item.informViewBoundsChanged() # More robust way to signal update
-            self.price_plot.update() # Try updating the plot view directly
+        # Only the last bar changed (or one was appended): advance the cached indicators in O(1); once per candle close, recompute
+        if closed or not self._update_indicators_incremental(prev_close, appended):
+            self._plot_indicators(candles) # Cold cache or settings changed: one full pass re-seeds it
 
-        # Update indicators using a DataFrame derived from the current candlestick_data_for_plotting
-        if self.candlestick_data_for_plotting:
-            # Construct DataFrame for indicators
-            # Column names must match what _plot_indicators expects (e.g., 'open', 'high', 'low', 'close', and a DatetimeIndex)
-            live_df_for_indicators = pd.DataFrame([{
-                'timestamp': pd.to_datetime(cd['t'], unit='s'), # Convert epoch seconds back to Datetime
-                'open': cd['o'], 'high': cd['h'], 'low': cd['l'], 'close': cd['c']
-            } for cd in self.candlestick_data_for_plotting])
-
-            if not live_df_for_indicators.empty:
-                live_df_for_indicators = live_df_for_indicators.set_index('timestamp')
-                # Plot indicators using the tail of the data to keep it responsive
-                self._plot_indicators(live_df_for_indicators.tail(200))
+        self._candles_dirty = True
+        if not self._redraw_timer.isActive(): self._redraw_timer.start() # Bursts of ticks share one redraw
 
         # self.price_plot.autoRange() # Auto-range can be jumpy on live updates
         # self.rsi_plot_widget.autoRange() # Consider conditional auto-range or manual range updates
 
+    @Slot()
+    def _on_price_x_range_changed(self, *args):
+        if self.candlestick_item: self.candlestick_item.refresh_lod()
+
+    @Slot()
+    def _do_redraw(self):
+        """Pushes the changes accumulated since the last redraw to the candlestick item, indicator curves and trade markers."""
+        if self._markers_dirty:
+            n = len(self._trade_data); self._markers_dirty = False
+            self.trade_markers_plot.setData(x=self._trade_x[:n], y=self._trade_y[:n], brush=self._trade_brushes, pen=self._MARKER_PEN,
+                                            symbol='s', size=12, data=self._trade_data) # Square for both sides; colour tells BUY from SELL
+        candles = self.candlestick_data_for_plotting
+        if not self._candles_dirty or not candles: return
+        self._candles_dirty = False
+        if self.candlestick_item:
+            if self.candlestick_item.data is candles: self.candlestick_item.update_last_candle() # Same candle ticked: redraw only the tail
+            else: self.candlestick_item.data = candles; self.candlestick_item.generatePicture() # New candle: rebuild once per interval
+        for name, plot_item in (('sma', self.sma_plot_item), ('ema', self.ema_plot_item), ('rsi', self.rsi_plot_item)):
+            if name in self._indicator_state: self._set_indicator_curve(name, plot_item, candles)
+
     @Slot(dict)
     def handle_new_trade_marker(self, trade_info: dict):
-        if not self.current_chart_symbol_tf or \
-           trade_info['symbol'] != self.current_chart_symbol_tf[0] or \
-           not self.trade_markers_plot:
-            return
+        self.handle_new_trade_markers_batch([trade_info])
 
-        timestamp = trade_info['timestamp'] # Epoch seconds
-        price = trade_info['price']
-        side = trade_info['side'] # 'BUY' or 'SELL'
-
-        # symbol_char = 't1' if side == 'BUY' else 't2' # Triangle up/down
-        # pg.graphicsItems.ScatterPlotItem.Symbols uses different keys
-        symbol_char = 's' if side == 'BUY' else 's' # Square for buy, 'd' for sell diamond
-        color = pg.mkBrush('g') if side == 'BUY' else pg.mkBrush('r')
-        border_pen = pg.mkPen('w', width=1)
-        size = 12
-
-        # self.logger.debug(f"Adding trade marker: TS {timestamp}, Px {price}, Side {side}")
-        self.trade_markers_plot.addPoints([{'pos': (timestamp, price),
-                                            'symbol': symbol_char,
-                                            'brush': color,
-                                            'pen': border_pen,
-                                            'size': size,
-                                            'data': trade_info}]) # Store original info if needed
+    @Slot(list)
+    def handle_new_trade_markers_batch(self, trade_infos: list):
+        if not self.current_chart_symbol_tf or not self.trade_markers_plot:
+            return
+        chart_symbol = self.current_chart_symbol_tf[0]
+        trades = [trade_info for trade_info in trade_infos if trade_info['symbol'] == chart_symbol]
+        if not trades: return
+        n, m = len(self._trade_data), len(trades)
+        if n + m > len(self._trade_x): # Grow by doubling
+            cap = max(2 * len(self._trade_x), n + m)
+            self._trade_x = np.resize(self._trade_x, cap); self._trade_y = np.resize(self._trade_y, cap)
+        self._trade_x[n:n + m] = [tr['timestamp'] for tr in trades] # Epoch seconds
+        self._trade_y[n:n + m] = [tr['price'] for tr in trades] # Fill price
+        self._trade_brushes.extend(self._BUY_BRUSH if tr['side'] == 'BUY' else self._SELL_BRUSH for tr in trades)
+        self._trade_data.extend(trades) # Original info kept per point
+        self._markers_dirty = True
+        if not self._redraw_timer.isActive(): self._redraw_timer.start()
 
     @Slot(dict)
     def handle_position_update_for_chart(self, pos_data: dict):
@@ -384,33 +540,23 @@ class ChartView(QWidget):
            pos_data['symbol'] != self.current_chart_symbol_tf[0]:
             return
 
-        # Clear previous position line and fill
-        if self.position_line:
-            self.price_plot.removeItem(self.position_line)
-            self.position_line = None
         # if self.position_fill_item: # If implementing fill
         #     self.price_plot.removeItem(self.position_fill_item)
         #     self.position_fill_item = None
 
-        if pos_data['side'] != 'FLAT' and pos_data['entry_price'] > 0:
-            entry_price = pos_data['entry_price']
-            pos_side_label = pos_data['side']
-            self.logger.info(f"Displaying position line for {pos_data['symbol']} {pos_side_label} @ {entry_price}")
+        if pos_data['side'] == 'FLAT' or pos_data['entry_price'] <= 0:
+            self.position_line.setVisible(False); return
 
-            self.position_line = pg.InfiniteLine(
-                pos=entry_price,
-                angle=0,
-                movable=False,
-                pen=pg.mkPen('y', style=Qt.PenStyle.DashLine, width=2), # Corrected Qt.DashLine
-                label=f"{pos_side_label} Entry: {entry_price:.{self.price_plot.axes['left']['item'].tickFormatters[0][1] if self.price_plot.axes['left']['item'].tickFormatters else 2}f}" # Dynamic precision
-            )
-            self.price_plot.addItem(self.position_line)
+        entry_price = pos_data['entry_price']
+        pos_side_label = pos_data['side']
+        self.logger.info(f"Displaying position line for {pos_data['symbol']} {pos_side_label} @ {entry_price}")
+        self.position_line.setValue(entry_price)
+        self.position_line.label.setFormat(f"{pos_side_label} Entry: {entry_price:.2f}")
+        self.position_line.setVisible(True)
 
-            # Optional: P&L Fill (deferred for simplicity)
-            # ...
+        # Optional: P&L Fill (deferred for simplicity)
+        # ...
 
 if __name__ == '__main__':
     # ... (Standalone test code from previous step can be adapted)
     pass
-
-```
@@ -1,25 +1,114 @@
 import logging
 import asyncio
-from typing import Dict, Optional, Any, List
+import json
+from typing import Dict, Optional, Any, Callable, Tuple, List, NamedTuple, Set, Coroutine
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
                              QPushButton, QComboBox, QGroupBox, QScrollArea, QFormLayout,
-                             QMessageBox, QListWidget, QListWidgetItem, QSplitter,
-                             QSpinBox, QDoubleSpinBox, QCheckBox)
-from PySide6.QtCore import Slot, Qt, QSize # Added QSize
+                             QMessageBox, QListWidget, QListWidgetItem, QListView, QSplitter,
+                             QSpinBox, QDoubleSpinBox, QCheckBox, QStackedWidget)
+from PySide6.QtCore import Slot, Qt, QTimer, QSignalBlocker
 
 # For type hinting BotController
 BotController = Any
 
+# Optional BotController methods ConfigView probes for; resolved once per ConfigView instance
+_BC_CAPABILITIES = ('get_general_settings', 'get_api_keys_config', 'get_loaded_strategies_info', 'get_available_strategy_types_names',
+                    'get_strategy_default_params_by_type_name', 'save_persistent_config_async', 'update_strategy_parameters',
+                    'add_new_strategy_instance', 'remove_strategy_instance', 'save_api_keys', 'test_api_connection', 'save_general_settings')
+
+_ACTIVE_SUFFIX = ") - Active"; _INACTIVE_SUFFIX = ") - Inactive" # Strategy list row suffixes
+
+class ParamSpec(NamedTuple):
+    """One strategy parameter's metadata, resolved once per strategy type (per-type defaults already applied)."""
+    name: str
+    type: str
+    label: str
+    default: Any
+    min: Any
+    max: Any
+    step: Any
+    decimals: int
+    options: Optional[List[str]]
+    is_list_of_dict: bool
+
+def _build_param_specs(params_with_meta: Dict[str, Dict[str, Any]]) -> List[ParamSpec]:
+    specs = []
+    for name, meta in params_with_meta.items():
+        ptype = meta.get('type', 'str'); is_int = ptype == 'int'
+        options = meta.get('options'); options = options if isinstance(options, list) else None
+        specs.append(ParamSpec(name, ptype, meta.get('desc', name).replace('_',' ').title() + ":", meta.get('default'),
+                               meta.get('min', -2**31 if is_int else -1e12), meta.get('max', 2**31-1 if is_int else 1e12),
+                               meta.get('step', 1 if is_int else 0.01), meta.get('decimals', 4), options, bool(meta.get('is_list_of_dict', False))))
+    return specs
+
+def _set_password_placeholder(field: QLineEdit):
+    """Secrets are never read back from the backend; an empty field means 'keep the stored secret'."""
+    field.setEchoMode(QLineEdit.EchoMode.Password); field.setPlaceholderText("Unchanged")
+
+def _set_text_if_changed(field: QLineEdit, text: str):
+    if field.text() == text: return
+    blocker = QSignalBlocker(field); field.setText(text); blocker.unblock()
+
+# --- Param widget factories: (value, spec) -> configured input widget ---
+def _make_spin(val: Any, spec: ParamSpec) -> QWidget:
+    w = QSpinBox(); w.setRange(spec.min, spec.max); w.setSingleStep(spec.step); w.setValue(int(val) if val is not None else 0)
+    return w
+
+def _make_dspin(val: Any, spec: ParamSpec) -> QWidget:
+    w = QDoubleSpinBox(); w.setRange(spec.min, spec.max); w.setSingleStep(spec.step); w.setDecimals(spec.decimals); w.setValue(float(val) if val is not None else 0.0)
+    return w
+
+def _make_check(val: Any, spec: ParamSpec) -> QWidget:
+    w = QCheckBox(); w.setChecked(bool(val) if val is not None else False)
+    return w
+
+def _make_combo(val: Any, spec: ParamSpec) -> QWidget:
+    w = QComboBox(); w.addItems(spec.options); w.setCurrentText(str(val) if val is not None else "")
+    return w
+
+def _make_line(val: Any, spec: ParamSpec) -> QWidget:
+    w = QLineEdit(); w.setText(str(val) if val is not None else "")
+    return w
+
+def _make_str(val: Any, spec: ParamSpec) -> QWidget:
+    return _make_combo(val, spec) if spec.options is not None else _make_line(val, spec)
+
+_WIDGET_FACTORIES: Dict[str, Callable[[Any, ParamSpec], QWidget]] = {'int': _make_spin, 'float': _make_dspin, 'bool': _make_check, 'str': _make_str}
+
+# Widget class -> raw value reader (exact type lookup; the param widgets are never subclassed)
+_WIDGET_READERS: Dict[type, Callable[[QWidget], Any]] = {
+    QLineEdit: lambda w: w.text(), QSpinBox: lambda w: w.value(), QDoubleSpinBox: lambda w: w.value(),
+    QCheckBox: lambda w: w.isChecked(), QComboBox: lambda w: w.currentText(),
+}
+
+_TEXT_CONVERTERS: Dict[str, Callable[[str], Any]] = {'int': int, 'float': float} # Only applied to QLineEdit-backed numeric params
+
+# Widget class -> value writer, used when a pooled widget is reused (range/decimals/options are already configured)
+_WIDGET_WRITERS: Dict[type, Callable[[QWidget, Any], None]] = {
+    QLineEdit: lambda w, v: w.setText(str(v) if v is not None else ""),
+    QSpinBox: lambda w, v: w.setValue(int(v) if v is not None else 0),
+    QDoubleSpinBox: lambda w, v: w.setValue(float(v) if v is not None else 0.0),
+    QCheckBox: lambda w, v: w.setChecked(bool(v) if v is not None else False),
+    QComboBox: lambda w, v: w.setCurrentText(str(v) if v is not None else ""),
+}
+
 class ConfigView(QWidget):
     def __init__(self, backend_controller: Optional[BotController] = None, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.backend_controller = backend_controller
+        self._bc_caps: Dict[str, bool] = {name: hasattr(backend_controller, name) for name in _BC_CAPABILITIES} # All False when no backend
         self.logger = getattr(backend_controller, 'logger', logging.getLogger('algo_trader_bot')).getChild("ConfigView") # Get child logger
 
-        self.param_input_widgets: Dict[str, QWidget] = {}
+        self.param_input_widgets: Dict[str, Tuple[QWidget, ParamSpec]] = {}
         self.current_editing_strategy_id: Optional[str] = None
         self.current_editing_strategy_type_name: Optional[str] = None
-        self.current_strategy_params_meta: Optional[Dict[str, Any]] = None
+        self.current_strategy_params_meta: Optional[List[ParamSpec]] = None
+        self._params_meta_cache: Dict[str, List[ParamSpec]] = {} # type_name -> param specs; static for the process lifetime
+        self._strategy_types_cache: Optional[Tuple[str, ...]] = None # Available strategy type names, fetched once
+        self._last_populated_key: Optional[Tuple[str, str, Dict[str, Any]]] = None # (strategy_id, type_name, params) currently in the form
+        self._widget_pool: Dict[Tuple[str, str], QWidget] = {} # (type_name, param_name) -> detached input widget for reuse
+        self._refresh_scheduled = False # Coalesces list refreshes requested within one event-loop pass
+        self._pending_tasks: Set[asyncio.Task] = set() # Strong refs so in-flight handler tasks aren't garbage-collected
 
         self._init_ui()
         self._connect_signals()
@@ -35,11 +124,11 @@ class ConfigView(QWidget):
         api_keys_group = QGroupBox("API Configuration")
         api_keys_form_layout = QFormLayout(api_keys_group)
         self.testnet_api_key_input = QLineEdit()
-        self.testnet_api_secret_input = QLineEdit(); self.testnet_api_secret_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.testnet_api_secret_input = QLineEdit(); _set_password_placeholder(self.testnet_api_secret_input)
         api_keys_form_layout.addRow("Testnet API Key:", self.testnet_api_key_input)
         api_keys_form_layout.addRow("Testnet API Secret:", self.testnet_api_secret_input)
         self.mainnet_api_key_input = QLineEdit()
-        self.mainnet_api_secret_input = QLineEdit(); self.mainnet_api_secret_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.mainnet_api_secret_input = QLineEdit(); _set_password_placeholder(self.mainnet_api_secret_input)
         api_keys_form_layout.addRow("Mainnet API Key:", self.mainnet_api_key_input)
         api_keys_form_layout.addRow("Mainnet API Secret:", self.mainnet_api_secret_input)
         api_buttons_layout = QHBoxLayout()
@@ -71,6 +160,8 @@ class ConfigView(QWidget):
         loaded_strategies_group = QGroupBox("Strategies Instances")
         loaded_strat_layout = QVBoxLayout(loaded_strategies_group)
         self.loaded_strategies_list = QListWidget(); loaded_strat_layout.addWidget(self.loaded_strategies_list)
+        self.loaded_strategies_list.setUniformItemSizes(True) # Single-line rows: lets the view skip per-item size hints
+        self.loaded_strategies_list.setLayoutMode(QListView.LayoutMode.Batched); self.loaded_strategies_list.setBatchSize(50)
         strat_buttons_layout = QHBoxLayout()
         self.edit_strategy_button = QPushButton("View/Edit"); strat_buttons_layout.addWidget(self.edit_strategy_button)
         self.remove_strategy_button = QPushButton("Remove"); strat_buttons_layout.addWidget(self.remove_strategy_button)
@@ -84,6 +175,19 @@ class ConfigView(QWidget):
         left_panel_layout.addWidget(add_strategy_group); left_panel_layout.addStretch(1)
         self.strategy_splitter.addWidget(left_panel_widget)
 
+        # Right panel: a cheap placeholder until a strategy/type is first selected (see _ensure_details_panel)
+        self.details_stack = QStackedWidget(); self._details_built = False
+        self.details_placeholder_label = QLabel("Select or add strategy."); self.details_placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.details_stack.addWidget(self.details_placeholder_label)
+        self.strategy_splitter.addWidget(self.details_stack)
+        self.strategy_splitter.setSizes([350, 650])
+
+        config_tab_main_layout.addWidget(self.strategy_splitter)
+        self.setLayout(config_tab_main_layout)
+
+    def _ensure_details_panel(self):
+        """Builds the strategy params panel on first use and shows it in place of the placeholder."""
+        if self._details_built: return
         right_panel_widget = QWidget(); right_panel_layout = QVBoxLayout(right_panel_widget)
         self.details_group_box = QGroupBox("Strategy Parameters")
         details_main_layout = QVBoxLayout(self.details_group_box)
@@ -96,11 +200,9 @@ class ConfigView(QWidget):
         self.strategy_params_form_layout = QFormLayout(self.strategy_params_widget)
         self.strategy_params_scroll_area.setWidget(self.strategy_params_widget)
         details_main_layout.addWidget(self.strategy_params_scroll_area); right_panel_layout.addWidget(self.details_group_box)
-        self.strategy_splitter.addWidget(right_panel_widget)
-        self.strategy_splitter.setSizes([350, 650])
-
-        config_tab_main_layout.addWidget(self.strategy_splitter)
-        self.setLayout(config_tab_main_layout)
+        self.save_strategy_params_button.clicked.connect(self.handle_save_strategy_params)
+        self.details_stack.addWidget(right_panel_widget); self.details_stack.setCurrentIndex(1)
+        self._details_built = True
 
     def _connect_signals(self):
         self.save_api_keys_button.clicked.connect(self.handle_save_api_keys)
@@ -110,7 +212,6 @@ class ConfigView(QWidget):
         self.loaded_strategies_list.currentItemChanged.connect(self.on_loaded_strategy_selected)
         self.edit_strategy_button.clicked.connect(self.on_edit_strategy_button_clicked)
         self.remove_strategy_button.clicked.connect(self.handle_remove_strategy)
-        self.save_strategy_params_button.clicked.connect(self.handle_save_strategy_params)
         self.new_strategy_type_combo.currentIndexChanged.connect(self.handle_new_strategy_type_selected_for_defaults)
         self.add_new_strategy_button.clicked.connect(self.handle_add_new_strategy)
 
@@ -119,40 +220,90 @@ class ConfigView(QWidget):
         self.config_status_label.setText("")
         if not self.backend_controller: self.logger.warning("BC not available for config load."); self.config_status_label.setText("Err: Backend N/A"); return
         try:
-            if hasattr(self.backend_controller, 'get_general_settings'):
+            if self._bc_caps['get_general_settings']:
                 settings = self.backend_controller.get_general_settings(); self.log_level_combo.setCurrentText(settings.get('log_level', 'INFO'))
-            if hasattr(self.backend_controller, 'get_api_keys_config'):
+            if self._bc_caps['get_api_keys_config']:
                 api_keys_conf = self.backend_controller.get_api_keys_config()
-                self.testnet_api_key_input.setText(api_keys_conf.get('testnet_key', '')); self.testnet_api_secret_input.setPlaceholderText("Unchanged")
-                self.mainnet_api_key_input.setText(api_keys_conf.get('mainnet_key', '')); self.mainnet_api_secret_input.setPlaceholderText("Unchanged")
-            self.refresh_loaded_strategies_list(); self.populate_new_strategy_types_combo()
+                _set_text_if_changed(self.testnet_api_key_input, api_keys_conf.get('testnet_key', ''))
+                _set_text_if_changed(self.mainnet_api_key_input, api_keys_conf.get('mainnet_key', ''))
+            self.clear_params_meta_cache(); self.refresh_loaded_strategies_list(); self.populate_new_strategy_types_combo()
             self.clear_params_form("Select strategy or add new.")
             self.logger.info("Initial config loaded into ConfigView.")
         except Exception as e: self.logger.error(f"Error loading initial config: {e}", exc_info=True); self.config_status_label.setText(f"Error: {e}")
 
+    def _spawn(self, coro: Coroutine) -> Optional[asyncio.Task]:
+        """Runs a handler coroutine on the running loop, keeping a reference until it finishes."""
+        try: task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError: self.logger.warning("No running event loop; backend action skipped."); coro.close(); return None
+        self._pending_tasks.add(task); task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task):
+        self._pending_tasks.discard(task)
+        if not task.cancelled() and task.exception(): self.logger.error(f"ConfigView task failed: {task.exception()}", exc_info=task.exception())
+
+    def _schedule_refresh(self):
+        if not self._refresh_scheduled: self._refresh_scheduled = True; QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_scheduled = False; self.refresh_loaded_strategies_list()
+
     def refresh_loaded_strategies_list(self):
         # ... (same as before)
-        self.loaded_strategies_list.clear()
-        if self.backend_controller and hasattr(self.backend_controller, 'get_loaded_strategies_info'):
+        # Diff-update instead of clear()+refill: unchanged rows (and the current selection) are left untouched
+        if not self._bc_caps['get_loaded_strategies_info']: self.loaded_strategies_list.clear(); return
+        try:
+            strategies_info = self.backend_controller.get_loaded_strategies_info()
+            desired = {sid: sid + " (" + info.get('type_name', 'Unknown') + (_ACTIVE_SUFFIX if info.get('is_active') else _INACTIVE_SUFFIX) for sid, info in strategies_info.items()}
+            lst = self.loaded_strategies_list; existing = set(); prev_current = lst.currentItem()
+            blocker = QSignalBlocker(lst) # No currentItemChanged per removed row; re-notified once below if the current row changed
             try:
-                strategies_info = self.backend_controller.get_loaded_strategies_info()
-                for strategy_id, info in strategies_info.items():
-                    item_text = f"{strategy_id} ({info.get('type_name', 'Unknown')}) - {'Active' if info.get('is_active') else 'Inactive'}"
-                    list_item = QListWidgetItem(item_text); list_item.setData(Qt.ItemDataRole.UserRole, strategy_id)
-                    self.loaded_strategies_list.addItem(list_item)
-            except Exception as e: self.logger.error(f"Error refreshing strategies list: {e}", exc_info=True)
+                for row in range(lst.count() - 1, -1, -1): # Reverse so takeItem() doesn't shift rows still to visit
+                    item = lst.item(row); sid = item.data(Qt.ItemDataRole.UserRole)
+                    text = desired.get(sid)
+                    if text is None: lst.takeItem(row); continue
+                    if item.text() != text: item.setText(text)
+                    existing.add(sid)
+                for sid, text in desired.items():
+                    if sid in existing: continue
+                    list_item = QListWidgetItem(text); list_item.setData(Qt.ItemDataRole.UserRole, sid)
+                    lst.addItem(list_item)
+            finally: blocker.unblock()
+            if lst.currentItem() is not prev_current: self.on_loaded_strategy_selected(lst.currentItem(), prev_current)
+        except Exception as e: self.logger.error(f"Error refreshing strategies list: {e}", exc_info=True)
+
+    def _get_params_meta(self, type_name: str) -> Optional[List[ParamSpec]]:
+        """Param specs for a strategy type, fetched from the backend and converted once per type_name."""
+        specs = self._params_meta_cache.get(type_name)
+        if specs is None:
+            meta = self.backend_controller.get_strategy_default_params_by_type_name(type_name) # type: ignore
+            if not meta: return None # Don't cache misses, so a later call can still succeed
+            specs = self._params_meta_cache[type_name] = _build_param_specs(meta)
+        return specs
+
+    def clear_params_meta_cache(self):
+        self._params_meta_cache.clear()
+        for w in self._widget_pool.values(): w.deleteLater() # Pooled widgets were configured from the old metadata
+        self._widget_pool.clear()
 
     def populate_new_strategy_types_combo(self):
         # ... (same as before)
-        self.new_strategy_type_combo.clear(); self.new_strategy_type_combo.addItem("")
-        if self.backend_controller and hasattr(self.backend_controller, 'get_available_strategy_types_names'):
-            try: types = self.backend_controller.get_available_strategy_types_names(); self.new_strategy_type_combo.addItems(types)
+        if self._strategy_types_cache is None and self._bc_caps['get_available_strategy_types_names']:
+            try: self._strategy_types_cache = tuple(self.backend_controller.get_available_strategy_types_names())
             except Exception as e: self.logger.error(f"Error populating strategy types: {e}", exc_info=True)
+        wanted = ("",) + (self._strategy_types_cache or ())
+        combo = self.new_strategy_type_combo
+        if tuple(combo.itemText(i) for i in range(combo.count())) == wanted: return # Unchanged: keep the current selection
+        combo.clear(); combo.addItems(wanted)
+
+    def invalidate_strategy_types_cache(self):
+        """For when strategy types are registered at runtime; the next populate re-queries the backend."""
+        self._strategy_types_cache = None; self.populate_new_strategy_types_combo()
 
     def on_edit_strategy_button_clicked(self):
         # ... (same as before)
         current_item = self.loaded_strategies_list.currentItem()
-        if current_item: self.on_loaded_strategy_selected(current_item, None)
+        if current_item: self._last_populated_key = None; self.on_loaded_strategy_selected(current_item, None) # Explicit View/Edit always reloads (discards edits)
         else: QMessageBox.information(self, "Edit", "Select a strategy to edit."); self.clear_params_form("Select strategy to edit.")
 
     def on_loaded_strategy_selected(self, current_item: Optional[QListWidgetItem], previous_item: Optional[QListWidgetItem]):
@@ -163,8 +314,11 @@ class ConfigView(QWidget):
             strategies_info = self.backend_controller.get_loaded_strategies_info()
             strategy_info = strategies_info.get(strategy_id)
             if not strategy_info: self.clear_params_form(f"Err: No info for {strategy_id}."); return
-            type_name = strategy_info.get('type_name', 'Unknown'); params_meta = self.backend_controller.get_strategy_default_params_by_type_name(type_name)
-            self.populate_params_form(params_meta, current_values=strategy_info.get('params',{}), editing_id=strategy_id, type_name=type_name)
+            type_name = strategy_info.get('type_name', 'Unknown'); params = strategy_info.get('params',{})
+            key = (strategy_id, type_name, params)
+            if key == self._last_populated_key: return # Same strategy and values already in the form
+            self.populate_params_form(self._get_params_meta(type_name), current_values=params, editing_id=strategy_id, type_name=type_name)
+            if self.param_input_widgets: self._last_populated_key = (strategy_id, type_name, dict(params)) # Copy: the backend may mutate its dict in place
         except Exception as e: self.logger.error(f"Err selecting strategy {strategy_id}: {e}", exc_info=True); self.clear_params_form(f"Err loading {strategy_id}")
 
     def handle_new_strategy_type_selected_for_defaults(self):
@@ -172,77 +326,75 @@ class ConfigView(QWidget):
         strategy_type_name = self.new_strategy_type_combo.currentText()
         if not strategy_type_name or not self.backend_controller: self.clear_params_form("Select type for defaults."); return
         try:
-            params_meta = self.backend_controller.get_strategy_default_params_by_type_name(strategy_type_name)
+            params_meta = self._get_params_meta(strategy_type_name)
             self.populate_params_form(params_meta, editing_id=None, type_name=strategy_type_name)
             self.new_strategy_id_input.setFocus()
         except Exception as e: self.logger.error(f"Err loading defaults for {strategy_type_name}: {e}", exc_info=True); self.clear_params_form(f"Err loading defaults for {strategy_type_name}")
 
     def clear_params_form(self, message: str):
         # ... (same as before)
-        while self.strategy_params_form_layout.count():
-            item = self.strategy_params_form_layout.takeAt(0); widget = item.widget()
-            if widget: widget.deleteLater()
-        self.param_input_widgets.clear(); self.current_editing_strategy_id=None; self.current_editing_strategy_type_name=None
-        self.current_strategy_params_meta=None; self.current_editing_label.setText(message); self.save_strategy_params_button.setVisible(False)
+        for name, (w, _) in self.param_input_widgets.items(): # Detach inputs into the pool before the old form subtree is deleted
+            w.setParent(None); self._widget_pool[(self.current_editing_strategy_type_name, name)] = w
+        self.param_input_widgets.clear(); self._last_populated_key = None; self.current_editing_strategy_id=None; self.current_editing_strategy_type_name=None; self.current_strategy_params_meta=None
+        if not self._details_built: self.details_placeholder_label.setText(message); return
+        if self.strategy_params_form_layout.count(): # Swap in a fresh form widget; setWidget() deletes the old subtree in one go
+            self.strategy_params_widget = QWidget(); self.strategy_params_form_layout = QFormLayout(self.strategy_params_widget)
+            self.strategy_params_scroll_area.setWidget(self.strategy_params_widget)
+        self.current_editing_label.setText(message); self.save_strategy_params_button.setVisible(False)
 
-    def populate_params_form(self, params_with_meta: Optional[Dict[str, Any]], current_values: Optional[Dict[str, Any]] = None, editing_id: Optional[str] = None, type_name: str = ""):
+    def populate_params_form(self, param_specs: Optional[List[ParamSpec]], current_values: Optional[Dict[str, Any]] = None, editing_id: Optional[str] = None, type_name: str = ""):
         # ... (same as before)
-        self.clear_params_form("")
-        if not params_with_meta: self.current_editing_label.setText(f"No param definition for '{type_name}'."); return
-        self.current_editing_strategy_id=editing_id; self.current_editing_strategy_type_name=type_name; self.current_strategy_params_meta = params_with_meta
+        self._ensure_details_panel(); self.clear_params_form("")
+        if not param_specs: self.current_editing_label.setText(f"No param definition for '{type_name}'."); return
+        self.current_editing_strategy_id=editing_id; self.current_editing_strategy_type_name=type_name; self.current_strategy_params_meta = param_specs
         self.details_group_box.setTitle(f"Params for '{editing_id}' ({type_name})" if editing_id else f"Defaults for New '{type_name}'")
         self.current_editing_label.setText(f"Editing: {editing_id}" if editing_id else f"New: {type_name} (Defaults Loaded)")
-        for name, meta in params_with_meta.items():
-            val = current_values.get(name, meta.get('default')) if current_values else meta.get('default')
-            lbl_text = meta.get('desc', name).replace('_',' ').title(); lbl = QLabel(lbl_text+":")
-            w: QWidget; ptype = meta.get('type','str')
-            if ptype=='int': w=QSpinBox(); w.setRange(meta.get('min',-2**31),meta.get('max',2**31-1)); w.setSingleStep(meta.get('step',1)); w.setValue(int(val) if val is not None else 0)
-            elif ptype=='float': w=QDoubleSpinBox(); w.setRange(meta.get('min',-1e12),meta.get('max',1e12)); w.setSingleStep(meta.get('step',0.01)); w.setDecimals(meta.get('decimals',4)); w.setValue(float(val) if val is not None else 0.0)
-            elif ptype=='bool': w=QCheckBox(); w.setChecked(bool(val) if val is not None else False)
-            elif ptype=='str' and 'options' in meta and isinstance(meta['options'],list): w=QComboBox(); w.addItems(meta['options']); w.setCurrentText(str(val) if val is not None else "")
-            else: w=QLineEdit(); w.setText(str(val) if val is not None else "")
-            self.strategy_params_form_layout.addRow(lbl,w); self.param_input_widgets[name]=w
+        form_widget = self.strategy_params_widget; form_widget.setUpdatesEnabled(False) # One layout/repaint for the whole form instead of one per row
+        try:
+            for spec in param_specs:
+                name = spec.name
+                val = current_values.get(name, spec.default) if current_values else spec.default
+                if spec.is_list_of_dict and val is not None and not isinstance(val, str): val = json.dumps(val) # Edited as JSON text
+                w = self._widget_pool.pop((type_name, name), None)
+                if w is not None: blocker = QSignalBlocker(w); _WIDGET_WRITERS[type(w)](w, val); blocker.unblock() # Reused widget: no valueChanged for the reset
+                else: w = _WIDGET_FACTORIES.get(spec.type, _make_line)(val, spec)
+                self.strategy_params_form_layout.addRow(QLabel(spec.label), w); self.param_input_widgets[name] = (w, spec)
+        finally: form_widget.setUpdatesEnabled(True)
         self.save_strategy_params_button.setVisible(bool(editing_id))
 
     def _get_params_from_form(self) -> Optional[Dict[str, Any]]:
         # ... (same as before)
         if not self.current_strategy_params_meta: return None
-        params: Dict[str,Any]={};
-        try:
-            for name,widget in self.param_input_widgets.items():
-                meta=self.current_strategy_params_meta.get(name,{}); ptype=meta.get('type','str')
-                val: Any = None
-                if isinstance(widget,QLineEdit): val=widget.text()
-                elif isinstance(widget,QSpinBox): val=widget.value()
-                elif isinstance(widget,QDoubleSpinBox): val=widget.value()
-                elif isinstance(widget,QCheckBox): val=widget.isChecked()
-                elif isinstance(widget,QComboBox): val=widget.currentText()
-                if meta.get('is_list_of_dict', False): # Handle list of dicts (e.g. DCA safety_orders)
-                    try: params[name] = json.loads(val) if isinstance(val, str) else val # Expects JSON string
-                    except json.JSONDecodeError: self.logger.error(f"Invalid JSON for {name}: {val}"); params[name] = meta.get('default', [])
-                elif ptype=='int': params[name]=int(val) if val is not None else meta.get('default',0)
-                elif ptype=='float': params[name]=float(val) if val is not None else meta.get('default',0.0)
-                elif ptype=='bool': params[name]=bool(val) if val is not None else meta.get('default',False)
-                else: params[name]=str(val) if val is not None else meta.get('default',"")
-            return params
-        except ValueError as ve: self.logger.error(f"Type conversion error: {ve}"); QMessageBox.warning(self,"Param Error",f"Invalid value. Details: {ve}"); return None
-        except Exception as e: self.logger.error(f"Error getting params: {e}",exc_info=True); QMessageBox.critical(self,"Error",f"Could not read params: {e}"); return None
+        params: Dict[str,Any]={}
+        for name,(widget,spec) in self.param_input_widgets.items():
+            val: Any = _WIDGET_READERS[type(widget)](widget) # Spin boxes/check boxes already yield int/float/bool
+            if spec.is_list_of_dict: # Handle list of dicts (e.g. DCA safety_orders)
+                try: val = json.loads(val) if isinstance(val, str) else val # Expects JSON string
+                except json.JSONDecodeError: self.logger.error(f"Invalid JSON for {name}: {val}"); val = spec.default if spec.default is not None else []
+            elif isinstance(val, str) and spec.type in _TEXT_CONVERTERS: # Numeric param entered as free text
+                try: val = _TEXT_CONVERTERS[spec.type](val)
+                except ValueError as ve: self.logger.error(f"Type conversion error: {ve}"); QMessageBox.warning(self,"Param Error",f"Invalid value for '{name}'. Details: {ve}"); return None
+            params[name] = val
+        return params
 
     # --- Handler Methods ---
     @Slot()
     def handle_save_all_config(self):
-        if self.backend_controller and hasattr(self.backend_controller, 'save_persistent_config'):
-            self.logger.info("ConfigView: Save All Configuration button clicked.")
-            # BotController.save_persistent_config is sync
-            self.backend_controller.save_persistent_config() # type: ignore
-            QMessageBox.information(self, "Configuration", "All bot configurations saved.")
-            self.config_status_label.setText("All configurations saved.")
-        else:
-            QMessageBox.warning(self, "Error", "Backend controller not available to save all configurations.")
+        if not self._bc_caps['save_persistent_config_async']:
+            QMessageBox.warning(self, "Error", "Backend controller not available to save all configurations."); return
+        self.logger.info("ConfigView: Save All Configuration button clicked.")
+        self.save_all_config_button.setEnabled(False); self.config_status_label.setText("Saving configuration...")
+        async def do_save():
+            try: success = await self.backend_controller.save_persistent_config_async() # type: ignore
+            except Exception as e: self.logger.error(f"Error saving configuration: {e}", exc_info=True); success = False
+            finally: self.save_all_config_button.setEnabled(True)
+            if success: self.config_status_label.setText("All configurations saved."); QMessageBox.information(self, "Configuration", "All bot configurations saved.")
+            else: self.config_status_label.setText("Error saving configuration."); QMessageBox.warning(self, "Error", "Failed to save configuration.")
+        if not self._spawn(do_save()): self.save_all_config_button.setEnabled(True)
 
     # ... (other handlers: handle_save_strategy_params, handle_add_new_strategy, handle_remove_strategy,
     #      handle_save_api_keys, handle_test_api_connection, handle_save_general_settings remain largely the same,
-    #      ensure they use asyncio.create_task for async backend calls if controller methods are async)
+    #      ensure they use self._spawn for async backend calls if controller methods are async)
     @Slot()
     def handle_save_strategy_params(self):
         if not self.current_editing_strategy_id or not self.backend_controller: return
@@ -250,9 +402,9 @@ class ConfigView(QWidget):
         if updated_values is None: return
         async def do_save():
             success = await self.backend_controller.update_strategy_parameters(self.current_editing_strategy_id, updated_values) # type: ignore
-            if success: QMessageBox.information(self,"Save Params",f"Params for '{self.current_editing_strategy_id}' saved."); self.refresh_loaded_strategies_list()
+            if success: QMessageBox.information(self,"Save Params",f"Params for '{self.current_editing_strategy_id}' saved."); self._schedule_refresh()
             else: QMessageBox.warning(self,"Save Error",f"Failed to save params for '{self.current_editing_strategy_id}'.")
-        asyncio.create_task(do_save())
+        self._spawn(do_save())
     @Slot()
     def handle_add_new_strategy(self):
         if not self.backend_controller: return
@@ -262,9 +414,9 @@ class ConfigView(QWidget):
         if params_form is None: return
         async def do_add():
             success = await self.backend_controller.add_new_strategy_instance(stype, sid, params_form) # type: ignore
-            if success: QMessageBox.information(self,"Add Strategy",f"Strategy '{sid}' added."); self.refresh_loaded_strategies_list(); self.new_strategy_id_input.clear()
+            if success: QMessageBox.information(self,"Add Strategy",f"Strategy '{sid}' added."); self.clear_params_meta_cache(); self._last_populated_key = None; self._schedule_refresh(); self.new_strategy_id_input.clear()
             else: QMessageBox.warning(self,"Add Error",f"Failed to add '{sid}'.")
-        asyncio.create_task(do_add())
+        self._spawn(do_add())
     @Slot()
     def handle_remove_strategy(self):
         item = self.loaded_strategies_list.currentItem()
@@ -273,16 +425,23 @@ class ConfigView(QWidget):
         if QMessageBox.question(self,"Confirm Remove",f"Remove '{sid}'?") == QMessageBox.StandardButton.Yes:
             async def do_remove():
                 success = await self.backend_controller.remove_strategy_instance(sid) # type: ignore
-                if success: QMessageBox.information(self,"Remove",f"Strategy '{sid}' removed."); self.refresh_loaded_strategies_list(); self.clear_params_form("Select or add.")
+                if success: QMessageBox.information(self,"Remove",f"Strategy '{sid}' removed."); self.clear_params_meta_cache(); self._schedule_refresh(); self.clear_params_form("Select or add.")
                 else: QMessageBox.warning(self,"Remove Error",f"Failed to remove '{sid}'.")
-            asyncio.create_task(do_remove())
+            self._spawn(do_remove())
     @Slot()
     def handle_save_api_keys(self):
         if not self.backend_controller : QMessageBox.critical(self, "Error", "Backend N/A."); return
         tn_k=self.testnet_api_key_input.text(); tn_s=self.testnet_api_secret_input.text()
         mn_k=self.mainnet_api_key_input.text(); mn_s=self.mainnet_api_secret_input.text()
-        self.backend_controller.save_api_keys(tn_k, tn_s if tn_s else "", mn_k, mn_s if mn_s else "") # Pass empty if placeholder not cleared
-        self.config_status_label.setText("API Keys saved. Restart required."); QMessageBox.information(self, "API Keys", "API Keys saved. Restart required.")
+        self.save_api_keys_button.setEnabled(False); self.config_status_label.setText("Saving API keys...")
+        async def do_save(): # .env writes run in an executor so the GUI thread isn't blocked on disk I/O
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.backend_controller.save_api_keys, tn_k, tn_s if tn_s else "", mn_k, mn_s if mn_s else "") # type: ignore # Pass empty if placeholder not cleared
+            except Exception as e:
+                self.logger.error(f"Error saving API keys: {e}", exc_info=True); self.config_status_label.setText(f"Error saving API keys: {e}"); QMessageBox.warning(self, "API Keys", f"Failed to save API keys: {e}"); return
+            finally: self.save_api_keys_button.setEnabled(True)
+            self.config_status_label.setText("API Keys saved. Restart required."); QMessageBox.information(self, "API Keys", "API Keys saved. Restart required.")
+        if not self._spawn(do_save()): self.save_api_keys_button.setEnabled(True)
     @Slot()
     def handle_test_api_connection(self):
         if not self.backend_controller : QMessageBox.critical(self, "Error", "Backend N/A."); return
@@ -294,7 +453,7 @@ class ConfigView(QWidget):
             self.config_status_label.setText(f"Testnet: {message}");
             if success: QMessageBox.information(self, "API Test", f"Testnet: {message}")
             else: QMessageBox.warning(self, "API Test", f"Testnet: {message}")
-        asyncio.create_task(do_test())
+        self._spawn(do_test())
     @Slot()
     def handle_save_general_settings(self):
         if not self.backend_controller : QMessageBox.critical(self, "Error", "Backend N/A."); return
@@ -1,6 +1,12 @@
 # bot/ui/dashboard_view.py
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QGridLayout, QTextEdit, QGroupBox
-from PySide6.QtCore import Slot, Qt
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QGridLayout, QPlainTextEdit, QGroupBox
+from PySide6.QtCore import Slot, Qt, QTimer
+
+_LOG_MAX_LINES = 1000 # Activity log history; also bounds the pending-append buffer
 
 class DashboardView(QWidget):
     def __init__(self, backend_controller=None, parent=None): # backend_controller for future interactions
@@ -8,6 +14,14 @@ class DashboardView(QWidget):
         self.backend_controller = backend_controller
         self.logger = getattr(backend_controller, 'logger', logging.getLogger('algo_trader_bot.Dashboard')) # Get logger from backend or default
 
+        self._log_buffer: deque = deque(maxlen=_LOG_MAX_LINES) # Lines waiting for the next flush; oldest dropped beyond what the view keeps anyway
+        self._log_flush_timer = QTimer(self); self._log_flush_timer.setSingleShot(True); self._log_flush_timer.setInterval(75)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._pending_label_texts: Dict[QLabel, str] = {} # Latest text per high-rate label (balance/P&L/market), applied at <=20 Hz
+        self._label_flush_timer = QTimer(self); self._label_flush_timer.setSingleShot(True); self._label_flush_timer.setInterval(50)
+        self._label_flush_timer.timeout.connect(self._apply_pending_labels)
+        self._label_values: Dict[QLabel, tuple] = {} # Last (prefix, formatted value) requested per label
+
         self._init_ui()
         self._connect_signals_to_slots() # For UI elements connecting to backend_controller methods
         # Backend signals to UI slots will be connected in gui_launcher.py using the global signals object
@@ -36,7 +50,7 @@ class DashboardView(QWidget):
         self.main_layout.addWidget(status_control_group)
 
         # --- Financial Overview Group ---
-        financial_group = QGroupBox("Financial Overview")
+        financial_group = self.financial_group = QGroupBox("Financial Overview")
         financial_layout = QGridLayout()
 
         self.balance_label = QLabel("Balance: $0.00")
@@ -50,7 +64,7 @@ class DashboardView(QWidget):
         self.main_layout.addWidget(financial_group)
 
         # --- Market Info Group (Example for BTCUSDT) ---
-        market_info_group = QGroupBox("Market Info (BTCUSDT)")
+        market_info_group = self.market_info_group = QGroupBox("Market Info (BTCUSDT)")
         market_info_layout = QGridLayout()
 
         self.btc_price_label = QLabel("Price: $0.00")
@@ -65,8 +79,11 @@ class DashboardView(QWidget):
         # --- Activity Log ---
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout()
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit() # Plain text: appends don't relayout a rich-text document
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(_LOG_MAX_LINES) # Oldest lines are trimmed automatically
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.log_display.setFixedHeight(200) # Initial height, can be adjusted
         log_layout.addWidget(self.log_display)
         log_group.setLayout(log_layout)
@@ -78,15 +95,16 @@ class DashboardView(QWidget):
     def _connect_signals_to_slots(self):
         # Connect UI element signals (e.g., button clicks) to backend_controller methods
         if self.backend_controller:
-            if hasattr(self.backend_controller, 'start_bot_async_wrapper'):
-                self.start_bot_button.clicked.connect(self.backend_controller.start_bot_async_wrapper)
+            # start_bot/stop_bot are coroutines; schedule them on the shared QtAsyncio loop
+            if hasattr(self.backend_controller, 'start_bot'):
+                self.start_bot_button.clicked.connect(lambda: asyncio.ensure_future(self.backend_controller.start_bot()))
             else:
-                self.logger.warning("Backend controller does not have 'start_bot_async_wrapper' method.")
+                self.logger.warning("Backend controller does not have 'start_bot' method.")
 
-            if hasattr(self.backend_controller, 'stop_bot_async_wrapper'):
-                self.stop_bot_button.clicked.connect(self.backend_controller.stop_bot_async_wrapper)
+            if hasattr(self.backend_controller, 'stop_bot'):
+                self.stop_bot_button.clicked.connect(lambda: asyncio.ensure_future(self.backend_controller.stop_bot()))
             else:
-                self.logger.warning("Backend controller does not have 'stop_bot_async_wrapper' method.")
+                self.logger.warning("Backend controller does not have 'stop_bot' method.")
         else:
             self.logger.warning("DashboardView initialized without a backend_controller. UI buttons will not function.")
 
@@ -98,42 +116,68 @@ class DashboardView(QWidget):
         is_running = status_message.lower() == "running" # Example condition
         self.start_bot_button.setEnabled(not is_running)
         self.stop_bot_button.setEnabled(is_running)
-        self.logger.debug(f"Dashboard status updated: {status_message}")
+        self.logger.debug("Dashboard status updated: %s", status_message) # Lazy %-format: nothing built unless DEBUG
 
     @Slot(str)
     def update_api_connection_display(self, status: str):
         self.api_connection_label.setText(f"API Connection: {status}")
-        self.logger.debug(f"Dashboard API connection updated: {status}")
+        self.logger.debug("Dashboard API connection updated: %s", status)
 
     @Slot(dict) # Expecting a dict like {'asset': 'USDT', 'total': 1000.0} or just a float
     def update_balance_display(self, balance_data: Any): # Changed to Any to be flexible
         if isinstance(balance_data, dict): # More detailed balance
             usdt_balance = balance_data.get('USDT', {}).get('total', 0.0) # Example structure
-            self.balance_label.setText(f"Balance (USDT): ${float(usdt_balance):.2f}")
+            self._set_label_value(self.balance_label, "Balance (USDT): $", format(float(usdt_balance), '.2f'))
         elif isinstance(balance_data, (float, int)): # Simple total balance
-            self.balance_label.setText(f"Balance: ${float(balance_data):.2f}")
+            self._set_label_value(self.balance_label, "Balance: $", format(float(balance_data), '.2f'))
         else:
             self.logger.warning(f"Received balance_data in unexpected format: {balance_data}")
 
 
     @Slot(float)
     def update_total_pnl_display(self, total_pnl: float):
-        self.pnl_total_label.setText(f"Total Realized P&L: ${total_pnl:.2f}")
+        self._set_label_value(self.pnl_total_label, "Total Realized P&L: $", format(total_pnl, '.2f'))
 
     @Slot(float)
     def update_open_pnl_display(self, open_pnl: float):
-        self.pnl_open_label.setText(f"Open P&L: ${open_pnl:.2f}")
+        self._set_label_value(self.pnl_open_label, "Open P&L: $", format(open_pnl, '.2f'))
 
-    @Slot(str, dict) # For market_data_updated signal (symbol, data_dict)
-    def update_market_data_display(self, symbol: str, data: dict):
+    @Slot(str, float, float) # For market_data_updated signal (symbol, price, change_pct)
+    def update_market_data_display(self, symbol: str, price: float, change_pct: float):
         if symbol == "BTCUSDT": # Example specific update
-            self.btc_price_label.setText(f"Price: ${data.get('price', 'N/A')}")
-            self.btc_change_label.setText(f"24h Change: {data.get('change', 'N/A')}")
+            self._set_label_value(self.btc_price_label, "Price: $", format(price, '.2f'))
+            self._set_label_value(self.btc_change_label, "24h Change: ", format(change_pct, '+.2f') + "%")
         # Could be extended for a table or dynamic labels if more symbols are shown
 
+    def _set_label_value(self, label: QLabel, prefix: str, value: str):
+        """Skips ticks whose formatted value (and prefix) match the last one requested for this label."""
+        key = (prefix, value)
+        if self._label_values.get(label) == key: return
+        self._label_values[label] = key; self._set_label_deferred(label, prefix + value)
+
+    def _set_label_deferred(self, label: QLabel, text: str):
+        self._pending_label_texts[label] = text # Later ticks overwrite earlier ones before the flush
+        if not self._label_flush_timer.isActive(): self._label_flush_timer.start()
+
+    def _apply_pending_labels(self):
+        pending = self._pending_label_texts; self._pending_label_texts = {}
+        groups = (self.financial_group, self.market_info_group) # Parents of every deferred label
+        for group in groups: group.setUpdatesEnabled(False) # One repaint per group for the whole flush
+        try:
+            for label, text in pending.items():
+                if label.text() != text: label.setText(text) # Unchanged text: skip the relayout
+        finally:
+            for group in groups: group.setUpdatesEnabled(True) # Re-enabling schedules the repaint
+
     @Slot(str)
     def append_log_message(self, message: str):
-        self.log_display.append(message)
+        self._log_buffer.append(message) # Batched: one appendPlainText per flush instead of one layout per line
+        if not self._log_flush_timer.isActive(): self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buffer: return
+        text = "\n".join(self._log_buffer); self._log_buffer.clear()
+        self.log_display.appendPlainText(text)
         # Optional: Auto-scroll to the bottom
         # self.log_display.verticalScrollBar().setValue(self.log_display.verticalScrollBar().maximum())
 
@@ -141,7 +185,6 @@ class DashboardView(QWidget):
 if __name__ == '__main__':
     import sys
     from PySide6.QtWidgets import QApplication
-    import logging # Import logging for the test
 
     logging.basicConfig(level=logging.DEBUG) # Basic logger for test
 
@@ -152,23 +195,23 @@ if __name__ == '__main__':
         status_updated = Signal(str)
         log_message_appended = Signal(str)
         balance_updated = Signal(float) # Simplified for test
-        market_data_updated = Signal(str, dict)
+        market_data_updated = Signal(str, float, float)
 
         def __init__(self):
             super().__init__()
             self.logger = logging.getLogger('algo_trader_bot.DummyBackend') # For test
 
-        def start_bot_async_wrapper(self):
+        async def start_bot(self):
             self.logger.info("Dummy Start Bot called")
             self.status_updated.emit("Simulating Start...")
             self.log_message_appended.emit("Attempting to start bot (simulated).")
             # Simulate some updates
             self.balance_updated.emit(9950.75)
-            self.market_data_updated.emit("BTCUSDT", {"price": "29500.00", "change": "+0.50%"})
+            self.market_data_updated.emit("BTCUSDT", 29500.0, 0.5)
             self.status_updated.emit("Running (Simulated)")
 
 
-        def stop_bot_async_wrapper(self):
+        async def stop_bot(self):
             self.logger.info("Dummy Stop Bot called")
             self.status_updated.emit("Simulating Stop...")
             self.log_message_appended.emit("Attempting to stop bot (simulated).")
@@ -194,9 +237,10 @@ if __name__ == '__main__':
     dummy_backend.status_updated.emit("Initializing...")
     dummy_backend.log_message_appended.emit("Dashboard test started.")
     dummy_backend.balance_updated.emit(10000.0)
-    dummy_backend.market_data_updated.emit("BTCUSDT", {"price": "29000.00", "change": "-1.20%"})
+    dummy_backend.market_data_updated.emit("BTCUSDT", 29000.0, -1.2)
 
 
-    sys.exit(app.exec())
+    import PySide6.QtAsyncio as QtAsyncio
+    QtAsyncio.run(keep_running=True) # Runs the Qt event loop as the asyncio loop so the async button slots work
 
 ```
@@ -0,0 +1,62 @@
+"""
+Single-pass indicator kernels for ChartView over contiguous float64 close arrays.
+NaN marks the warm-up region, matching pandas rolling(min_periods=n).mean() / ewm(adjust=False, min_periods=...).mean().
+"""
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError: # Optional: without numba the kernels below run as plain Python loops
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs: return args[0]
+        return lambda f: f
+
+
+# fastmath without 'nnan'/'ninf': the outputs deliberately carry NaN (warm-up), so NaN/inf semantics must be kept
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Explicit signatures compile eagerly at import (and are cached on disk), so the first chart draw doesn't pay the JIT cost.
+# nogil: the loops release the GIL, so WS/asyncio threads keep running while a full pass computes.
+@njit('float64[::1](float64[::1], int64)', cache=True, nogil=True, fastmath=_FASTMATH)
+def sma_kernel(x, period):
+    out = np.full(x.shape[0], np.nan)
+    acc = 0.0
+    for i in range(x.shape[0]):
+        acc += x[i]
+        if i >= period: acc -= x[i - period]
+        if i >= period - 1: out[i] = acc / period
+    return out
+
+@njit('float64[::1](float64[::1], int64)', cache=True, nogil=True, fastmath=_FASTMATH)
+def ema_kernel(x, period):
+    out = np.full(x.shape[0], np.nan)
+    alpha = 2.0 / (period + 1.0) # span -> alpha
+    y = 0.0
+    for i in range(x.shape[0]):
+        y = x[i] if i == 0 else (1.0 - alpha) * y + alpha * x[i]
+        if i >= period - 1: out[i] = y
+    return out
+
+@njit('Tuple((float64[::1], float64, float64))(float64[::1], int64)', cache=True, nogil=True, fastmath=_FASTMATH)
+def rsi_kernel(x, period):
+    """Returns (rsi, avg_gain, avg_loss); the averages are those before the last bar, so a live tick can redo just that bar."""
+    out = np.full(x.shape[0], np.nan)
+    com = max(1, period - 1)
+    alpha = 1.0 / (1.0 + com) # Wilder-style smoothing as ewm(com=period-1, adjust=False)
+    avg_gain = 0.0; avg_loss = 0.0
+    prev_gain = 0.0; prev_loss = 0.0
+    for i in range(x.shape[0]):
+        if i == x.shape[0] - 1: prev_gain = avg_gain; prev_loss = avg_loss
+        delta = x[i] - x[i - 1] if i > 0 else 0.0
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+        avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+        if i >= com - 1: out[i] = 100.0 - 100.0 / (1.0 + avg_gain / (avg_loss + 1e-9))
+    return out, prev_gain, prev_loss
+
+def wilder_step(avg_gain: float, avg_loss: float, delta: float, period: int) -> Tuple[float, float]:
+    """One bar of the rsi_kernel recurrence (O(1) live-tick path)."""
+    alpha = 1.0 / (1.0 + max(1, period - 1))
+    return (1.0 - alpha) * avg_gain + alpha * max(delta, 0.0), (1.0 - alpha) * avg_loss + alpha * max(-delta, 0.0)
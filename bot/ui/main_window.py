@@ -2,7 +2,7 @@ import sys
 import logging
 from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget, QLabel, QMessageBox
 from PySide6.QtCore import Slot, QMetaObject, Qt, Signal as PySideSignal
-from typing import Any, Optional
+from typing import Any, Optional, Callable, Dict, Tuple
 
 try:
     from .dashboard_view import DashboardView
@@ -24,6 +24,42 @@ except ImportError as e:
     signals = MockSignals() # type: ignore
 
 
+# Backend signal -> view slot wiring, keyed by MainWindow attribute (None = MainWindow's own slots)
+_SIGNAL_WIRING: Dict[Optional[str], Tuple[Tuple[str, str], ...]] = {
+    'dashboard_view': (
+        ('status_updated', 'update_status_display'),
+        ('api_connection_updated', 'update_api_connection_display'),
+        ('balance_updated', 'update_balance_display'),
+        ('total_pnl_updated', 'update_total_pnl_display'),
+        ('open_pnl_updated', 'update_open_pnl_display'),
+        ('market_data_updated', 'update_market_data_display'),
+        ('log_message_appended', 'append_log_message'),
+    ),
+    'orders_positions_view': (
+        ('open_orders_updated', 'populate_open_orders_table'),
+        ('trade_history_updated', 'populate_trade_history_table'),
+        ('positions_updated', 'populate_positions_table'),
+    ),
+    'backtest_view': (
+        ('backtest_progress_updated', 'update_progress_bar'),
+        ('backtest_log_message', 'append_backtest_log'),
+        ('backtest_summary_results_ready', 'display_backtest_results'), # Summary metrics
+        ('backtest_trades_ready', 'display_simulated_trades'), # Trades table
+        ('backtest_equity_curve_ready', 'plot_equity_curve'), # Equity curve
+    ),
+    'chart_view': (
+        ('live_kline_tick', 'handle_live_kline_tick'),
+        ('live_kline_closed', 'handle_live_kline_closed'),
+        ('chart_new_trade_markers_batch', 'handle_new_trade_markers_batch'),
+        ('chart_position_update', 'handle_position_update_for_chart'),
+    ),
+    None: (
+        ('error_dialog_requested', 'show_error_dialog'),
+        ('status_bar_message_updated', 'show_status_bar_message'),
+    ),
+}
+
+
 class MainWindow(QMainWindow):
     logger = logging.getLogger('algo_trader_bot.MainWindow')
     aboutToClose = PySideSignal()
@@ -41,69 +77,55 @@ class MainWindow(QMainWindow):
         self.dashboard_view = DashboardView(backend_controller=self.backend_controller)
         self.tab_widget.addTab(self.dashboard_view, "Dashboard")
 
-        self.config_view = ConfigView(backend_controller=self.backend_controller)
-        self.tab_widget.addTab(self.config_view, "Settings")
-
-        self.orders_positions_view = OrdersAndPositionsView(backend_controller=self.backend_controller)
-        self.tab_widget.addTab(self.orders_positions_view, "Orders & Positions")
-
-        self.chart_view = ChartView(backend_controller=self.backend_controller) # Create ChartView
-        self.tab_widget.addTab(self.chart_view, "Chart") # Add ChartView tab
-
-        self.backtest_view = BacktestView(backend_controller=self.backend_controller) # Create BacktestView
-        self.tab_widget.addTab(self.backtest_view, "Backtesting") # Add BacktestView tab
+        # Other tabs start as empty placeholders; each view is built the first time its tab is shown
+        self._lazy_tabs: Dict[int, Tuple[str, Callable[..., QWidget]]] = {}
+        for attr, title, factory in (('config_view', "Settings", ConfigView), ('orders_positions_view', "Orders & Positions", OrdersAndPositionsView),
+                                     ('chart_view', "Chart", ChartView), ('backtest_view', "Backtesting", BacktestView)):
+            setattr(self, attr, None)
+            self._lazy_tabs[self.tab_widget.addTab(QWidget(), title)] = (attr, factory)
+        self._initial_data_requested = False # Set once the backend is ready; views built afterwards load their data on creation
+        self.tab_widget.currentChanged.connect(self._maybe_build_tab)
 
         self._connect_global_signals()
 
+    @Slot(int)
+    def _maybe_build_tab(self, index: int):
+        entry = self._lazy_tabs.pop(index, None)
+        if not entry: return
+        attr, factory = entry
+        view = factory(backend_controller=self.backend_controller); setattr(self, attr, view)
+        placeholder = self.tab_widget.widget(index); title = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True) # removeTab() moves the current index, which must not build another tab
+        try: self.tab_widget.removeTab(index); self.tab_widget.insertTab(index, view, title); self.tab_widget.setCurrentIndex(index)
+        finally: self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        self._connect_view_signals(attr)
+        if self._initial_data_requested: self._load_view_initial_data(view)
+        self.logger.info(f"Built '{title}' tab on first show.")
+
+    def load_initial_view_data(self):
+        """Called once the backend is set up: loads already-built views; lazily built ones load when created."""
+        self._initial_data_requested = True
+        for view in (self.orders_positions_view, self.chart_view):
+            if view: self._load_view_initial_data(view)
+
+    def _load_view_initial_data(self, view: QWidget):
+        loader = getattr(view, 'load_initial_data', None) or getattr(view, 'load_initial_chart_data', None)
+        if loader: self.logger.info(f"Triggering initial data load for {type(view).__name__}."); loader()
+
     def _connect_global_signals(self):
-        try:
-            # DashboardView signals
-            signals.status_updated.connect(self.dashboard_view.update_status_display)
-            signals.api_connection_updated.connect(self.dashboard_view.update_api_connection_display)
-            signals.balance_updated.connect(self.dashboard_view.update_balance_display)
-            signals.total_pnl_updated.connect(self.dashboard_view.update_total_pnl_display)
-            signals.open_pnl_updated.connect(self.dashboard_view.update_open_pnl_display)
-            signals.market_data_updated.connect(self.dashboard_view.update_market_data_display)
-            signals.log_message_appended.connect(self.dashboard_view.append_log_message)
-
-            # OrdersAndPositionsView signals
-            if hasattr(self.orders_positions_view, 'populate_open_orders_table'):
-                 signals.open_orders_updated.connect(self.orders_positions_view.populate_open_orders_table)
-            if hasattr(self.orders_positions_view, 'populate_trade_history_table'):
-                 signals.trade_history_updated.connect(self.orders_positions_view.populate_trade_history_table)
-            if hasattr(self.orders_positions_view, 'populate_positions_table'):
-                 signals.positions_updated.connect(self.orders_positions_view.populate_positions_table)
-
-            # BacktestView signals
-            if hasattr(self.backtest_view, 'update_progress_bar'):
-                signals.backtest_progress_updated.connect(self.backtest_view.update_progress_bar)
-            if hasattr(self.backtest_view, 'append_backtest_log'):
-                signals.backtest_log_message.connect(self.backtest_view.append_backtest_log)
-            if hasattr(self.backtest_view, 'display_backtest_results'): # For summary metrics
-                signals.backtest_summary_results_ready.connect(self.backtest_view.display_backtest_results)
-            if hasattr(self.backtest_view, 'display_simulated_trades'): # For trades table
-                signals.backtest_trades_ready.connect(self.backtest_view.display_simulated_trades)
-            if hasattr(self.backtest_view, 'plot_equity_curve'): # For equity curve
-                signals.backtest_equity_curve_ready.connect(self.backtest_view.plot_equity_curve)
-
-            # ChartView signals
-            if hasattr(self.chart_view, 'handle_live_kline_data'):
-                signals.live_kline_updated.connect(self.chart_view.handle_live_kline_data)
-            # ChartView visualization signals
-            if hasattr(self.chart_view, 'handle_new_trade_marker'):
-                signals.chart_new_trade_marker.connect(self.chart_view.handle_new_trade_marker)
-            if hasattr(self.chart_view, 'handle_position_update_for_chart'):
-                signals.chart_position_update.connect(self.chart_view.handle_position_update_for_chart)
-
-            # MainWindow general feedback signals
-            signals.error_dialog_requested.connect(self.show_error_dialog)
-            signals.status_bar_message_updated.connect(self.show_status_bar_message)
-
-            self.logger.info("MainWindow connected to global backend signals for all views.")
-        except AttributeError as e:
-            self.logger.error(f"Error connecting global signals: {e}. View might be missing a slot.", exc_info=True)
-        except Exception as e:
-            self.logger.error(f"Unexpected error connecting global signals: {e}", exc_info=True)
+        """Wires the always-built views (dashboard, main window); tab views are wired by _connect_view_signals when built."""
+        self._connect_view_signals('dashboard_view'); self._connect_view_signals(None)
+        self.logger.info("MainWindow connected to global backend signals; tab views connect when built.")
+
+    def _connect_view_signals(self, attr: Optional[str]):
+        """Connects every _SIGNAL_WIRING entry for one view (None = MainWindow itself); each connection fails independently."""
+        target = self if attr is None else getattr(self, attr, None)
+        for signal_name, slot_name in _SIGNAL_WIRING.get(attr, ()):
+            sig = getattr(signals, signal_name, None); slot = getattr(target, slot_name, None)
+            if sig is None or slot is None: self.logger.debug(f"Skipping {signal_name} -> {attr}.{slot_name}: not available."); continue
+            try: sig.connect(slot)
+            except Exception as e: self.logger.error(f"Error connecting {signal_name} -> {attr}.{slot_name}: {e}", exc_info=True)
 
     def closeEvent(self, event):
         logger_to_use = MainWindow.logger
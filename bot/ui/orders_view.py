@@ -1,15 +1,62 @@
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QTableWidget,
-                             QTableWidgetItem, QPushButton, QHBoxLayout, QHeaderView,
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QTableView,
+                             QPushButton, QHBoxLayout, QHeaderView,
                              QAbstractItemView, QMessageBox)
-from PySide6.QtCore import Slot, Qt
+from PySide6.QtCore import Slot, Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QDateTime
 
 # For type hinting BotController
 BotController = Any
 
+# Example data keys from Binance: symbol, orderId, clientOrderId, side, type, price, origQty, executedQty, status, time, positionSide
+_OPEN_ORDERS_HEADERS = ["Symbol", "Order ID", "Client ID", "Side", "Type", "Price", "Quantity", "Filled Qty", "Status", "Time", "Position Side"]
+# Example data keys: symbol, id, orderId, side, price, qty, commission, commissionAsset, time, realizedPnl
+_TRADE_HISTORY_HEADERS = ["Symbol", "Trade ID", "Order ID", "Side", "Price", "Quantity", "Commission", "Comm. Asset", "Time", "Realized P&L"]
+# Example data keys: symbol, positionSide, positionAmt, entryPrice, markPrice, unRealizedProfit, liquidationPrice, isolatedMargin / margin (depends on mode)
+_POSITIONS_HEADERS = ["Symbol", "Side", "Quantity", "Entry Price", "Mark Price", "Unrealized P&L", "Liq. Price", "Margin"]
+
+class _RecordsTableModel(QAbstractTableModel):
+    """Read-only table of preformatted string rows; set_rows() diffs against the shown rows so unchanged rows aren't touched."""
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        # Map header to potential keys in data (case-insensitive, flexible); resolved once instead of per cell
+        self._key_candidates = [(h, h.lower(), h.replace(" ", "").lower()) for h in headers]
+        self._time_cols = frozenset(i for i, h in enumerate(headers) if h in ("Time", "Entry Time", "Close Time"))
+        self._rows: List[Tuple[str, ...]] = []
+
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._rows)
+    def columnCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid(): return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal: return self._headers[section]
+        return None
+
+    def _format_row(self, record: Dict[str, Any]) -> Tuple[str, ...]:
+        row = []
+        for col, keys in enumerate(self._key_candidates):
+            value = next((str(record[k]) for k in keys if k in record), "N/A")
+            if col in self._time_cols and value != "N/A":
+                try: value = QDateTime.fromMSecsSinceEpoch(int(value)).toUTC().toString("yyyy-MM-dd HH:mm:ss") # Assuming timestamp in ms
+                except ValueError: pass # Keep as string if not a valid timestamp
+            row.append(value)
+        return tuple(row)
+
+    def set_rows(self, records: List[Dict[str, Any]]) -> bool:
+        """Returns True if the model was reset (row count changed); otherwise only changed rows emit dataChanged."""
+        rows = [self._format_row(r) for r in records]
+        if len(rows) != len(self._rows): self.beginResetModel(); self._rows = rows; self.endResetModel(); return True
+        old_rows = self._rows; self._rows = rows; last_col = len(self._headers) - 1
+        for i, (old, new) in enumerate(zip(old_rows, rows)):
+            if old != new: self.dataChanged.emit(self.index(i, 0), self.index(i, last_col))
+        return False
+
 class OrdersAndPositionsView(QWidget):
     def __init__(self, backend_controller: Optional[BotController] = None, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -31,7 +78,7 @@ class OrdersAndPositionsView(QWidget):
         # --- Open Orders Tab ---
         self.open_orders_widget = QWidget()
         open_orders_layout = QVBoxLayout(self.open_orders_widget)
-        self.open_orders_table = QTableWidget()
+        self.open_orders_table = QTableView()
         open_orders_buttons_layout = QHBoxLayout()
         self.refresh_open_orders_button = QPushButton("Refresh Open Orders")
         self.cancel_selected_button = QPushButton("Cancel Selected Order")
@@ -45,7 +92,7 @@ class OrdersAndPositionsView(QWidget):
         # --- Trade History Tab ---
         self.trade_history_widget = QWidget()
         trade_history_layout = QVBoxLayout(self.trade_history_widget)
-        self.trade_history_table = QTableWidget()
+        self.trade_history_table = QTableView()
         trade_history_buttons_layout = QHBoxLayout()
         self.refresh_trade_history_button = QPushButton("Refresh Trade History")
         trade_history_buttons_layout.addWidget(self.refresh_trade_history_button)
@@ -57,7 +104,7 @@ class OrdersAndPositionsView(QWidget):
         # --- Positions Tab ---
         self.positions_widget = QWidget()
         positions_layout = QVBoxLayout(self.positions_widget)
-        self.positions_table = QTableWidget()
+        self.positions_table = QTableView()
         positions_buttons_layout = QHBoxLayout()
         self.refresh_positions_button = QPushButton("Refresh Positions")
         self.close_selected_position_button = QPushButton("Close Selected Position (Market)")
@@ -72,31 +119,18 @@ class OrdersAndPositionsView(QWidget):
         self.setLayout(self.main_layout)
 
     def _configure_tables(self):
-        # Open Orders Table
-        self.open_orders_table.setColumnCount(11)
-        self.open_orders_table.setHorizontalHeaderLabels([
-            "Symbol", "Order ID", "Client ID", "Side", "Type", "Price",
-            "Quantity", "Filled Qty", "Status", "Time", "Position Side"
-        ])
-        self._apply_common_table_settings(self.open_orders_table)
-
-        # Trade History Table
-        self.trade_history_table.setColumnCount(10)
-        self.trade_history_table.setHorizontalHeaderLabels([
-            "Symbol", "Trade ID", "Order ID", "Side", "Price", "Quantity",
-            "Commission", "Comm. Asset", "Time", "Realized P&L"
-        ])
-        self._apply_common_table_settings(self.trade_history_table)
-
-        # Positions Table
-        self.positions_table.setColumnCount(8)
-        self.positions_table.setHorizontalHeaderLabels([
-            "Symbol", "Side", "Quantity", "Entry Price", "Mark Price",
-            "Unrealized P&L", "Liq. Price", "Margin"
-        ])
-        self._apply_common_table_settings(self.positions_table)
-
-    def _apply_common_table_settings(self, table: QTableWidget):
+        self.open_orders_model = self._attach_model(self.open_orders_table, _OPEN_ORDERS_HEADERS)
+        self.trade_history_model = self._attach_model(self.trade_history_table, _TRADE_HISTORY_HEADERS)
+        self.positions_model = self._attach_model(self.positions_table, _POSITIONS_HEADERS)
+
+    def _attach_model(self, table: QTableView, headers: List[str]) -> _RecordsTableModel:
+        model = _RecordsTableModel(headers, self)
+        proxy = QSortFilterProxyModel(self); proxy.setSourceModel(model) # Sorting happens in the proxy; the model keeps backend order for diffing
+        table.setModel(proxy)
+        self._apply_common_table_settings(table)
+        return model
+
+    def _apply_common_table_settings(self, table: QTableView):
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         table.verticalHeader().setVisible(False)
@@ -117,6 +151,9 @@ class OrdersAndPositionsView(QWidget):
     def load_initial_data(self):
         """Called to load initial data for all tables when view becomes active or bot starts."""
         self.logger.info("OrdersAndPositionsView: Loading initial data.")
+        if self.backend_controller and hasattr(self.backend_controller, 'refresh_all_ui_data'):
+            asyncio.create_task(self.backend_controller.refresh_all_ui_data(trade_history_symbol="BTCUSDT", trade_history_limit=50)) # type: ignore
+            return
         self.handle_refresh_open_orders()
         self.handle_refresh_trade_history()
         self.handle_refresh_positions()
@@ -140,7 +177,7 @@ class OrdersAndPositionsView(QWidget):
     def handle_refresh_positions(self):
         if self.backend_controller and hasattr(self.backend_controller, 'request_positions_update'):
             self.logger.info("Refreshing positions...")
-            asyncio.create_task(self.backend_controller.request_positions_update()) # type: ignore
+            asyncio.create_task(self.backend_controller.request_positions_update(force=True)) # type: ignore
         else: self.logger.warning("Backend controller not available for refreshing positions.")
 
     @Slot()
@@ -150,12 +187,10 @@ class OrdersAndPositionsView(QWidget):
             QMessageBox.information(self, "Cancel Order", "Please select an order to cancel.")
             return
         # Assuming Order ID is in the second column (index 1), Symbol in first (index 0)
-        order_id_item = self.open_orders_table.item(selected_rows[0].row(), 1)
-        symbol_item = self.open_orders_table.item(selected_rows[0].row(), 0)
+        order_id_str = selected_rows[0].siblingAtColumn(1).data()
+        symbol_str = selected_rows[0].siblingAtColumn(0).data()
 
-        if order_id_item and symbol_item:
-            order_id_str = order_id_item.text()
-            symbol_str = symbol_item.text()
+        if order_id_str and symbol_str:
             self.logger.info(f"Requesting cancellation for order ID: {order_id_str} on symbol {symbol_str}")
             if self.backend_controller and hasattr(self.backend_controller, 'cancel_order_ui'):
                  asyncio.create_task(self.backend_controller.cancel_order_ui(order_id=order_id_str, symbol=symbol_str)) # type: ignore
@@ -171,12 +206,11 @@ class OrdersAndPositionsView(QWidget):
             QMessageBox.information(self, "Close Position", "Please select a position to close.")
             return
         # Assuming Symbol is in column 0, Side in column 1
-        symbol_item = self.positions_table.item(selected_rows[0].row(), 0)
-        side_item = self.positions_table.item(selected_rows[0].row(), 1) # e.g. "LONG" or "SHORT"
+        symbol_str = selected_rows[0].siblingAtColumn(0).data()
+        side_str = selected_rows[0].siblingAtColumn(1).data() # e.g. "LONG" or "SHORT"
 
-        if symbol_item and side_item:
-            symbol_str = symbol_item.text()
-            position_side_str = side_item.text().upper() # Ensure it's "LONG" or "SHORT"
+        if symbol_str and side_str:
+            position_side_str = side_str.upper() # Ensure it's "LONG" or "SHORT"
 
             self.logger.info(f"Requesting to close {position_side_str} position for symbol {symbol_str}")
             if self.backend_controller and hasattr(self.backend_controller, 'close_position_ui'):
@@ -186,54 +220,23 @@ class OrdersAndPositionsView(QWidget):
             QMessageBox.warning(self, "Close Position Error", "Could not retrieve symbol or side from selected row.")
 
 
-    def _populate_table(self, table: QTableWidget, data: List[Dict[str, Any]], headers: List[str]):
-        table.setRowCount(0) # Clear existing rows
-        table.setColumnCount(len(headers)) # Ensure column count matches headers
-        table.setHorizontalHeaderLabels(headers)
-
-        if not data:
-            # self.logger.debug(f"No data to populate {table.objectName() if table.objectName() else 'table'}.")
-            return
-
-        table.setRowCount(len(data))
-        for row_idx, row_data in enumerate(data):
-            for col_idx, header in enumerate(headers):
-                # Map header to potential keys in data (case-insensitive, flexible)
-                # This is a simple direct mapping. Real data might need more complex parsing.
-                item_value = "N/A"
-                if header in row_data: item_value = str(row_data[header])
-                elif header.lower() in row_data: item_value = str(row_data[header.lower()])
-                elif header.replace(" ", "").lower() in row_data: item_value = str(row_data[header.replace(" ", "").lower()])
-
-                # Specific formatting for certain fields
-                if header in ["Time", "Entry Time", "Close Time"] and item_value != "N/A":
-                    try: # Assuming timestamp in ms
-                        item_value = QDateTime.fromMSecsSinceEpoch(int(item_value)).toUTC().toString("yyyy-MM-dd HH:mm:ss")
-                    except ValueError: pass # Keep as string if not a valid timestamp
-
-                table.setItem(row_idx, col_idx, QTableWidgetItem(item_value))
-        table.resizeColumnsToContents()
+    def _populate_table(self, table: QTableView, model: _RecordsTableModel, data: List[Dict[str, Any]]):
+        if model.set_rows(data or []): table.resizeColumnsToContents() # Re-measure only when rows were added/removed
 
     @Slot(list)
     def populate_open_orders_table(self, orders_data: List[Dict[str, Any]]):
-        headers = ["Symbol", "Order ID", "Client ID", "Side", "Type", "Price", "Quantity", "Filled Qty", "Status", "Time", "Position Side"]
-        # Example data keys from Binance: symbol, orderId, clientOrderId, side, type, price, origQty, executedQty, status, time, positionSide
-        self._populate_table(self.open_orders_table, orders_data, headers)
+        self._populate_table(self.open_orders_table, self.open_orders_model, orders_data)
         self.logger.info(f"Open orders table populated with {len(orders_data)} orders.")
 
     @Slot(list)
     def populate_trade_history_table(self, history_data: List[Dict[str, Any]]):
-        headers = ["Symbol", "Trade ID", "Order ID", "Side", "Price", "Quantity", "Commission", "Comm. Asset", "Time", "Realized P&L"]
-        # Example data keys: symbol, id, orderId, side, price, qty, commission, commissionAsset, time, realizedPnl
-        self.logger.info(f"Trade history table received {len(history_data)} trades. Headers: {headers}")
-        self._populate_table(self.trade_history_table, history_data, headers)
+        self.logger.info(f"Trade history table received {len(history_data)} trades.")
+        self._populate_table(self.trade_history_table, self.trade_history_model, history_data)
 
 
     @Slot(list)
     def populate_positions_table(self, positions_data: List[Dict[str, Any]]):
-        headers = ["Symbol", "Side", "Quantity", "Entry Price", "Mark Price", "Unrealized P&L", "Liq. Price", "Margin"]
-        # Example data keys: symbol, positionSide, positionAmt, entryPrice, markPrice, unRealizedProfit, liquidationPrice, isolatedMargin / margin (depends on mode)
-        self._populate_table(self.positions_table, positions_data, headers)
+        self._populate_table(self.positions_table, self.positions_model, positions_data)
         self.logger.info(f"Positions table populated with {len(positions_data)} positions.")
 
 
@@ -251,7 +254,7 @@ if __name__ == '__main__':
         @Slot()
         def request_trade_history_update(self, symbol, limit): self.logger.info(f"DummyBackend: request_trade_history_update for {symbol} limit {limit} called")
         @Slot()
-        def request_positions_update(self): self.logger.info("DummyBackend: request_positions_update called")
+        def request_positions_update(self, emit_for_chart=False, force=False): self.logger.info("DummyBackend: request_positions_update called")
         @Slot(str, str)
         def cancel_order_ui(self, order_id, symbol): self.logger.info(f"DummyBackend: cancel_order_ui for {order_id} on {symbol} called")
         @Slot(str, str)
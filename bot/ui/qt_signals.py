@@ -10,7 +10,7 @@ class BackendSignals(QObject):
     balance_updated = Signal(float)
     total_pnl_updated = Signal(float)
     open_pnl_updated = Signal(float)
-    market_data_updated = Signal(str, dict)
+    market_data_updated = Signal(str, float, float) # symbol, price, 24h change %
 
     open_orders_updated = Signal(list) # List[Dict[str, Any]]
     trade_history_updated = Signal(list) # List[Dict[str, Any]]
@@ -27,7 +27,8 @@ class BackendSignals(QObject):
     backtest_equity_curve_ready = Signal(list) # For equity curve data points
 
     # ChartView live updates
-    live_kline_updated = Signal(dict)
+    live_kline_tick = Signal(dict)   # Unclosed kline (x=False): chart updates the last candle in place
+    live_kline_closed = Signal(dict) # Closed kline (x=True): chart also re-seeds indicators with a full pass
 
     # Error and status bar signals for better UI feedback
     error_dialog_requested = Signal(str, str)  # title, message
@@ -35,6 +36,7 @@ class BackendSignals(QObject):
 
     # Chart specific visualization signals
     chart_new_trade_marker = Signal(dict) # {'symbol': str, 'timestamp': float_epoch_sec, 'price': float, 'side': 'BUY'/'SELL', 'quantity': float}
+    chart_new_trade_markers_batch = Signal(list) # List of chart_new_trade_marker dicts, drained from BotController's bounded queue
     chart_position_update = Signal(dict) # {'symbol': str, 'entry_price': float, 'quantity': float, 'side': 'LONG'/'SHORT'/'FLAT', 'timestamp': float_epoch_sec}
 
     def __init__(self):
@@ -73,7 +75,8 @@ if __name__ == '__main__':
 
     signals.error_dialog_requested.connect(handle_error_dialog)
     signals.status_bar_message_updated.connect(handle_statusbar_msg)
-    signals.live_kline_updated.connect(handle_live_kline)
+    signals.live_kline_tick.connect(handle_live_kline)
+    signals.live_kline_closed.connect(handle_live_kline)
     signals.chart_new_trade_marker.connect(handle_trade_marker)
     signals.chart_position_update.connect(handle_pos_update)
 
@@ -92,7 +95,7 @@ if __name__ == '__main__':
 
     signals.error_dialog_requested.emit("Test Error", "This is a test error message.")
     signals.status_bar_message_updated.emit("Test status bar message.", 3000)
-    signals.live_kline_updated.emit({'s': 'BTCUSDT', 'c': '50000', 'i': '1m'})
+    signals.live_kline_tick.emit({'s': 'BTCUSDT', 'c': '50000', 'i': '1m'})
     signals.chart_new_trade_marker.emit({'symbol': 'BTCUSDT', 'timestamp': 1672515780.0, 'price': 25000, 'side': 'BUY', 'quantity': 0.1})
     signals.chart_position_update.emit({'symbol': 'BTCUSDT', 'entry_price': 25000, 'quantity': 0.1, 'side': 'LONG', 'timestamp': 1672515780.0})
 
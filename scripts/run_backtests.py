@@ -22,6 +22,7 @@ try:
     from bot.strategies.indicator_heuristic_strategy import IndicatorHeuristicStrategy
     from bot.core.config_loader import load_api_keys, load_log_level
     from bot.core.logger_setup import setup_logger
+    from bot.core.event_loop import install_fast_event_loop_policy
 except ImportError as e:
     logging.basicConfig(level=logging.INFO)
     logging.error(f"ImportError: {e}. Critical components not found. Ensure you are running from the project root "
@@ -145,6 +146,7 @@ async def main():
     logger.info("Backtesting script finished.")
 
 if __name__ == "__main__":
+    install_fast_event_loop_policy() # uvloop/winloop if installed; stdlib asyncio loop otherwise
     asyncio.run(main())
 
 ```
@@ -26,6 +26,7 @@ try:
     # from bot.strategies.trend_adaptation_strategy import TrendAdaptationStrategy
     from bot.core.config_loader import load_api_keys, load_log_level
     from bot.core.logger_setup import setup_logger
+    from bot.core.event_loop import install_fast_event_loop_policy
 except ImportError as e:
     # Basic logging if imports fail early
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -98,8 +99,7 @@ async def main():
     # MarketDataProvider will call these when user data events are received.
     # OrderManager needs order updates to manage its active_orders.
     # StrategyEngine needs order updates to forward to strategies.
-    market_data_provider.subscribe_to_user_data(user_data_event_callback=order_manager.handle_order_update)
-    market_data_provider.subscribe_to_user_data(user_data_event_callback=strategy_engine.handle_user_data_for_strategies)
+    market_data_provider.subscribe_to_user_data(order_manager.handle_order_update, strategy_engine.handle_user_data_for_strategies)
     logger.info("OrderManager and StrategyEngine subscribed to user data updates from MarketDataProvider.")
 
     # --- Load Strategies into Engine ---
@@ -188,6 +188,7 @@ async def main():
         logger.info("Bot shut down gracefully.")
 
 if __name__ == "__main__":
+    install_fast_event_loop_policy() # uvloop/winloop if installed; stdlib asyncio loop otherwise
     asyncio.run(main())
 
 ```
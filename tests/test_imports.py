@@ -0,0 +1,14 @@
+"""Import smoke tests: module-level Qt/pyqtgraph objects are built at import, so a bad call there breaks GUI startup."""
+import importlib
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.mark.parametrize("module_name", ["bot.ui.chart_view"])
+def test_ui_module_imports(module_name):
+    pytest.importorskip("PySide6")
+    pytest.importorskip("pyqtgraph")
+    importlib.import_module(module_name)
@@ -0,0 +1,112 @@
+"""Indicator kernels vs pandas, and ChartView's O(1) live-tick path vs a full recompute over the whole history."""
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bot.ui.indicator_kernels import sma_kernel, ema_kernel, rsi_kernel, wilder_step
+
+PERIODS = [1, 2, 14, 20]
+ATOL = 3e-9
+
+
+def _closes(n=300, seed=7):
+    return 100.0 + np.cumsum(np.random.default_rng(seed).normal(0.0, 1.0, n))
+
+
+def _pandas_rsi(s, period):
+    com = max(1, period - 1)
+    delta = s.diff().fillna(0.0) # The kernel treats the first bar as a zero move
+    avg_gain = delta.clip(lower=0.0).ewm(com=com, adjust=False).mean()
+    avg_loss = (-delta).clip(lower=0.0).ewm(com=com, adjust=False).mean()
+    rsi = 100.0 - 100.0 / (1.0 + avg_gain / (avg_loss + 1e-9))
+    rsi.iloc[:com - 1] = np.nan
+    return rsi.to_numpy(), avg_gain.to_numpy(), avg_loss.to_numpy()
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_kernels_match_pandas(period):
+    pd = pytest.importorskip("pandas")
+    x = _closes(); s = pd.Series(x)
+    np.testing.assert_allclose(sma_kernel(x, period), s.rolling(period).mean().to_numpy(), rtol=0, atol=ATOL, equal_nan=True)
+    np.testing.assert_allclose(ema_kernel(x, period), s.ewm(span=period, adjust=False, min_periods=period).mean().to_numpy(),
+                               rtol=0, atol=ATOL, equal_nan=True)
+    rsi, avg_gain, avg_loss = _pandas_rsi(s, period)
+    out, prev_gain, prev_loss = rsi_kernel(x, period)
+    np.testing.assert_allclose(out, rsi, rtol=0, atol=ATOL, equal_nan=True)
+    assert prev_gain == pytest.approx(avg_gain[-2], abs=ATOL) and prev_loss == pytest.approx(avg_loss[-2], abs=ATOL)
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_wilder_step_redoes_last_bar(period):
+    x = _closes()
+    out, prev_gain, prev_loss = rsi_kernel(x, period)
+    gain, loss = wilder_step(prev_gain, prev_loss, float(x[-1] - x[-2]), period)
+    assert 100.0 - 100.0 / (1.0 + gain / (loss + 1e-9)) == pytest.approx(out[-1], abs=ATOL)
+
+
+@pytest.fixture
+def chart_view():
+    pytest.importorskip("PySide6")
+    pytest.importorskip("pyqtgraph")
+    return importlib.import_module("bot.ui.chart_view")
+
+
+def test_candle_window_slides_without_growing(chart_view):
+    win = chart_view._CandleWindow(5, ('t', 'c'))
+    view = win.reset({'t': np.arange(3.0)})
+    assert np.isnan(view['c']).all() # Keys missing from reset start as NaN
+    buf_len = len(win._cols['t'])
+    for i in range(3, 40): # Several slides back to the front of the buffer
+        view = win.append((float(i), 2.0 * i))
+        expected = np.arange(max(0, i - 4), i + 1, dtype=float)
+        np.testing.assert_array_equal(view['t'], expected)
+        assert view['t'].flags.c_contiguous and len(win._cols['t']) == buf_len
+    np.testing.assert_array_equal(view['c'], 2.0 * expected)
+
+    view = win.reset({'t': np.arange(12.0), 'c': np.arange(12.0)}) # Longer than maxlen: kept until the next append
+    assert len(view['t']) == 12
+    view = win.append((12.0,)) # Trailing keys default to NaN
+    np.testing.assert_array_equal(view['t'], np.arange(8.0, 13.0))
+    assert np.isnan(view['c'][-1])
+
+
+def _view_stub(candles, period):
+    """Just the ChartView attributes _plot_indicators/_update_indicators_incremental touch; no QApplication needed."""
+    item = SimpleNamespace(setData=lambda **kwargs: None, setValue=lambda value: None)
+    checked = SimpleNamespace(isChecked=lambda: True); box = SimpleNamespace(value=lambda: period)
+    return SimpleNamespace(candlestick_data_for_plotting=candles, _indicator_state={}, _indicator_first_t={},
+                           sma_checkbox=checked, ema_checkbox=checked, rsi_checkbox=checked,
+                           sma_period_spinbox=box, ema_period_spinbox=box, rsi_period_spinbox=box,
+                           sma_plot_item=item, ema_plot_item=item, rsi_plot_item=item, rsi_ob_line=item, rsi_os_line=item,
+                           _set_indicator_curve=lambda *args: None)
+
+
+def _assert_window_matches(candles, closes, period):
+    n = len(candles['c'])
+    for name, full in (('sma', sma_kernel(closes, period)), ('ema', ema_kernel(closes, period)), ('rsi', rsi_kernel(closes, period)[0])):
+        np.testing.assert_allclose(candles[name], full[-n:], rtol=0, atol=ATOL, equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize("period", [2, 14, 20])
+def test_incremental_matches_full_pass(chart_view, period):
+    view_cls = chart_view.ChartView
+    hist = _closes(260); ticks = hist + np.random.default_rng(11).normal(0.0, 0.5, len(hist)) # First tick of each bar
+    t = np.arange(len(hist), dtype=float); start = 30 # > period + 1, so the incremental path accepts the window
+    win = chart_view._CandleWindow(40, ('t', 'o', 'h', 'l', 'c', 'sma', 'ema', 'rsi'))
+    candles = win.reset({'t': t[:start], 'o': hist[:start], 'h': hist[:start], 'l': hist[:start], 'c': hist[:start]})
+    stub = _view_stub(candles, period)
+    view_cls._plot_indicators(stub, candles) # Seeds _indicator_state like a chart load
+    _assert_window_matches(candles, hist[:start], period)
+
+    for i in range(start, len(hist)): # 230 appends through a 40-row window: several slides
+        prev_close = float(candles['c'][-1])
+        candles = stub.candlestick_data_for_plotting = win.append((t[i],) + (float(ticks[i]),) * 4)
+        assert view_cls._update_indicators_incremental(stub, prev_close, True)
+        _assert_window_matches(candles, np.append(hist[:i], ticks[i]), period)
+
+        prev_close = float(candles['c'][-1]); candles['c'][-1] = hist[i] # Live tick moves the open bar's close
+        assert view_cls._update_indicators_incremental(stub, prev_close, False)
+        _assert_window_matches(candles, hist[:i + 1], period)